@@ -0,0 +1,148 @@
+import sys
+import json
+import time
+import typing
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from netlify import Netlify
+from netlify.instrument import CallEvent, LatencyHistograms
+from benchmarks.stub import StubServer
+
+SITE_ID = "5f2a9c1e7b3d4a0012c4e8f1"
+DEPLOY_ID = "64b7e2f09a1c3d0008f5a2b6"
+ZONE_ID = "5e1b3c7d9f0a2b0011d4c6e8"
+
+Scenario = typing.Callable[[Netlify, bytes], typing.Any]
+
+SCENARIOS = {
+    "list_sites": lambda client, payload: client.list_sites(),
+    "list_site_deploys": lambda client, payload: client.list_site_deploys(SITE_ID),
+    "list_site_files": lambda client, payload: client.list_site_files(SITE_ID),
+    "get_dns_records": lambda client, payload: client.get_dns_records(ZONE_ID),
+    "upload_deploy_file": lambda client, payload: client.upload_deploy_file(payload, DEPLOY_ID, "assets/app.js"),
+    "upload_deploy_function": lambda client, payload: client.upload_deploy_function(payload, DEPLOY_ID, "handler"),
+} #type: dict[str, Scenario]
+
+def peak_rss_mb() -> typing.Optional[float]:
+    try:
+        import resource
+    except ImportError: # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_scenario(name: str, args: argparse.Namespace) -> typing.Dict[str, typing.Any]:
+    """ Runs one scenario against a fresh stub server in this process and returns its measurements. """
+    scenario = SCENARIOS[name]
+    payload = bytes(args.upload_bytes)
+    histograms = LatencyHistograms()
+    decoding = [0.0]
+
+    def on_event(event: CallEvent) -> None:
+        decoding[0] += event.timings.get("parse", 0.0) + event.timings.get("decode", 0.0)
+
+    with StubServer(args.size) as server:
+        decode = "models" if args.decode == "lazy" else args.decode
+        client = Netlify("bench-token", base_url=server.base_url, pool_maxsize=args.threads, lazy=args.decode == "lazy", decode=decode, observers=[histograms, on_event])
+
+        def call(_: int) -> int:
+            result = scenario(client, payload)
+            # lists and ColumnarLists hold one object per row; a bytes body or a single model is one object
+            return len(result) if isinstance(result, typing.Sized) and not isinstance(result, (bytes, str, dict)) else 1
+
+        for i in range(args.warmup):
+            call(i)
+        histograms.reset()
+        decoding[0] = 0.0
+        start = time.perf_counter()
+        if args.threads > 1:
+            with ThreadPoolExecutor(args.threads) as pool:
+                objects = sum(pool.map(call, range(args.calls)))
+        else:
+            objects = sum(call(i) for i in range(args.calls))
+        elapsed = time.perf_counter() - start
+    stats = next(iter(histograms.snapshot().values()))
+    return {
+        "scenario": name,
+        "size": args.size if name.startswith(("list_", "get_")) else args.upload_bytes,
+        "calls": args.calls,
+        "threads": args.threads,
+        "decode": args.decode,
+        "requests_per_sec": args.calls / elapsed,
+        "p50_ms": stats["p50"] * 1000,
+        "p99_ms": stats["p99"] * 1000,
+        "decode_us_per_object": decoding[0] / max(objects, 1) * 1e6,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def run_isolated(name: str, argv: typing.List[str]) -> typing.Dict[str, typing.Any]:
+    # a process per scenario keeps peak RSS attributable to that scenario alone
+    output = subprocess.run([sys.executable, "-m", "benchmarks.run", *argv, "--child", name], check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output)
+
+def regressions(results: typing.List[typing.Dict[str, typing.Any]], baseline: typing.List[typing.Dict[str, typing.Any]], tolerance: float) -> typing.List[str]:
+    """ Scenarios slower than the baseline by more than tolerance (a fraction) in throughput, p99 or decode time. """
+    previous = {(r["scenario"], r["size"], r["threads"], r["decode"]): r for r in baseline}
+    found = []
+    for result in results:
+        before = previous.get((result["scenario"], result["size"], result["threads"], result["decode"]))
+        if before is None:
+            continue
+        if result["requests_per_sec"] < before["requests_per_sec"] * (1 - tolerance):
+            found.append(f"{result['scenario']}: {result['requests_per_sec']:.0f} req/s, baseline {before['requests_per_sec']:.0f}")
+        if result["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            found.append(f"{result['scenario']}: p99 {result['p99_ms']:.2f} ms, baseline {before['p99_ms']:.2f}")
+        if result["decode_us_per_object"] > before["decode_us_per_object"] * (1 + tolerance) and before["decode_us_per_object"] > 0:
+            found.append(f"{result['scenario']}: decode {result['decode_us_per_object']:.2f} us/object, baseline {before['decode_us_per_object']:.2f}")
+    return found
+
+def report(results: typing.List[typing.Dict[str, typing.Any]]) -> str:
+    lines = ["scenario".ljust(24) + "size".rjust(10) + "req/s".rjust(10) + "p50 ms".rjust(10) + "p99 ms".rjust(10) + "us/obj".rjust(10) + "peak MB".rjust(10)]
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.1f}" if r["peak_rss_mb"] is not None else "-"
+        lines.append(r["scenario"].ljust(24) + str(r["size"]).rjust(10) + f"{r['requests_per_sec']:.0f}".rjust(10) + f"{r['p50_ms']:.2f}".rjust(10) + f"{r['p99_ms']:.2f}".rjust(10) + f"{r['decode_us_per_object']:.2f}".rjust(10) + rss.rjust(10))
+    return "\n".join(lines)
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmarks the Netlify client against an in-process stub API server.")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=f"scenarios to run (default: all): {', '.join(SCENARIOS)}")
+    parser.add_argument("--size", type=int, default=100, help="objects per list response")
+    parser.add_argument("--upload-bytes", type=int, default=1 << 20, help="body size for the upload scenarios")
+    parser.add_argument("--calls", type=int, default=300, help="timed calls per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="untimed calls before measuring")
+    parser.add_argument("--threads", type=int, default=1, help="concurrent callers sharing one client")
+    parser.add_argument("--decode", choices=["models", "lazy", "dicts", "columns"], default="models")
+    parser.add_argument("--in-process", action="store_true", help="run every scenario in this process (peak RSS is then cumulative)")
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="results of an earlier --json run to compare against; exits 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown against the baseline, as a fraction")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario {unknown[0]!r}")
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args)))
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    forwarded = [f"--size={args.size}", f"--upload-bytes={args.upload_bytes}", f"--calls={args.calls}", f"--warmup={args.warmup}", f"--threads={args.threads}", f"--decode={args.decode}"]
+    results = [run_scenario(name, args) if args.in_process else run_isolated(name, forwarded) for name in names]
+    print(report(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
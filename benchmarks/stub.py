@@ -0,0 +1,103 @@
+import json
+import enum
+import typing
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from netlify.custom_types import File, Function, Site, Deploy, DNSRecord
+
+def _value(model: typing.Any, attr: str, decode: typing.Any, nested: typing.Any, i: int, depth: int) -> typing.Any:
+    name = getattr(decode, "__name__", None) or decode.func.__name__
+    target = decode.args[0] if hasattr(decode, "args") and decode.args else None
+    if name in ("from_optional_str", "from_str"):
+        if attr in ("id", "site_id", "deploy_id", "dns_zone_id", "account_id", "build_id"):
+            return hashlib.md5(f"{model.__name__}{attr}{i}".encode()).hexdigest()[:24]
+        if attr.endswith("_at"):
+            return f"2024-0{1 + i % 9}-1{i % 10}T12:{i % 60:02d}:00.000Z"
+        if attr.endswith("url"):
+            return f"https://site-{i}.netlify.app/{attr}"
+        if attr == "sha":
+            return hashlib.sha1(str(i).encode()).hexdigest()
+        return f"{attr}-{i % 50}"
+    if name == "from_optional_int":
+        return i * 7 % 100000
+    if name == "from_optional_float":
+        return i / 3.0
+    if name == "from_optional_bool":
+        return i % 2 == 0
+    if name == "from_optional_str_list":
+        return [f"{attr}-{j}" for j in range(3)]
+    if name in ("from_optional_any_list", "from_any"):
+        return None
+    if isinstance(target, type) and issubclass(target, enum.Enum):
+        member = list(target)[i % len(target)].value
+        return [member] if name == "from_optional_list" else member
+    if nested is None or depth >= 2:
+        return None
+    if name == "from_optional_list":
+        return [fixture(nested, i * 4 + j, depth + 1) for j in range(2)]
+    return fixture(nested, i, depth + 1)
+
+def fixture(model: typing.Any, i: int, depth: int = 0) -> typing.Dict[str, typing.Any]:
+    """ A JSON object for model with every field set to a deterministic, plausibly shaped value; nested models are filled two levels deep. """
+    return {key: _value(model, attr, decode, nested, i, depth) for attr, key, decode, nested in getattr(model, "_fields")}
+
+def render(model: typing.Any, count: int) -> bytes:
+    return json.dumps([fixture(model, i) for i in range(count)]).encode("utf-8")
+
+# endpoint suffix -> model served as a list; uploads answer with one object
+LIST_ROUTES = {
+    "/sites": Site,
+    "/deploys": Deploy,
+    "/files": File,
+    "/dns_records": DNSRecord,
+} #type: dict[str, typing.Any]
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "StubServer"
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        for suffix, body in self.server.bodies.items():
+            if path.endswith(suffix):
+                return self._send(200, body)
+        self._send(404, b'{"code":404,"message":"Not Found"}')
+
+    def do_PUT(self) -> None:
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 16)))
+        model = Function if "/functions/" in self.path else File
+        self._send(200, self.server.upload_bodies[model])
+
+class StubServer(ThreadingHTTPServer):
+    """ In-process stand-in for the Netlify API on a free localhost port. List endpoints return size pre-rendered fixture objects and upload endpoints read and discard the body. Use as a context manager; base_url points at it. """
+    daemon_threads = True
+
+    def __init__(self, size: int = 100):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.bodies = {suffix: render(model, size) for suffix, model in LIST_ROUTES.items()}
+        self.upload_bodies = {model: json.dumps(fixture(model, 0)).encode("utf-8") for model in (File, Function)}
+        self.base_url = f"http://127.0.0.1:{self.server_port}/api/v1/"
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.shutdown()
+        self.server_close()
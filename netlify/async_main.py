@@ -0,0 +1,1131 @@
+from __future__ import annotations
+
+import copy
+import time
+import typing
+import asyncio
+import collections
+import httpx
+from urllib.parse import urlencode
+
+from . import custom_types
+from .cache import CacheEntry, ResponseCache
+from .codec import JSONCodec, default_codec
+from .instrument import CallEvent, Observer
+from .ratelimit import RateLimiter, should_retry
+from .routes import compile_routes
+from .singleflight import AsyncSingleFlight
+from .main import RequestError, _ClientBase, JSONType, Timeout, _check_decode, UploadBody, _BinaryBody, _page_number, _with_page
+
+if typing.TYPE_CHECKING:
+    from .custom_types import *
+
+class AsyncNetlify(_ClientBase):
+    """ asyncio counterpart of Netlify: endpoint methods are coroutines and iter_* methods async iterators, over a pooled httpx.AsyncClient. """
+    def __init__(
+        self,
+        token: typing.Optional[str] = None,
+        base_url: typing.Optional[str] = None,  # as for Netlify
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_retries: int = 3,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        timeout: Timeout = None,  # seconds, or a (connect, read) pair, for every call
+        transport_retries: int = 0,  # httpx transport retries for connection-level failures
+        lazy: bool = False,  # lazy, decode and codec as for Netlify
+        decode: str = "models",
+        codec: typing.Optional[JSONCodec] = None,
+        cache: typing.Optional[ResponseCache] = None,  # may be shared with sync clients
+        coalesce: bool = False,  # concurrent identical GETs from tasks on the same event loop share one request
+        observers: typing.Optional[typing.Iterable[Observer]] = None,  # as for Netlify
+    ):
+        url = base_url or "https://api.netlify.com/api/v1"
+        self.base_url = url
+        self.routes = compile_routes(url)
+        self.lazy = lazy
+        self.decode = _check_decode(decode)
+        self.codec = codec or default_codec()
+        # the Content-Type of JSON request bodies, built once instead of per call
+        self._json_headers = {"Content-Type": self.codec.content_type}
+        self.cache = cache
+        self.observers = list(observers or ())
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self._background = set() #type: set[asyncio.Future]
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        if isinstance(timeout, tuple):
+            timeouts = httpx.Timeout(timeout[1], connect=timeout[0])
+        else:
+            timeouts = httpx.Timeout(timeout)
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=transport_retries)
+        self.session = httpx.AsyncClient(transport=transport, timeout=timeouts)
+        if token:
+            self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+    async def __aenter__(self) -> "AsyncNetlify":
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        await self.session.aclose()
+
+    async def _request(self, method: str, url: str, event: typing.Optional[CallEvent] = None, **kwargs: typing.Any) -> httpx.Response:
+        body = kwargs.get("content")
+        json_data = kwargs.pop("json", None)
+        if json_data is not None:
+            body = kwargs["content"] = self.codec.dumps(json_data)
+            headers = kwargs.get("headers")
+            kwargs["headers"] = {**headers, **self._json_headers} if headers else self._json_headers
+        attempt = 0
+        while True:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if isinstance(body, _BinaryBody):
+                kwargs["content"] = body.aiter_chunks()
+            # sent as a stream and read here, which is what session.request does, so the header and body phases can be timed apart
+            start = time.perf_counter()
+            raw_response = await self.session.send(self.session.build_request(method, url, **kwargs), stream=True)
+            headers_at = time.perf_counter()
+            try:
+                await raw_response.aread()
+            finally:
+                await raw_response.aclose()
+            if event is not None:
+                event.add("wait", delay)
+                event.add("server", headers_at - start)
+                event.add("download", time.perf_counter() - headers_at)
+            self.rate_limiter.update(raw_response.status_code, raw_response.headers)
+            if attempt >= self.max_retries or not should_retry(method, raw_response.status_code) or (isinstance(body, _BinaryBody) and not body.rewind()):
+                if event is not None:
+                    event.status = raw_response.status_code
+                    event.retries = attempt
+                    event.bytes_in = len(raw_response.content)
+                    event.bytes_out = len(body) if body is not None else 0
+                return raw_response
+            retry_delay = self.rate_limiter.retry_delay(raw_response.headers, attempt)
+            if event is not None:
+                event.add("wait", retry_delay)
+            await asyncio.sleep(retry_delay)
+            attempt += 1
+
+    async def _call(self, operation: str, method: str, url: str, target_class: typing.Any = None, many: bool = False, path_args: typing.Tuple[typing.Any, ...] = (), **kwargs: typing.Any) -> typing.Any:
+        if not self.observers:
+            return await self._dispatch(operation, method, url, target_class, many, None, path_args, **kwargs)
+        event = CallEvent(operation, method)
+        start = time.perf_counter()
+        try:
+            result = await self._dispatch(operation, method, url, target_class, many, event, path_args, **kwargs)
+        except BaseException as e:
+            self._observe(event, start, e)
+            raise
+        self._observe(event, start)
+        return result
+
+    async def _dispatch(self, operation: str, method: str, url: str, target_class: typing.Any, many: bool, event: typing.Optional[CallEvent], path_args: typing.Tuple[typing.Any, ...], **kwargs: typing.Any) -> typing.Any:
+        if self.single_flight is None or method != "GET":
+            return await self._perform(operation, method, url, target_class, many, event, path_args, **kwargs)
+        params = kwargs.get("params")
+        key = (url, urlencode(sorted(params.items()), doseq=True) if params else "", self.session.headers.get("Authorization"), self.decode, self.lazy, target_class, many)
+        leader = [] #type: list[bool]
+
+        async def perform() -> typing.Any:
+            leader.append(True)
+            return await self._perform(operation, method, url, target_class, many, event, path_args, **kwargs)
+
+        result = await self.single_flight.do(key, perform)
+        if event is not None and not leader:
+            event.coalesced = True
+        return result
+
+    async def _perform(self, operation: str, method: str, url: str, target_class: typing.Any, many: bool, event: typing.Optional[CallEvent], path_args: typing.Tuple[typing.Any, ...], **kwargs: typing.Any) -> typing.Any:
+        cache = self.cache
+        if cache is None or (method == "GET" and not cache.enabled_for(operation)):
+            return self._decode(await self._request(method, url, event=event, **kwargs), target_class, many, event)
+        # invalidation rules and stored entries name path arguments too, which are not part of the query
+        arguments = self.routes[operation].arguments(path_args, kwargs.get("params"))
+        if method != "GET":
+            try:
+                raw_response = await self._request(method, url, event=event, **kwargs)
+                result = self._decode(raw_response, target_class, many, event)
+            except BaseException:
+                cache.invalidate(operation, arguments)
+                raise
+            cache.write_through(operation, arguments, raw_response.content, raw_response.headers, (self.decode, self.lazy, target_class, many), result, self.session.headers.get("Authorization"))
+            return result
+        key = cache.key(url, kwargs.get("params"), self.session.headers.get("Authorization"))
+        entry, fresh = cache.lookup(key)
+        if event is not None:
+            event.cache = "hit"
+        if not fresh:
+            if entry is not None and cache.serves_stale(entry):
+                if event is not None:
+                    event.cache = "stale"
+                if cache.claim_revalidation(entry):
+                    task = asyncio.ensure_future(self._revalidate_in_background(cache, key, operation, entry, url, arguments, kwargs))
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+            else:
+                entry, raw_response = await self._revalidate(cache, key, operation, entry, url, arguments, kwargs, event)
+                if entry is None:
+                    return self._decode(raw_response, target_class, many, event)
+        # lookup only reports fresh for an entry it found
+        assert entry is not None
+        return entry.result((self.decode, self.lazy, target_class, many), lambda content: self._decode_content(content, target_class, many, event))
+
+    async def _revalidate(self, cache: ResponseCache, key: str, operation: str, entry: typing.Optional[CacheEntry], url: str, arguments: typing.Dict[str, typing.Any], kwargs: typing.Dict[str, typing.Any], event: typing.Optional[CallEvent] = None) -> typing.Tuple[typing.Optional[CacheEntry], typing.Any]:
+        headers = entry.validators() if entry is not None else {}
+        raw_response = await self._request("GET", url, headers=headers, event=event, **kwargs)
+        revalidated = entry is not None and raw_response.status_code == 304
+        if event is not None:
+            event.cache = "revalidated" if revalidated else "miss"
+        if entry is not None and revalidated:
+            cache.refresh(key, entry, raw_response.headers)
+            return entry, raw_response
+        entry = cache.store(key, operation, arguments, raw_response.content, raw_response.headers) if raw_response.status_code == 200 else None
+        if entry is None:
+            cache.discard(key)
+        return entry, raw_response
+
+    async def _revalidate_in_background(self, cache: ResponseCache, key: str, operation: str, entry: CacheEntry, url: str, arguments: typing.Dict[str, typing.Any], kwargs: typing.Dict[str, typing.Any]) -> None:
+        try:
+            await self._revalidate(cache, key, operation, entry, url, arguments, kwargs)
+        except Exception:
+            # the stale entry stays in place and the next read that finds it tries again
+            pass
+        finally:
+            cache.release(entry)
+
+    async def _fetch_page(self, operation: str, url: str, params: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Tuple[typing.Any, httpx.Response]:
+        # each page is a call of the list operation the iterator walks, as far as observers are concerned
+        if not self.observers:
+            return await self._load_page(url, params)
+        event = CallEvent(operation, "GET")
+        start = time.perf_counter()
+        try:
+            page = await self._load_page(url, params, event)
+        except BaseException as e:
+            self._observe(event, start, e)
+            raise
+        self._observe(event, start)
+        return page
+
+    async def _load_page(self, url: str, params: typing.Optional[typing.Dict[str, typing.Any]], event: typing.Optional[CallEvent] = None) -> typing.Tuple[typing.Any, httpx.Response]:
+        raw_response = await self._request("GET", url, event=event, params=params)
+        if not raw_response.is_success:
+            self._raise_exception(raw_response)
+        if self.decode == "bytes":
+            return [raw_response.content], raw_response
+        start = time.perf_counter()
+        items = self.codec.loads(raw_response.content)
+        if event is not None:
+            event.add("parse", time.perf_counter() - start)
+        return items, raw_response
+
+    async def _paginate(self, operation: str, url: str, params: typing.Dict[str, typing.Any], target_class: typing.Any, prefetch: int = 0) -> typing.AsyncIterator[typing.Any]:
+        response, raw_response = await self._fetch_page(operation, url, params)
+        last = raw_response.links.get("last", {}).get("url")
+        if prefetch > 0 and last:
+            async for el in self._paginate_prefetch(operation, response, str(raw_response.url), last, target_class, prefetch):
+                yield el
+            return
+        while True:
+            for el in self._page_results(response, target_class):
+                yield el
+            # the next link already carries the full query string
+            next_url = raw_response.links.get("next", {}).get("url")
+            if not response or not next_url:
+                return
+            response, raw_response = await self._fetch_page(operation, next_url)
+
+    async def _paginate_prefetch(self, operation: str, first_page: typing.Any, first_url: str, last_url: str, target_class: typing.Any, prefetch: int) -> typing.AsyncIterator[typing.Any]:
+        current = _page_number(first_url) or 1
+        last = _page_number(last_url) or current
+        pending = collections.deque() #type: collections.deque[asyncio.Task]
+        try:
+            page = current + 1
+            while page <= last and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(self._fetch_page(operation, _with_page(last_url, page))))
+                page += 1
+            response = first_page
+            while True:
+                for el in self._page_results(response, target_class):
+                    yield el
+                if not pending:
+                    return
+                response, _ = await pending.popleft()
+                if page <= last:
+                    pending.append(asyncio.ensure_future(self._fetch_page(operation, _with_page(last_url, page))))
+                    page += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _decode(self, raw_response: typing.Any, target_class: typing.Any = None, many: bool = False, event: typing.Optional[CallEvent] = None) -> typing.Any:
+        if not raw_response.is_success:
+            self._raise_exception(raw_response)
+        return self._decode_content(raw_response.content, target_class, many, event)
+
+    def _raise_exception(self, response: httpx.Response) -> typing.Any:
+        raise RequestError(response.status_code, response.request.method, str(response.url), response.text)
+
+    def with_decode(self, decode: str) -> "AsyncNetlify":
+        """ A client sharing this one's connections that decodes responses as decode. """
+        client = copy.copy(self)
+        client.decode = _check_decode(decode)
+        return client
+
+    def with_token(self, token: str) -> None:
+        """ Changes the token of the shared session; call it before the instance is shared. """
+        self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+    async def cancel_account(self, account_id: str) -> typing.Any:
+        """  """
+        url = self.routes["cancel_account"].url(account_id)
+        return await self._call("cancel_account", "DELETE", url, path_args=(account_id,))
+
+    async def delete_env_var(self, account_id: str, key: str, site_id: typing.Optional[str] = None) -> typing.Any:
+        """ Deletes an environment variable. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["delete_env_var"].url(account_id, key)
+        params = {} #type: dict[str, typing.Any]
+        if site_id is not None:
+            params["site_id"] = site_id
+        return await self._call("delete_env_var", "DELETE", url, path_args=(account_id, key), params=params)
+
+    async def delete_env_var_value(self, account_id: str, key: str, id: str, site_id: typing.Optional[str] = None) -> typing.Any:
+        """ Deletes a specific environment variable value. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["delete_env_var_value"].url(account_id, key, id)
+        params = {} #type: dict[str, typing.Any]
+        if site_id is not None:
+            params["site_id"] = site_id
+        return await self._call("delete_env_var_value", "DELETE", url, path_args=(account_id, key, id), params=params)
+
+    async def delete_deploy_key(self, key_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_deploy_key"].url(key_id)
+        return await self._call("delete_deploy_key", "DELETE", url, path_args=(key_id,))
+
+    async def delete_deploy(self, deploy_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_deploy"].url(deploy_id)
+        return await self._call("delete_deploy", "DELETE", url, path_args=(deploy_id,))
+
+    async def delete_dns_zone(self, zone_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_dns_zone"].url(zone_id)
+        return await self._call("delete_dns_zone", "DELETE", url, path_args=(zone_id,))
+
+    async def delete_dns_record(self, zone_id: str, dns_record_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_dns_record"].url(zone_id, dns_record_id)
+        return await self._call("delete_dns_record", "DELETE", url, path_args=(zone_id, dns_record_id))
+
+    async def delete_hook(self, hook_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_hook"].url(hook_id)
+        return await self._call("delete_hook", "DELETE", url, path_args=(hook_id,))
+
+    async def delete_site(self, site_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_site"].url(site_id)
+        return await self._call("delete_site", "DELETE", url, path_args=(site_id,))
+
+    async def delete_site_asset(self, site_id: str, asset_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_site_asset"].url(site_id, asset_id)
+        return await self._call("delete_site_asset", "DELETE", url, path_args=(site_id, asset_id))
+
+    async def delete_site_build_hook(self, site_id: str, id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_site_build_hook"].url(site_id, id)
+        return await self._call("delete_site_build_hook", "DELETE", url, path_args=(site_id, id))
+
+    async def delete_site_deploy(self, site_id: str, deploy_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_site_deploy"].url(site_id, deploy_id)
+        return await self._call("delete_site_deploy", "DELETE", url, path_args=(site_id, deploy_id))
+
+    async def delete_site_form(self, site_id: str, form_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_site_form"].url(site_id, form_id)
+        return await self._call("delete_site_form", "DELETE", url, path_args=(site_id, form_id))
+
+    async def delete_service_instance(self, site_id: str, addon: str, instance_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_service_instance"].url(site_id, addon, instance_id)
+        return await self._call("delete_service_instance", "DELETE", url, path_args=(site_id, addon, instance_id))
+
+    async def delete_site_snippet(self, site_id: str, snippet_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_site_snippet"].url(site_id, snippet_id)
+        return await self._call("delete_site_snippet", "DELETE", url, path_args=(site_id, snippet_id))
+
+    async def delete_submission(self, submission_id: str) -> typing.Any:
+        """  """
+        url = self.routes["delete_submission"].url(submission_id)
+        return await self._call("delete_submission", "DELETE", url, path_args=(submission_id,))
+
+    async def remove_account_member(self, account_slug: str, member_id: str) -> typing.Any:
+        """  """
+        url = self.routes["remove_account_member"].url(account_slug, member_id)
+        return await self._call("remove_account_member", "DELETE", url, path_args=(account_slug, member_id))
+
+    async def list_accounts_for_user(self) -> typing.List[AccountMembership]:
+        """  """
+        url = self.routes["list_accounts_for_user"].url()
+        return await self._call("list_accounts_for_user", "GET", url, custom_types.AccountMembership, many=True)
+
+    async def list_account_types_for_user(self) -> typing.List[AccountType]:
+        """  """
+        url = self.routes["list_account_types_for_user"].url()
+        return await self._call("list_account_types_for_user", "GET", url, custom_types.AccountType, many=True)
+
+    async def get_account(self, account_id: str) -> typing.List[AccountMembership]:
+        """  """
+        url = self.routes["get_account"].url(account_id)
+        return await self._call("get_account", "GET", url, custom_types.AccountMembership, many=True, path_args=(account_id,))
+
+    async def list_account_audit_events(self, account_id: str, log_type: typing.Optional[str] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None, query: typing.Optional[str] = None) -> typing.List[AuditLog]:
+        """  """
+        url = self.routes["list_account_audit_events"].url(account_id)
+        params = {} #type: dict[str, typing.Any]
+        if log_type is not None:
+            params["log_type"] = log_type
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        if query is not None:
+            params["query"] = query
+        return await self._call("list_account_audit_events", "GET", url, custom_types.AuditLog, many=True, path_args=(account_id,), params=params)
+
+    def iter_account_audit_events(self, account_id: str, log_type: typing.Optional[str] = None, per_page: typing.Optional[int] = None, query: typing.Optional[str] = None, prefetch: int = 0) -> typing.AsyncIterator[AuditLog]:
+        """ Yields every result of list_account_audit_events one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_account_audit_events"].url(account_id)
+        params = {} #type: dict[str, typing.Any]
+        if log_type is not None:
+            params["log_type"] = log_type
+        if per_page is not None:
+            params["per_page"] = per_page
+        if query is not None:
+            params["query"] = query
+        return self._paginate("list_account_audit_events", url, params, custom_types.AuditLog, prefetch)
+
+    async def get_env_vars(self, account_id: str, context_name: typing.Optional[str] = None, scope: typing.Optional[str] = None, site_id: typing.Optional[str] = None) -> typing.List[EnvVar]:
+        """ Returns all environment variables for an account or site. An account corresponds to a team in the Netlify UI. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["get_env_vars"].url(account_id)
+        params = {} #type: dict[str, typing.Any]
+        if context_name is not None:
+            params["context_name"] = context_name
+        if scope is not None:
+            params["scope"] = scope
+        if site_id is not None:
+            params["site_id"] = site_id
+        return await self._call("get_env_vars", "GET", url, custom_types.EnvVar, many=True, path_args=(account_id,), params=params)
+
+    async def get_env_var(self, account_id: str, key: str, site_id: typing.Optional[str] = None) -> EnvVar:
+        """ Returns an individual environment variable. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["get_env_var"].url(account_id, key)
+        params = {} #type: dict[str, typing.Any]
+        if site_id is not None:
+            params["site_id"] = site_id
+        return await self._call("get_env_var", "GET", url, custom_types.EnvVar, path_args=(account_id, key), params=params)
+
+    async def list_payment_methods_for_user(self) -> typing.List[PaymentMethod]:
+        """  """
+        url = self.routes["list_payment_methods_for_user"].url()
+        return await self._call("list_payment_methods_for_user", "GET", url, custom_types.PaymentMethod, many=True)
+
+    async def get_site_build(self, build_id: str) -> Build:
+        """  """
+        url = self.routes["get_site_build"].url(build_id)
+        return await self._call("get_site_build", "GET", url, custom_types.Build, path_args=(build_id,))
+
+    async def list_deploy_keys(self) -> typing.List[DeployKey]:
+        """  """
+        url = self.routes["list_deploy_keys"].url()
+        return await self._call("list_deploy_keys", "GET", url, custom_types.DeployKey, many=True)
+
+    async def get_deploy_key(self, key_id: str) -> DeployKey:
+        """  """
+        url = self.routes["get_deploy_key"].url(key_id)
+        return await self._call("get_deploy_key", "GET", url, custom_types.DeployKey, path_args=(key_id,))
+
+    async def get_deploy(self, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["get_deploy"].url(deploy_id)
+        return await self._call("get_deploy", "GET", url, custom_types.Deploy, path_args=(deploy_id,))
+
+    async def get_dns_zones(self, account_slug: typing.Optional[str] = None) -> typing.List[DNSZone]:
+        """  """
+        url = self.routes["get_dns_zones"].url()
+        params = {} #type: dict[str, typing.Any]
+        if account_slug is not None:
+            params["account_slug"] = account_slug
+        return await self._call("get_dns_zones", "GET", url, custom_types.DNSZone, many=True, params=params)
+
+    async def get_dns_zone(self, zone_id: str) -> DNSZone:
+        """  """
+        url = self.routes["get_dns_zone"].url(zone_id)
+        return await self._call("get_dns_zone", "GET", url, custom_types.DNSZone, path_args=(zone_id,))
+
+    async def get_dns_records(self, zone_id: str) -> typing.List[DNSRecord]:
+        """  """
+        url = self.routes["get_dns_records"].url(zone_id)
+        return await self._call("get_dns_records", "GET", url, custom_types.DNSRecord, many=True, path_args=(zone_id,))
+
+    async def get_individual_dns_record(self, zone_id: str, dns_record_id: str) -> DNSRecord:
+        """  """
+        url = self.routes["get_individual_dns_record"].url(zone_id, dns_record_id)
+        return await self._call("get_individual_dns_record", "GET", url, custom_types.DNSRecord, path_args=(zone_id, dns_record_id))
+
+    async def list_form_submissions(self, form_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Submission]:
+        """  """
+        url = self.routes["list_form_submissions"].url(form_id)
+        params = {} #type: dict[str, typing.Any]
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        return await self._call("list_form_submissions", "GET", url, custom_types.Submission, many=True, path_args=(form_id,), params=params)
+
+    def iter_form_submissions(self, form_id: str, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.AsyncIterator[Submission]:
+        """ Yields every result of list_form_submissions one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_form_submissions"].url(form_id)
+        params = {} #type: dict[str, typing.Any]
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_form_submissions", url, params, custom_types.Submission, prefetch)
+
+    async def list_hooks_by_site_id(self, site_id: str) -> typing.List[Hook]:
+        """  """
+        url = self.routes["list_hooks_by_site_id"].url()
+        params = {} #type: dict[str, typing.Any]
+        params["site_id"] = site_id
+        return await self._call("list_hooks_by_site_id", "GET", url, custom_types.Hook, many=True, params=params)
+
+    async def list_hook_types(self) -> typing.List[HookType]:
+        """  """
+        url = self.routes["list_hook_types"].url()
+        return await self._call("list_hook_types", "GET", url, custom_types.HookType, many=True)
+
+    async def get_hook(self, hook_id: str) -> Hook:
+        """  """
+        url = self.routes["get_hook"].url(hook_id)
+        return await self._call("get_hook", "GET", url, custom_types.Hook, path_args=(hook_id,))
+
+    async def show_ticket(self, ticket_id: str) -> Ticket:
+        """  """
+        url = self.routes["show_ticket"].url(ticket_id)
+        return await self._call("show_ticket", "GET", url, custom_types.Ticket, path_args=(ticket_id,))
+
+    async def get_services(self, search: typing.Optional[str] = None) -> typing.List[Service]:
+        """  """
+        url = self.routes["get_services"].url()
+        params = {} #type: dict[str, typing.Any]
+        if search is not None:
+            params["search"] = search
+        return await self._call("get_services", "GET", url, custom_types.Service, many=True, params=params)
+
+    async def show_service(self, addon_name: str) -> Service:
+        """  """
+        url = self.routes["show_service"].url(addon_name)
+        return await self._call("show_service", "GET", url, custom_types.Service, path_args=(addon_name,))
+
+    async def show_service_manifest(self, addon_name: str) -> typing.Any:
+        """  """
+        url = self.routes["show_service_manifest"].url(addon_name)
+        return await self._call("show_service_manifest", "GET", url, path_args=(addon_name,))
+
+    async def list_sites(self, filter: typing.Optional[str] = None, name: typing.Optional[str] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Site]:
+        """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables. """
+        url = self.routes["list_sites"].url()
+        params = {} #type: dict[str, typing.Any]
+        if filter is not None:
+            params["filter"] = filter
+        if name is not None:
+            params["name"] = name
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        return await self._call("list_sites", "GET", url, custom_types.Site, many=True, params=params)
+
+    def iter_sites(self, filter: typing.Optional[str] = None, name: typing.Optional[str] = None, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.AsyncIterator[Site]:
+        """ Yields every result of list_sites one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_sites"].url()
+        params = {} #type: dict[str, typing.Any]
+        if filter is not None:
+            params["filter"] = filter
+        if name is not None:
+            params["name"] = name
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_sites", url, params, custom_types.Site, prefetch)
+
+    async def get_site(self, site_id: str) -> Site:
+        """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables. """
+        url = self.routes["get_site"].url(site_id)
+        return await self._call("get_site", "GET", url, custom_types.Site, path_args=(site_id,))
+
+    async def list_site_assets(self, site_id: str) -> typing.List[Asset]:
+        """  """
+        url = self.routes["list_site_assets"].url(site_id)
+        return await self._call("list_site_assets", "GET", url, custom_types.Asset, many=True, path_args=(site_id,))
+
+    async def get_site_asset_info(self, site_id: str, asset_id: str) -> Asset:
+        """  """
+        url = self.routes["get_site_asset_info"].url(site_id, asset_id)
+        return await self._call("get_site_asset_info", "GET", url, custom_types.Asset, path_args=(site_id, asset_id))
+
+    async def get_site_asset_public_signature(self, site_id: str, asset_id: str) -> AssetPublicSignature:
+        """  """
+        url = self.routes["get_site_asset_public_signature"].url(site_id, asset_id)
+        return await self._call("get_site_asset_public_signature", "GET", url, custom_types.AssetPublicSignature, path_args=(site_id, asset_id))
+
+    async def list_site_build_hooks(self, site_id: str) -> typing.List[BuildHook]:
+        """  """
+        url = self.routes["list_site_build_hooks"].url(site_id)
+        return await self._call("list_site_build_hooks", "GET", url, custom_types.BuildHook, many=True, path_args=(site_id,))
+
+    async def get_site_build_hook(self, site_id: str, id: str) -> BuildHook:
+        """  """
+        url = self.routes["get_site_build_hook"].url(site_id, id)
+        return await self._call("get_site_build_hook", "GET", url, custom_types.BuildHook, path_args=(site_id, id))
+
+    async def list_site_builds(self, site_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Build]:
+        """  """
+        url = self.routes["list_site_builds"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        return await self._call("list_site_builds", "GET", url, custom_types.Build, many=True, path_args=(site_id,), params=params)
+
+    def iter_site_builds(self, site_id: str, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.AsyncIterator[Build]:
+        """ Yields every result of list_site_builds one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_site_builds"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_site_builds", url, params, custom_types.Build, prefetch)
+
+    async def list_site_deployed_branches(self, site_id: str) -> typing.List[DeployedBranch]:
+        """  """
+        url = self.routes["list_site_deployed_branches"].url(site_id)
+        return await self._call("list_site_deployed_branches", "GET", url, custom_types.DeployedBranch, many=True, path_args=(site_id,))
+
+    async def list_site_deploys(self, site_id: str, branch: typing.Optional[str] = None, deploy_previews: typing.Optional[bool] = None, latest_published: typing.Optional[bool] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None, production: typing.Optional[bool] = None, state: typing.Optional[str] = None) -> typing.List[Deploy]:
+        """  """
+        url = self.routes["list_site_deploys"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if branch is not None:
+            params["branch"] = branch
+        if deploy_previews is not None:
+            params["deploy_previews"] = deploy_previews
+        if latest_published is not None:
+            params["latest_published"] = latest_published
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        if production is not None:
+            params["production"] = production
+        if state is not None:
+            params["state"] = state
+        return await self._call("list_site_deploys", "GET", url, custom_types.Deploy, many=True, path_args=(site_id,), params=params)
+
+    def iter_site_deploys(self, site_id: str, branch: typing.Optional[str] = None, deploy_previews: typing.Optional[bool] = None, latest_published: typing.Optional[bool] = None, per_page: typing.Optional[int] = None, production: typing.Optional[bool] = None, state: typing.Optional[str] = None, prefetch: int = 0) -> typing.AsyncIterator[Deploy]:
+        """ Yields every result of list_site_deploys one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_site_deploys"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if branch is not None:
+            params["branch"] = branch
+        if deploy_previews is not None:
+            params["deploy_previews"] = deploy_previews
+        if latest_published is not None:
+            params["latest_published"] = latest_published
+        if per_page is not None:
+            params["per_page"] = per_page
+        if production is not None:
+            params["production"] = production
+        if state is not None:
+            params["state"] = state
+        return self._paginate("list_site_deploys", url, params, custom_types.Deploy, prefetch)
+
+    async def get_site_deploy(self, site_id: str, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["get_site_deploy"].url(site_id, deploy_id)
+        return await self._call("get_site_deploy", "GET", url, custom_types.Deploy, path_args=(site_id, deploy_id))
+
+    async def get_dns_for_site(self, site_id: str) -> typing.List[DNSZone]:
+        """  """
+        url = self.routes["get_dns_for_site"].url(site_id)
+        return await self._call("get_dns_for_site", "GET", url, custom_types.DNSZone, many=True, path_args=(site_id,))
+
+    async def list_site_files(self, site_id: str) -> typing.List[File]:
+        """  """
+        url = self.routes["list_site_files"].url(site_id)
+        return await self._call("list_site_files", "GET", url, custom_types.File, many=True, path_args=(site_id,))
+
+    async def get_site_file_by_path_name(self, site_id: str, file_path: str) -> File:
+        """  """
+        url = self.routes["get_site_file_by_path_name"].url(site_id, file_path)
+        return await self._call("get_site_file_by_path_name", "GET", url, custom_types.File, path_args=(site_id, file_path))
+
+    async def list_site_forms(self, site_id: str) -> typing.List[Form]:
+        """  """
+        url = self.routes["list_site_forms"].url(site_id)
+        return await self._call("list_site_forms", "GET", url, custom_types.Form, many=True, path_args=(site_id,))
+
+    async def get_site_metadata(self, site_id: str) -> typing.Any:
+        """  """
+        url = self.routes["get_site_metadata"].url(site_id)
+        return await self._call("get_site_metadata", "GET", url, path_args=(site_id,))
+
+    async def list_service_instances_for_site(self, site_id: str) -> typing.List[ServiceInstance]:
+        """  """
+        url = self.routes["list_service_instances_for_site"].url(site_id)
+        return await self._call("list_service_instances_for_site", "GET", url, custom_types.ServiceInstance, many=True, path_args=(site_id,))
+
+    async def show_service_instance(self, site_id: str, addon: str, instance_id: str) -> ServiceInstance:
+        """  """
+        url = self.routes["show_service_instance"].url(site_id, addon, instance_id)
+        return await self._call("show_service_instance", "GET", url, custom_types.ServiceInstance, path_args=(site_id, addon, instance_id))
+
+    async def list_site_snippets(self, site_id: str) -> typing.List[Snippet]:
+        """  """
+        url = self.routes["list_site_snippets"].url(site_id)
+        return await self._call("list_site_snippets", "GET", url, custom_types.Snippet, many=True, path_args=(site_id,))
+
+    async def get_site_snippet(self, site_id: str, snippet_id: str) -> Snippet:
+        """  """
+        url = self.routes["get_site_snippet"].url(site_id, snippet_id)
+        return await self._call("get_site_snippet", "GET", url, custom_types.Snippet, path_args=(site_id, snippet_id))
+
+    async def show_site_tls_certificate(self, site_id: str) -> SniCertificate:
+        """  """
+        url = self.routes["show_site_tls_certificate"].url(site_id)
+        return await self._call("show_site_tls_certificate", "GET", url, custom_types.SniCertificate, path_args=(site_id,))
+
+    async def list_site_submissions(self, site_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Submission]:
+        """  """
+        url = self.routes["list_site_submissions"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        return await self._call("list_site_submissions", "GET", url, custom_types.Submission, many=True, path_args=(site_id,), params=params)
+
+    def iter_site_submissions(self, site_id: str, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.AsyncIterator[Submission]:
+        """ Yields every result of list_site_submissions one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_site_submissions"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_site_submissions", url, params, custom_types.Submission, prefetch)
+
+    async def get_split_tests(self, site_id: str) -> typing.List[SplitTest]:
+        """  """
+        url = self.routes["get_split_tests"].url(site_id)
+        return await self._call("get_split_tests", "GET", url, custom_types.SplitTest, many=True, path_args=(site_id,))
+
+    async def get_split_test(self, site_id: str, split_test_id: str) -> SplitTest:
+        """  """
+        url = self.routes["get_split_test"].url(site_id, split_test_id)
+        return await self._call("get_split_test", "GET", url, custom_types.SplitTest, path_args=(site_id, split_test_id))
+
+    async def list_form_submission(self, submission_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None, query: typing.Optional[str] = None) -> typing.List[Submission]:
+        """  """
+        url = self.routes["list_form_submission"].url(submission_id)
+        params = {} #type: dict[str, typing.Any]
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        if query is not None:
+            params["query"] = query
+        return await self._call("list_form_submission", "GET", url, custom_types.Submission, many=True, path_args=(submission_id,), params=params)
+
+    async def get_current_user(self) -> typing.List[User]:
+        """  """
+        url = self.routes["get_current_user"].url()
+        return await self._call("get_current_user", "GET", url, custom_types.User, many=True)
+
+    async def get_account_build_status(self, account_id: str) -> typing.List[BuildStatus]:
+        """  """
+        url = self.routes["get_account_build_status"].url(account_id)
+        return await self._call("get_account_build_status", "GET", url, custom_types.BuildStatus, many=True, path_args=(account_id,))
+
+    async def list_members_for_account(self, account_slug: str) -> typing.List[Member]:
+        """  """
+        url = self.routes["list_members_for_account"].url(account_slug)
+        return await self._call("list_members_for_account", "GET", url, custom_types.Member, many=True, path_args=(account_slug,))
+
+    async def get_account_member(self, account_slug: str, member_id: str) -> Member:
+        """  """
+        url = self.routes["get_account_member"].url(account_slug, member_id)
+        return await self._call("get_account_member", "GET", url, custom_types.Member, path_args=(account_slug, member_id))
+
+    async def list_sites_for_account(self, account_slug: str, name: typing.Optional[str] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Site]:
+        """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables. """
+        url = self.routes["list_sites_for_account"].url(account_slug)
+        params = {} #type: dict[str, typing.Any]
+        if name is not None:
+            params["name"] = name
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        return await self._call("list_sites_for_account", "GET", url, custom_types.Site, many=True, path_args=(account_slug,), params=params)
+
+    def iter_sites_for_account(self, account_slug: str, name: typing.Optional[str] = None, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.AsyncIterator[Site]:
+        """ Yields every result of list_sites_for_account one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_sites_for_account"].url(account_slug)
+        params = {} #type: dict[str, typing.Any]
+        if name is not None:
+            params["name"] = name
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_sites_for_account", url, params, custom_types.Site, prefetch)
+
+    async def set_env_var_value(self, request_body: PatchAccountsAccountIDEnvKeyBody, account_id: str, key: str, site_id: typing.Optional[str] = None) -> EnvVar:
+        """ Updates or creates a new value for an existing environment variable. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["set_env_var_value"].url(account_id, key)
+        params = {} #type: dict[str, typing.Any]
+        if site_id is not None:
+            params["site_id"] = site_id
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("set_env_var_value", "PATCH", url, custom_types.EnvVar, path_args=(account_id, key), params=params, json=json_data)
+
+    async def update_site(self, request_body: typing.Any, site_id: str) -> Site:
+        """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [updateEnvVar](#tag/environmentVariables/operation/updateEnvVar) to update a site&#x27;s environment variables. """
+        url = self.routes["update_site"].url(site_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_site", "PATCH", url, custom_types.Site, path_args=(site_id,), json=json_data)
+
+    async def create_account(self, request_body: AccountSetup) -> AccountMembership:
+        """  """
+        url = self.routes["create_account"].url()
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_account", "POST", url, custom_types.AccountMembership, json=json_data)
+
+    async def create_env_vars(self, request_body: typing.List[PostAccountsAccountIDEnvBodyItem], account_id: str, site_id: typing.Optional[str] = None) -> typing.List[EnvVar]:
+        """ Creates new environment variables. Granular scopes are available on Pro plans and above.  To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["create_env_vars"].url(account_id)
+        params = {} #type: dict[str, typing.Any]
+        if site_id is not None:
+            params["site_id"] = site_id
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_env_vars", "POST", url, custom_types.EnvVar, many=True, path_args=(account_id,), params=params, json=json_data)
+
+    async def update_site_build_log(self, build_id: str) -> typing.Any:
+        """  """
+        url = self.routes["update_site_build_log"].url(build_id)
+        return await self._call("update_site_build_log", "POST", url, path_args=(build_id,))
+
+    async def notify_build_start(self, build_id: str) -> typing.Any:
+        """  """
+        url = self.routes["notify_build_start"].url(build_id)
+        return await self._call("notify_build_start", "POST", url, path_args=(build_id,))
+
+    async def create_deploy_key(self) -> DeployKey:
+        """  """
+        url = self.routes["create_deploy_key"].url()
+        return await self._call("create_deploy_key", "POST", url, custom_types.DeployKey)
+
+    async def cancel_site_deploy(self, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["cancel_site_deploy"].url(deploy_id)
+        return await self._call("cancel_site_deploy", "POST", url, custom_types.Deploy, path_args=(deploy_id,))
+
+    async def lock_deploy(self, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["lock_deploy"].url(deploy_id)
+        return await self._call("lock_deploy", "POST", url, custom_types.Deploy, path_args=(deploy_id,))
+
+    async def unlock_deploy(self, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["unlock_deploy"].url(deploy_id)
+        return await self._call("unlock_deploy", "POST", url, custom_types.Deploy, path_args=(deploy_id,))
+
+    async def create_dns_zone(self, request_body: DNSZoneSetup) -> DNSZone:
+        """  """
+        url = self.routes["create_dns_zone"].url()
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_dns_zone", "POST", url, custom_types.DNSZone, json=json_data)
+
+    async def create_dns_record(self, request_body: DNSRecordCreate, zone_id: str) -> DNSRecord:
+        """  """
+        url = self.routes["create_dns_record"].url(zone_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_dns_record", "POST", url, custom_types.DNSRecord, path_args=(zone_id,), json=json_data)
+
+    async def create_hook_by_site_id(self, request_body: Hook, site_id: str) -> Hook:
+        """  """
+        url = self.routes["create_hook_by_site_id"].url()
+        params = {} #type: dict[str, typing.Any]
+        params["site_id"] = site_id
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_hook_by_site_id", "POST", url, custom_types.Hook, params=params, json=json_data)
+
+    async def enable_hook(self, hook_id: str) -> Hook:
+        """  """
+        url = self.routes["enable_hook"].url(hook_id)
+        return await self._call("enable_hook", "POST", url, custom_types.Hook, path_args=(hook_id,))
+
+    async def create_ticket(self, client_id: str) -> Ticket:
+        """  """
+        url = self.routes["create_ticket"].url()
+        params = {} #type: dict[str, typing.Any]
+        params["client_id"] = client_id
+        return await self._call("create_ticket", "POST", url, custom_types.Ticket, params=params)
+
+    async def exchange_ticket(self, ticket_id: str) -> AccessToken:
+        """  """
+        url = self.routes["exchange_ticket"].url(ticket_id)
+        return await self._call("exchange_ticket", "POST", url, custom_types.AccessToken, path_args=(ticket_id,))
+
+    async def create_site(self, request_body: typing.Any, configure_dns: typing.Optional[bool] = None) -> Site:
+        """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [createEnvVars](#tag/environmentVariables/operation/createEnvVars) to create environment variables for a site. """
+        url = self.routes["create_site"].url()
+        params = {} #type: dict[str, typing.Any]
+        if configure_dns is not None:
+            params["configure_dns"] = configure_dns
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_site", "POST", url, custom_types.Site, params=params, json=json_data)
+
+    async def create_site_asset(self, site_id: str, content_type: str, name: str, size: int, visibility: typing.Optional[str] = None) -> AssetSignature:
+        """  """
+        url = self.routes["create_site_asset"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        params["content_type"] = content_type
+        params["name"] = name
+        params["size"] = size
+        if visibility is not None:
+            params["visibility"] = visibility
+        return await self._call("create_site_asset", "POST", url, custom_types.AssetSignature, path_args=(site_id,), params=params)
+
+    async def create_site_build_hook(self, request_body: BuildHookSetup, site_id: str) -> BuildHook:
+        """  """
+        url = self.routes["create_site_build_hook"].url(site_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_site_build_hook", "POST", url, custom_types.BuildHook, path_args=(site_id,), json=json_data)
+
+    async def create_site_build(self, request_body: BuildSetup, site_id: str) -> Build:
+        """  """
+        url = self.routes["create_site_build"].url(site_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_site_build", "POST", url, custom_types.Build, path_args=(site_id,), json=json_data)
+
+    async def create_site_deploy(self, request_body: DeployFiles, site_id: str, branch: typing.Optional[str] = None, deploy_previews: typing.Optional[bool] = None, latest_published: typing.Optional[bool] = None, production: typing.Optional[bool] = None, state: typing.Optional[str] = None, title: typing.Optional[str] = None) -> Deploy:
+        """  """
+        url = self.routes["create_site_deploy"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if branch is not None:
+            params["branch"] = branch
+        if deploy_previews is not None:
+            params["deploy_previews"] = deploy_previews
+        if latest_published is not None:
+            params["latest_published"] = latest_published
+        if production is not None:
+            params["production"] = production
+        if state is not None:
+            params["state"] = state
+        if title is not None:
+            params["title"] = title
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_site_deploy", "POST", url, custom_types.Deploy, path_args=(site_id,), params=params, json=json_data)
+
+    async def restore_site_deploy(self, site_id: str, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["restore_site_deploy"].url(site_id, deploy_id)
+        return await self._call("restore_site_deploy", "POST", url, custom_types.Deploy, path_args=(site_id, deploy_id))
+
+    async def create_service_instance(self, request_body: typing.Any, site_id: str, addon: str) -> ServiceInstance:
+        """  """
+        url = self.routes["create_service_instance"].url(site_id, addon)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_service_instance", "POST", url, custom_types.ServiceInstance, path_args=(site_id, addon), json=json_data)
+
+    async def create_site_snippet(self, request_body: Snippet, site_id: str) -> Snippet:
+        """  """
+        url = self.routes["create_site_snippet"].url(site_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_site_snippet", "POST", url, custom_types.Snippet, path_args=(site_id,), json=json_data)
+
+    async def provision_site_tls_certificate(self, site_id: str, ca_certificates: typing.Optional[str] = None, certificate: typing.Optional[str] = None, key: typing.Optional[str] = None) -> SniCertificate:
+        """  """
+        url = self.routes["provision_site_tls_certificate"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if ca_certificates is not None:
+            params["ca_certificates"] = ca_certificates
+        if certificate is not None:
+            params["certificate"] = certificate
+        if key is not None:
+            params["key"] = key
+        return await self._call("provision_site_tls_certificate", "POST", url, custom_types.SniCertificate, path_args=(site_id,), params=params)
+
+    async def create_split_test(self, request_body: SplitTestSetup, site_id: str) -> SplitTest:
+        """  """
+        url = self.routes["create_split_test"].url(site_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_split_test", "POST", url, custom_types.SplitTest, path_args=(site_id,), json=json_data)
+
+    async def enable_split_test(self, site_id: str, split_test_id: str) -> typing.Any:
+        """  """
+        url = self.routes["enable_split_test"].url(site_id, split_test_id)
+        return await self._call("enable_split_test", "POST", url, path_args=(site_id, split_test_id))
+
+    async def disable_split_test(self, site_id: str, split_test_id: str) -> typing.Any:
+        """  """
+        url = self.routes["disable_split_test"].url(site_id, split_test_id)
+        return await self._call("disable_split_test", "POST", url, path_args=(site_id, split_test_id))
+
+    async def add_member_to_account(self, request_body: AccountAddMemberSetup, account_slug: str) -> typing.List[Member]:
+        """  """
+        url = self.routes["add_member_to_account"].url(account_slug)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("add_member_to_account", "POST", url, custom_types.Member, many=True, path_args=(account_slug,), json=json_data)
+
+    async def create_site_in_team(self, request_body: typing.Any, account_slug: str, configure_dns: typing.Optional[bool] = None) -> Site:
+        """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [createEnvVars](#tag/environmentVariables/operation/createEnvVars) to create environment variables for a site. """
+        url = self.routes["create_site_in_team"].url(account_slug)
+        params = {} #type: dict[str, typing.Any]
+        if configure_dns is not None:
+            params["configure_dns"] = configure_dns
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("create_site_in_team", "POST", url, custom_types.Site, path_args=(account_slug,), params=params, json=json_data)
+
+    async def update_account(self, request_body: AccountUpdateSetup, account_id: str) -> AccountMembership:
+        """  """
+        url = self.routes["update_account"].url(account_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_account", "PUT", url, custom_types.AccountMembership, path_args=(account_id,), json=json_data)
+
+    async def update_env_var(self, request_body: PutAccountsAccountIDEnvKeyBody, account_id: str, key: str, site_id: typing.Optional[str] = None) -> EnvVar:
+        """ Updates an existing environment variable and all of its values. Existing values will be replaced by values provided. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
+        url = self.routes["update_env_var"].url(account_id, key)
+        params = {} #type: dict[str, typing.Any]
+        if site_id is not None:
+            params["site_id"] = site_id
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_env_var", "PUT", url, custom_types.EnvVar, path_args=(account_id, key), params=params, json=json_data)
+
+    async def upload_deploy_file(self, request_body: UploadBody, deploy_id: str, path: str, size: typing.Optional[int] = None) -> File:
+        """  """
+        url = self.routes["upload_deploy_file"].url(deploy_id, path)
+        params = {} #type: dict[str, typing.Any]
+        if size is not None:
+            params["size"] = size
+        if isinstance(request_body, str):
+            json_data = self._to_json_encodable(request_body)
+            return await self._call("upload_deploy_file", "PUT", url, custom_types.File, path_args=(deploy_id, path), params=params, json=json_data)
+        with _BinaryBody(request_body, size) as body:
+            headers = {"Content-Type": "application/octet-stream", "Content-Length": str(len(body))}
+            return await self._call("upload_deploy_file", "PUT", url, custom_types.File, path_args=(deploy_id, path), params=params, content=body, headers=headers)
+
+    async def upload_deploy_function(self, request_body: UploadBody, deploy_id: str, name: str, invocation_mode: typing.Optional[str] = None, runtime: typing.Optional[str] = None, size: typing.Optional[int] = None) -> Function:
+        """  """
+        url = self.routes["upload_deploy_function"].url(deploy_id, name)
+        params = {} #type: dict[str, typing.Any]
+        if invocation_mode is not None:
+            params["invocation_mode"] = invocation_mode
+        if runtime is not None:
+            params["runtime"] = runtime
+        if size is not None:
+            params["size"] = size
+        if isinstance(request_body, str):
+            json_data = self._to_json_encodable(request_body)
+            return await self._call("upload_deploy_function", "PUT", url, custom_types.Function, path_args=(deploy_id, name), params=params, json=json_data)
+        with _BinaryBody(request_body, size) as body:
+            headers = {"Content-Type": "application/octet-stream", "Content-Length": str(len(body))}
+            return await self._call("upload_deploy_function", "PUT", url, custom_types.Function, path_args=(deploy_id, name), params=params, content=body, headers=headers)
+
+    async def transfer_dns_zone(self, zone_id: str, account_id: str, transfer_account_id: str, transfer_user_id: str) -> DNSZone:
+        """  """
+        url = self.routes["transfer_dns_zone"].url(zone_id)
+        params = {} #type: dict[str, typing.Any]
+        params["account_id"] = account_id
+        params["transfer_account_id"] = transfer_account_id
+        params["transfer_user_id"] = transfer_user_id
+        return await self._call("transfer_dns_zone", "PUT", url, custom_types.DNSZone, path_args=(zone_id,), params=params)
+
+    async def update_hook(self, request_body: Hook, hook_id: str) -> Hook:
+        """  """
+        url = self.routes["update_hook"].url(hook_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_hook", "PUT", url, custom_types.Hook, path_args=(hook_id,), json=json_data)
+
+    async def update_site_asset(self, site_id: str, asset_id: str, state: str) -> Asset:
+        """  """
+        url = self.routes["update_site_asset"].url(site_id, asset_id)
+        params = {} #type: dict[str, typing.Any]
+        params["state"] = state
+        return await self._call("update_site_asset", "PUT", url, custom_types.Asset, path_args=(site_id, asset_id), params=params)
+
+    async def update_site_build_hook(self, request_body: BuildHookSetup, site_id: str, id: str) -> typing.Any:
+        """  """
+        url = self.routes["update_site_build_hook"].url(site_id, id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_site_build_hook", "PUT", url, path_args=(site_id, id), json=json_data)
+
+    async def update_site_deploy(self, request_body: DeployFiles, site_id: str, deploy_id: str) -> Deploy:
+        """  """
+        url = self.routes["update_site_deploy"].url(site_id, deploy_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_site_deploy", "PUT", url, custom_types.Deploy, path_args=(site_id, deploy_id), json=json_data)
+
+    async def configure_dns_for_site(self, site_id: str) -> typing.List[DNSZone]:
+        """  """
+        url = self.routes["configure_dns_for_site"].url(site_id)
+        return await self._call("configure_dns_for_site", "PUT", url, custom_types.DNSZone, many=True, path_args=(site_id,))
+
+    async def update_site_metadata(self, request_body: typing.Any, site_id: str) -> typing.Any:
+        """  """
+        url = self.routes["update_site_metadata"].url(site_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_site_metadata", "PUT", url, path_args=(site_id,), json=json_data)
+
+    async def rollback_site_deploy(self, site_id: str) -> typing.Any:
+        """  """
+        url = self.routes["rollback_site_deploy"].url(site_id)
+        return await self._call("rollback_site_deploy", "PUT", url, path_args=(site_id,))
+
+    async def update_service_instance(self, request_body: typing.Any, site_id: str, addon: str, instance_id: str) -> typing.Any:
+        """  """
+        url = self.routes["update_service_instance"].url(site_id, addon, instance_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_service_instance", "PUT", url, path_args=(site_id, addon, instance_id), json=json_data)
+
+    async def update_site_snippet(self, request_body: Snippet, site_id: str, snippet_id: str) -> typing.Any:
+        """  """
+        url = self.routes["update_site_snippet"].url(site_id, snippet_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_site_snippet", "PUT", url, path_args=(site_id, snippet_id), json=json_data)
+
+    async def update_split_test(self, request_body: SplitTestSetup, site_id: str, split_test_id: str) -> SplitTest:
+        """  """
+        url = self.routes["update_split_test"].url(site_id, split_test_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_split_test", "PUT", url, custom_types.SplitTest, path_args=(site_id, split_test_id), json=json_data)
+
+    async def unlink_site_repo(self, site_id: str) -> Site:
+        """ [Beta] Unlinks the repo from the site. -  - This action will also: - - Delete associated deploy keys - - Delete outgoing webhooks for the repo - - Delete the site&#x27;s build hooks """
+        url = self.routes["unlink_site_repo"].url(site_id)
+        return await self._call("unlink_site_repo", "PUT", url, custom_types.Site, path_args=(site_id,))
+
+    async def update_account_member(self, request_body: AccountUpdateMemberSetup, account_slug: str, member_id: str) -> Member:
+        """  """
+        url = self.routes["update_account_member"].url(account_slug, member_id)
+        json_data = self._to_json_encodable(request_body)
+        return await self._call("update_account_member", "PUT", url, custom_types.Member, path_args=(account_slug, member_id), json=json_data)
+
+
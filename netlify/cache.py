@@ -0,0 +1,236 @@
+import time
+import typing
+import hashlib
+import threading
+import collections
+from urllib.parse import urlencode
+
+from .invalidation import INVALIDATES, UPDATES
+
+_MISSING = object()
+
+Rules = typing.Mapping[str, typing.Tuple[typing.Tuple[str, ...], ...]]
+
+def _matches(cached: typing.Mapping[str, typing.Any], written: typing.Mapping[str, typing.Any], names: typing.Tuple[str, ...]) -> bool:
+    # a parameter the write did not carry cannot narrow the match, so it matches every cached value
+    return all(name in cached and (name not in written or cached[name] == written[name]) for name in names)
+
+def _token(authorization: typing.Union[str, bytes, None]) -> str:
+    # the token is hashed so it is never held (or, with a persistent store, written) in the clear
+    if isinstance(authorization, str):
+        authorization = authorization.encode("utf-8")
+    return hashlib.sha256(authorization).hexdigest()[:16] if authorization else "-"
+
+class CacheEntry:
+    """ One cached GET response: the parameters it was read with, the body, its validators, and the results already decoded from it keyed by (decode mode, lazy, target class, many). warm marks entries loaded from a persistent backend that this process has not revalidated yet. """
+    __slots__ = ("operation", "params", "body", "etag", "last_modified", "stored_at", "decoded", "warm", "revalidating")
+
+    def __init__(self, operation: str, params: typing.Mapping[str, typing.Any], body: bytes, etag: typing.Optional[str] = None, last_modified: typing.Optional[str] = None, stored_at: typing.Optional[float] = None):
+        self.operation = operation
+        self.params = params
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.time() if stored_at is None else stored_at
+        self.decoded = {} #type: dict[typing.Any, typing.Any]
+        self.warm = False
+        self.revalidating = False
+
+    def validators(self) -> typing.Dict[str, str]:
+        """ Conditional request headers that let the server answer 304 Not Modified. """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def result(self, slot: typing.Any, decode: typing.Callable[[bytes], typing.Any]) -> typing.Any:
+        """ The result decoded from body for slot, decoding it on first use. """
+        value = self.decoded.get(slot, _MISSING)
+        if value is _MISSING:
+            value = self.decoded[slot] = decode(self.body)
+        return value
+
+class ResponseCache:
+    """ Bounded LRU cache of GET responses keyed by URL, query and token, shared by any number of Netlify and AsyncNetlify clients; thread-safe, and cached results are shared, so treat them as read-only. """
+    def __init__(
+        self,
+        max_entries: int = 1024,  # least recently used entries are dropped beyond this
+        ttl: float = 0.0,  # seconds a response is served without touching the network; after it, it is revalidated with If-None-Match/If-Modified-Since and a 304 serves it again (0 always revalidates)
+        ttls: typing.Optional[typing.Dict[str, float]] = None,  # per-operation overrides of ttl, e.g. {"list_hook_types": 3600}
+        operations: typing.Optional[typing.Iterable[str]] = None,  # restricts caching to these GET operations
+        invalidates: typing.Optional[Rules] = None,  # reads each mutating call evicts, whichever token cached them; netlify.invalidation.INVALIDATES by default
+        updates: typing.Optional[Rules] = None,  # reads a successful write replaces with the resource it returned, for the writer's token only; netlify.invalidation.UPDATES by default
+        backend: typing.Optional[typing.Any] = None,  # persistent store such as netlify.store.SQLiteStore: looked up on a miss and written through on every change; entries loaded from it are served at once and revalidated in the background
+        stale_while_revalidate: float = 0.0,  # seconds past its TTL during which an entry is still served while it is revalidated in the background
+    ):
+        self.max_entries = max_entries
+        self.backend = backend
+        self.stale_while_revalidate = stale_while_revalidate
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.operations = frozenset(operations) if operations is not None else None
+        self.invalidates = INVALIDATES if invalidates is None else invalidates
+        self.updates = UPDATES if updates is None else updates
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict() #type: collections.OrderedDict[str, CacheEntry]
+        self._by_operation = collections.defaultdict(set) #type: collections.defaultdict[str, set[str]]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def enabled_for(self, operation: str) -> bool:
+        return self.operations is None or operation in self.operations
+
+    def ttl_for(self, operation: str) -> float:
+        return self.ttls.get(operation, self.ttl)
+
+    def key(self, url: str, params: typing.Optional[typing.Dict[str, typing.Any]], authorization: typing.Union[str, bytes, None]) -> str:
+        query = urlencode(sorted(params.items()), doseq=True) if params else ""
+        return f"{_token(authorization)} {url}?{query}"
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.backend is None:
+            return None
+        entry = self.backend.load(key)
+        if entry is None:
+            return None
+        entry.warm = True
+        with self._lock:
+            # another thread may have loaded or fetched it meanwhile
+            entry = self._entries.setdefault(key, entry)
+            self._insert(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        ttl = self.ttl_for(entry.operation)
+        return ttl > 0 and time.time() - entry.stored_at < ttl
+
+    def lookup(self, key: str) -> typing.Tuple[typing.Optional[CacheEntry], bool]:
+        """ The entry for key (if any) and whether it can be served without revalidation. """
+        entry = self.get(key)
+        if entry is None or not self.is_fresh(entry):
+            return entry, False
+        self.hits += 1
+        return entry, True
+
+    def serves_stale(self, entry: CacheEntry) -> bool:
+        """ Whether a stale entry may be returned while it is revalidated in the background. """
+        if entry.warm:
+            return True
+        window = self.stale_while_revalidate
+        return window > 0 and time.time() - entry.stored_at < self.ttl_for(entry.operation) + window
+
+    def claim_revalidation(self, entry: CacheEntry) -> bool:
+        """ True for exactly one caller until release, which should then revalidate entry in the background. """
+        with self._lock:
+            if entry.revalidating:
+                return False
+            entry.revalidating = True
+            return True
+
+    def release(self, entry: CacheEntry) -> None:
+        entry.revalidating = False
+
+    def store(self, key: str, operation: str, params: typing.Optional[typing.Mapping[str, typing.Any]], body: bytes, headers: typing.Mapping[str, str]) -> typing.Optional[CacheEntry]:
+        """ Caches a 200 response; None when it can neither be revalidated nor served fresh. """
+        self.misses += 1
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None and self.ttl_for(operation) <= 0:
+            return None
+        entry = CacheEntry(operation, dict(params or {}), body, etag, last_modified)
+        with self._lock:
+            self._entries[key] = entry
+            self._insert(key, entry)
+        if self.backend is not None:
+            self.backend.save(key, entry)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, headers: typing.Mapping[str, str]) -> None:
+        """ Records a 304 answer: the entry is fresh again and picks up any new validators. """
+        self.revalidated += 1
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        entry.stored_at = time.time()
+        entry.warm = False
+        if self.backend is not None:
+            self.backend.save(key, entry)
+
+    def invalidate(self, operation: str, params: typing.Optional[typing.Mapping[str, typing.Any]]) -> None:
+        """ Evicts every entry a call to the mutating operation may have made stale. Used when the write failed or returned no resource. """
+        rules = self.invalidates.get(operation, ()) + self.updates.get(operation, ())
+        with self._lock:
+            keys = self._matching(rules, params or {})
+            for key in keys:
+                self._pop(key)
+        if self.backend is not None:
+            self.backend.delete(keys + self.backend.matching(rules, params or {}))
+
+    def write_through(self, operation: str, params: typing.Optional[typing.Mapping[str, typing.Any]], body: bytes, headers: typing.Mapping[str, str], slot: typing.Any, result: typing.Any, authorization: typing.Union[str, bytes, None] = None) -> None:
+        """ Applies a successful call to the mutating operation: the writer's own entries for the resource it returned take body (with result already decoded for slot) and every other stale entry, other tokens' included, is evicted. """
+        params = params or {}
+        # another token may see less of the resource than the writer, so only the writer's reads are replaced
+        own = _token(authorization) + " "
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        replaced = {} #type: dict[str, CacheEntry]
+        with self._lock:
+            evicted = self._matching(self.invalidates.get(operation, ()), params)
+            for key in self._matching(self.updates.get(operation, ()), params):
+                if not key.startswith(own):
+                    evicted.append(key)
+                    continue
+                entry = self._entries[key]
+                replacement = replaced[key] = CacheEntry(entry.operation, entry.params, body, etag, last_modified)
+                replacement.decoded[slot] = result
+                self._entries[key] = replacement
+            for key in evicted:
+                self._pop(key)
+        if self.backend is not None:
+            for key, entry in replaced.items():
+                self.backend.save(key, entry)
+            # entries only on disk cannot be replaced without their read's URL, so they are evicted
+            stale = self.backend.matching(self.invalidates.get(operation, ()) + self.updates.get(operation, ()), params)
+            self.backend.delete(evicted + [key for key in stale if key not in replaced])
+
+    def _matching(self, rules: typing.Iterable[typing.Tuple[str, ...]], params: typing.Mapping[str, typing.Any]) -> typing.List[str]:
+        keys = [] #type: list[str]
+        for read, *names in rules:
+            candidates = self._entries if read == "*" else self._by_operation.get(read, ())
+            keys.extend(key for key in candidates if _matches(self._entries[key].params, params, tuple(names)))
+        return keys
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        self._entries.move_to_end(key)
+        self._by_operation[entry.operation].add(key)
+        while len(self._entries) > self.max_entries:
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._by_operation[entry.operation].discard(key)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+        if self.backend is not None:
+            self.backend.delete([key])
+
+    def clear(self) -> None:
+        """ Empties the cache and its backend. """
+        with self._lock:
+            self._entries.clear()
+            self._by_operation.clear()
+        if self.backend is not None:
+            self.backend.clear()
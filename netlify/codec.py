@@ -0,0 +1,43 @@
+import json
+import typing
+
+try:
+    import orjson
+except ImportError: # pragma: no cover - optional dependency
+    orjson = None #type: ignore[assignment]
+
+class JSONCodec(typing.Protocol):
+    """ Serializes request bodies to bytes and parses response bodies. """
+    content_type: str
+
+    def dumps(self, obj: typing.Any) -> bytes: ...
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any: ...
+
+class StdlibCodec:
+    content_type = "application/json"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return json.loads(data)
+
+class OrjsonCodec:
+    content_type = "application/json"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the orjson package (pip install orjson)")
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return orjson.loads(data)
+
+def default_codec() -> JSONCodec:
+    """ orjson when it is installed, the standard library otherwise. """
+    if orjson is not None:
+        return OrjsonCodec()
+    return StdlibCodec()
@@ -0,0 +1,161 @@
+import typing
+from array import array
+
+from .custom_types import from_optional_int, from_optional_float, from_optional_bool, from_optional_str, from_str
+
+T = typing.TypeVar("T")
+
+_ARRAY_TYPECODES = {
+    from_optional_int: "q",
+    from_optional_float: "d",
+    from_optional_bool: "b",
+} #type: dict[typing.Any, str]
+
+_STRING_DECODERS = (from_optional_str, from_str)
+
+class _Column:
+    """ One field of a ColumnarList. Numeric and boolean fields are packed into an array with a validity mask for None; everything else is a list, with equal strings sharing one object. """
+    __slots__ = ("name", "values", "mask")
+
+    def __init__(self, name: str, values: typing.Any, mask: typing.Optional[bytearray]):
+        self.name = name
+        self.values = values
+        self.mask = mask
+
+    def get(self, index: int) -> typing.Any:
+        if self.mask is not None and not self.mask[index]:
+            return None
+        value = self.values[index]
+        if isinstance(self.values, array) and self.values.typecode == "b":
+            return bool(value)
+        return value
+
+def _build_column(name: str, key: str, decode: typing.Callable[[typing.Any], typing.Any], items: typing.List[typing.Any]) -> _Column:
+    typecode = _ARRAY_TYPECODES.get(decode)
+    if typecode is not None:
+        packed = array(typecode)
+        mask = bytearray(len(items))
+        has_none = False
+        for i, item in enumerate(items):
+            value = decode(item.get(key))
+            if value is None:
+                has_none = True
+                packed.append(0)
+            else:
+                mask[i] = 1
+                packed.append(value)
+        return _Column(name, packed, mask if has_none else None)
+    if decode in _STRING_DECODERS:
+        # batch-local interning: repeated values (mime types, states, branches) share one object
+        # without growing the interpreter-wide intern table with unique paths and digests
+        interned = {} #type: dict[str, str]
+        values = [] #type: list[typing.Any]
+        for item in items:
+            value = decode(item.get(key))
+            values.append(None if value is None else interned.setdefault(value, value))
+        return _Column(name, values, None)
+    return _Column(name, [decode(item.get(key)) for item in items], None)
+
+class Row:
+    """ Read-only view of one row of a ColumnarList; fields are read straight from the columns. """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ColumnarList[typing.Any]", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> typing.Any:
+        try:
+            column = self._table._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column.get(self._index)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={column.get(self._index)!r}" for name, column in self._table._columns.items())
+        return f"{self._table.model.__name__}Row({fields})"
+
+    def to_model(self) -> typing.Any:
+        return self._table.model(*[column.get(self._index) for column in self._table._columns.values()])
+
+class ColumnarList(typing.Generic[T]):
+    """ Column-oriented container for a list result: each model field is stored once as a packed column instead of once per object. Supports len(), iteration and indexing (rows are Row views; slices are ColumnarLists), per-field access through column(), and to_numpy() when NumPy is installed. """
+    def __init__(self, model: typing.Type[T], columns: typing.Dict[str, _Column], length: int):
+        self.model = model
+        self._columns = columns
+        self._length = length
+
+    @classmethod
+    def from_dicts(cls, model: typing.Type[T], items: typing.List[typing.Any]) -> "ColumnarList[T]":
+        """ Decodes and validates items with the same field converters as model.from_dict, column by column. """
+        for item in items:
+            assert isinstance(item, dict)
+        columns = {attr: _build_column(attr, key, decode, items) for attr, key, decode, _ in getattr(model, "_fields")}
+        return cls(model, columns, len(items))
+
+    def __len__(self) -> int:
+        return self._length
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Row: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> "ColumnarList[T]": ...
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Any:
+        if isinstance(index, slice):
+            columns = {}
+            for name, column in self._columns.items():
+                mask = column.mask[index] if column.mask is not None else None
+                columns[name] = _Column(name, column.values[index], mask)
+            return ColumnarList(self.model, columns, len(range(*index.indices(self._length))))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarList index out of range")
+        return Row(self, index)
+
+    def __iter__(self) -> typing.Iterator[Row]:
+        for i in range(self._length):
+            yield Row(self, i)
+
+    def __repr__(self) -> str:
+        return f"ColumnarList[{self.model.__name__}]({self._length} rows, columns={list(self._columns)})"
+
+    @property
+    def fields(self) -> typing.List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> typing.Any:
+        """ The raw column for name: an array for numeric and boolean fields (None stored as 0), a list otherwise. """
+        return self._columns[name].values
+
+    def null_mask(self, name: str) -> typing.Optional[bytearray]:
+        """ 1 for rows where name is set and 0 where it is None; None when the column has no missing values. """
+        return self._columns[name].mask
+
+    def to_models(self) -> typing.List[T]:
+        return [row.to_model() for row in self]
+
+    def to_numpy(self) -> typing.Dict[str, typing.Any]:
+        """ One NumPy array per field. Packed columns are exposed without copying (as masked arrays when they contain None); other columns become object arrays. """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("ColumnarList.to_numpy requires numpy (pip install numpy)") from None
+        arrays = {}
+        for name, column in self._columns.items():
+            if isinstance(column.values, array):
+                dtype = {"q": numpy.int64, "d": numpy.float64, "b": numpy.int8}[column.values.typecode]
+                data = numpy.frombuffer(column.values, dtype=dtype) if len(column.values) else numpy.empty(0, dtype=dtype)
+                if column.values.typecode == "b":
+                    data = data.astype(bool)
+                if column.mask is not None:
+                    invalid = numpy.frombuffer(bytes(column.mask), dtype=numpy.uint8) == 0
+                    data = numpy.ma.masked_array(data, mask=invalid)
+                arrays[name] = data
+            else:
+                values = numpy.empty(len(column.values), dtype=object)
+                values[:] = column.values
+                arrays[name] = values
+        return arrays
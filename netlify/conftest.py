@@ -0,0 +1,128 @@
+import json
+import time
+import typing
+import threading
+import collections
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+
+PAGE_SIZE = 3
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "ApiStub"
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+    def _send(self, status: int, body: typing.Any = None, headers: typing.Optional[typing.Dict[str, str]] = None) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self) -> None:
+        stub = self.server
+        sent = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        parts = urlsplit(self.path)
+        path = parts.path[len("/api/v1"):] if parts.path.startswith("/api/v1") else parts.path
+        query = dict(parse_qsl(parts.query))
+        with stub.lock:
+            stub.requests.append((self.command, path, query))
+            if sent:
+                stub.bodies.append((path, self.headers.get("Content-Type"), sent))
+            scripted = stub.script.popleft() if stub.script else None
+        if scripted is not None:
+            status, headers = scripted
+            if not status:
+                # drop the connection without answering
+                self.close_connection = True
+                return
+            return self._send(status, {"code": status, "message": "scripted"}, headers)
+        if path.startswith("/deploys/") and self.command == "PUT":
+            with stub.lock:
+                stub.uploads.append((path, sent))
+            return self._send(200, {"id": path.rsplit("/", 1)[-1], "size": len(sent)})
+        if path.endswith("/deploys") and self.command == "POST":
+            site_id = path.split("/")[2]
+            stub.deploy_files = json.loads(sent)
+            return self._send(200, {"id": "d1", "site_id": site_id, "state": "uploading", "required": stub.required, "required_functions": stub.required_functions})
+        if self.command == "GET":
+            time.sleep(stub.delay)
+            return self._get(path, query)
+        if stub.fail_writes:
+            return self._send(stub.fail_writes, {"code": stub.fail_writes, "message": "rejected"})
+        with stub.lock:
+            stub.version += 1
+        site_id = path.rsplit("/", 1)[-1]
+        if self.command == "DELETE":
+            stub.sites.pop(site_id, None)
+            return self._send(200, {"id": site_id})
+        site = stub.sites.setdefault(site_id, {"id": site_id})
+        site.update(json.loads(sent or b"{}"))
+        self._send(200, site)
+
+    def _get(self, path: str, query: typing.Dict[str, str]) -> None:
+        stub = self.server
+        etag = f'"v{stub.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers={"ETag": etag})
+        if path == "/sites":
+            page = int(query.get("page", 1))
+            sites = sorted(stub.sites.values(), key=lambda site: site["id"])
+            headers = {"ETag": etag}
+            if stub.pages > 1:
+                base = f"{stub.base_url}/sites"
+                links = [f'<{base}?page={stub.pages}>; rel="last"']
+                if page < stub.pages:
+                    links.append(f'<{base}?page={page + 1}>; rel="next"')
+                headers["Link"] = ", ".join(links)
+                sites = [{"id": f"p{page}-{i}", "name": f"page {page}"} for i in range(PAGE_SIZE)]
+            return self._send(200, sites, headers)
+        site = stub.sites.get(path.rsplit("/", 1)[-1])
+        if site is None:
+            return self._send(404, {"code": 404, "message": "Not Found"})
+        self._send(200, site, {"ETag": etag})
+
+    do_GET = do_PUT = do_PATCH = do_POST = do_DELETE = _handle
+
+class ApiStub(ThreadingHTTPServer):
+    """ A small in-memory Netlify API: sites that can be read, updated and deleted, with an ETag that changes on every write, and digest deploys whose uploads are recorded. requests logs (method, path, query) of everything received and bodies (path, Content-Type, body) of every request body; script queues (status, headers) answers that take precedence, status 0 dropping the connection. """
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.base_url = f"http://127.0.0.1:{self.server_port}/api/v1"
+        self.lock = threading.Lock()
+        self.requests = [] #type: list[tuple[str, str, dict[str, str]]]
+        self.sites = {site_id: {"id": site_id, "name": f"site {site_id}"} for site_id in ("s1", "s2")}
+        self.version = 1
+        self.delay = 0.0
+        self.fail_writes = 0
+        self.pages = 1
+        self.script = collections.deque() #type: collections.deque[tuple[int, dict[str, str]]]
+        self.uploads = [] #type: list[tuple[str, bytes]]
+        self.bodies = [] #type: list[tuple[str, typing.Optional[str], bytes]]
+        self.required = [] #type: list[str]
+        self.required_functions = [] #type: list[str]
+        self.deploy_files = None #type: typing.Any
+
+    def count(self, method: str, path: str) -> int:
+        with self.lock:
+            return sum(1 for m, p, _ in self.requests if m == method and p == path)
+
+@pytest.fixture
+def api() -> typing.Iterator[ApiStub]:
+    server = ApiStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,327 @@
+import os
+import json
+import time
+import random
+import typing
+import mmap
+import hashlib
+import functools
+import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from .custom_types import Deploy, DeployFiles
+from .main import Netlify
+
+ProgressCallback = typing.Callable[[int, int, str], None]
+
+def _is_ignored(name: str) -> bool:
+    return name.startswith(".") and name != ".well-known"
+
+MMAP_THRESHOLD = 1 << 20
+BATCH_BYTES = 8 << 20
+BATCH_FILES = 256
+
+HashTask = typing.Tuple[str, str, int]
+
+def _hash_file(path: str, algorithm: str, size: typing.Optional[int] = None) -> str:
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # hashlib consumes the mapping in place and releases the GIL while doing so
+                    return hashlib.new(algorithm, mm).hexdigest()
+            except (OSError, ValueError):
+                pass
+        digest = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(MMAP_THRESHOLD), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def _hash_batch(batch: typing.List[HashTask]) -> typing.List[str]:
+    return [_hash_file(path, algorithm, size) for path, algorithm, size in batch]
+
+def _batches(tasks: typing.List[HashTask]) -> typing.Iterator[typing.List[HashTask]]:
+    batch = [] #type: list[HashTask]
+    batch_bytes = 0
+    for task in tasks:
+        if task[2] >= MMAP_THRESHOLD:
+            # the pending batch goes first so that digests come back in task order
+            if batch:
+                yield batch
+                batch = []
+                batch_bytes = 0
+            yield [task]
+            continue
+        batch.append(task)
+        batch_bytes += task[2]
+        if len(batch) >= BATCH_FILES or batch_bytes >= BATCH_BYTES:
+            yield batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield batch
+
+def hash_files(tasks: typing.List[HashTask], workers: typing.Optional[int] = None, processes: bool = False) -> typing.List[str]:
+    """ Hashes (path, algorithm, size) tasks and returns the hex digests in task order. Large files are hashed individually through mmap; small files are grouped into batches so each pool task amortises its dispatch overhead. """
+    workers = workers or os.cpu_count() or 1
+    batches = list(_batches(tasks))
+    if workers == 1 or len(batches) <= 1:
+        return [digest for batch in batches for digest in _hash_batch(batch)]
+    pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor #type: typing.Any
+    with pool_class(max_workers=workers) as pool:
+        return [digest for digests in pool.map(_hash_batch, batches) for digest in digests]
+
+def walk_files(directory: str) -> typing.Iterator[typing.Tuple[str, str]]:
+    """ Yields (deploy path, filesystem path) for every file under directory, skipping dotfiles other than .well-known. """
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not _is_ignored(d))
+        for name in sorted(names):
+            if _is_ignored(name):
+                continue
+            full_path = os.path.join(root, name)
+            rel_path = os.path.relpath(full_path, directory).replace(os.sep, "/")
+            yield "/" + rel_path, full_path
+
+def walk_functions(directory: str) -> typing.Iterator[typing.Tuple[str, str]]:
+    """ Yields (function name, filesystem path) for every bundled function archive directly inside directory. """
+    for name in sorted(os.listdir(directory)):
+        full_path = os.path.join(directory, name)
+        if _is_ignored(name) or not os.path.isfile(full_path):
+            continue
+        yield os.path.splitext(name)[0], full_path
+
+class DigestCache:
+    """ Persistent file digest cache keyed by (path, size, mtime_ns, inode); a file is rehashed only when that key changes. """
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries = {} #type: dict[str, list[typing.Any]]
+        self._seen = set() #type: set[str]
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self._entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    @staticmethod
+    def _key(full_path: str, algorithm: str) -> str:
+        return algorithm + ":" + os.path.abspath(full_path)
+
+    def get(self, full_path: str, stat: os.stat_result, algorithm: str) -> typing.Optional[str]:
+        key = self._key(full_path, algorithm)
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[:3] == [stat.st_size, stat.st_mtime_ns, stat.st_ino]:
+            return entry[3]
+        return None
+
+    def put(self, full_path: str, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        key = self._key(full_path, algorithm)
+        self._seen.add(key)
+        self._entries[key] = [stat.st_size, stat.st_mtime_ns, stat.st_ino, digest]
+
+    def save(self) -> None:
+        """ Writes the entries looked up since loading, dropping files that no longer exist in the manifest. """
+        entries = {key: value for key, value in self._entries.items() if key in self._seen}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": self.VERSION, "entries": entries}, f)
+        os.replace(tmp_path, self.path)
+
+class DeployManifest:
+    """ The files (SHA1) and functions (SHA256) digest maps of a digest deploy, with the local paths behind them. """
+    def __init__(self, files: typing.Dict[str, str], functions: typing.Dict[str, str], file_paths: typing.Dict[str, str], function_paths: typing.Dict[str, str]):
+        self.files = files
+        self.functions = functions
+        self.file_paths = file_paths
+        self.function_paths = function_paths
+
+    def deploy_files(self, draft: typing.Optional[bool] = None, branch: typing.Optional[str] = None) -> DeployFiles:
+        return DeployFiles(None, branch, draft, self.files, None, None, self.functions or None, None)
+
+def build_manifest(directory: str, functions_directory: typing.Optional[str] = None, cache_path: typing.Optional[str] = None, workers: typing.Optional[int] = None, processes: bool = False) -> DeployManifest:
+    """ Hashes the publish directory (and bundled functions) into a DeployManifest. With cache_path, unchanged files reuse the digest recorded by the previous run; the rest are hashed on a pool of workers threads, or processes when processes is set. """
+    cache = DigestCache(cache_path) if cache_path is not None else None
+    entries = [(deploy_path, full_path, "sha1") for deploy_path, full_path in walk_files(directory)]
+    if functions_directory is not None:
+        entries += [(name, full_path, "sha256") for name, full_path in walk_functions(functions_directory)]
+    digests = [None] * len(entries) #type: list[typing.Optional[str]]
+    pending = [] #type: list[int]
+    stats = [] #type: list[os.stat_result]
+    for i, (_, full_path, algorithm) in enumerate(entries):
+        stat = os.stat(full_path)
+        stats.append(stat)
+        if cache is not None:
+            digests[i] = cache.get(full_path, stat, algorithm)
+        if digests[i] is None:
+            pending.append(i)
+    hashed = hash_files([(entries[i][1], entries[i][2], stats[i].st_size) for i in pending], workers, processes)
+    for i, digest in zip(pending, hashed):
+        digests[i] = digest
+        if cache is not None:
+            cache.put(entries[i][1], stats[i], entries[i][2], digest)
+    if cache is not None:
+        cache.save()
+    files = {} #type: dict[str, str]
+    file_paths = {} #type: dict[str, str]
+    functions = {} #type: dict[str, str]
+    function_paths = {} #type: dict[str, str]
+    # every digest is known by now, cached or hashed
+    for (key, full_path, algorithm), digest in zip(entries, typing.cast(typing.List[str], digests)):
+        if algorithm == "sha1":
+            files[key] = digest
+            file_paths[key] = full_path
+        else:
+            functions[key] = digest
+            function_paths[key] = full_path
+    return DeployManifest(files, functions, file_paths, function_paths)
+
+def _is_retryable(error: Exception) -> bool:
+    # the client already retries 429 and 5xx responses itself (max_retries); only failures it never saw a response for are retried here
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+def _with_retry(upload: typing.Callable[[], typing.Any], retries: int, backoff: float) -> None:
+    attempt = 0
+    while True:
+        try:
+            upload()
+            return
+        except Exception as error:
+            if attempt >= retries or not _is_retryable(error):
+                raise
+            time.sleep(backoff * (2 ** attempt))
+            attempt += 1
+
+def _upload_file(client: Netlify, deploy_id: str, deploy_path: str, full_path: str) -> None:
+    with open(full_path, "rb") as f:
+        client.upload_deploy_file(f, deploy_id, deploy_path.lstrip("/"))
+
+def _upload_function(client: Netlify, deploy_id: str, name: str, full_path: str) -> None:
+    with open(full_path, "rb") as f:
+        client.upload_deploy_function(f, deploy_id, name)
+
+def _first_path_per_digest(digests: typing.Dict[str, str], required: typing.Optional[typing.List[str]]) -> typing.List[str]:
+    wanted = set(required or [])
+    by_digest = {} #type: dict[str, str]
+    for key, digest in digests.items():
+        if digest in wanted and digest not in by_digest:
+            by_digest[digest] = key
+    return list(by_digest.values())
+
+def upload_required_files(client: Netlify, deploy: Deploy, manifest: DeployManifest, max_workers: int = 8, retries: int = 3, backoff: float = 0.5, progress: typing.Optional[ProgressCallback] = None) -> int:
+    """ Uploads the files and functions listed in deploy.required / deploy.required_functions, once per unique digest, over a bounded thread pool. An upload that fails with a connection error or timeout is retried up to retries times with exponential backoff; HTTP 429/5xx responses are retried by the client. Returns the number of uploads performed. """
+    assert deploy.id is not None
+    deploy_id = deploy.id
+    tasks = [] #type: list[tuple[str, typing.Callable[[], typing.Any]]]
+    for deploy_path in _first_path_per_digest(manifest.files, deploy.required):
+        full_path = manifest.file_paths[deploy_path]
+        tasks.append((deploy_path, functools.partial(_upload_file, client, deploy_id, deploy_path, full_path)))
+    for name in _first_path_per_digest(manifest.functions, deploy.required_functions):
+        full_path = manifest.function_paths[name]
+        tasks.append((name, functools.partial(_upload_function, client, deploy_id, name, full_path)))
+    total = len(tasks)
+    done = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_with_retry, upload, retries, backoff): label for label, upload in tasks}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                done += 1
+                if progress is not None:
+                    progress(done, total, futures[future])
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return total
+
+def deploy_directory(client: Netlify, site_id: str, directory: str, functions_directory: typing.Optional[str] = None, cache_path: typing.Optional[str] = None, draft: typing.Optional[bool] = None, branch: typing.Optional[str] = None, title: typing.Optional[str] = None, max_workers: int = 8, retries: int = 3, hash_workers: typing.Optional[int] = None, progress: typing.Optional[ProgressCallback] = None) -> Deploy:
+    """ Creates a digest deploy of directory and uploads only the files the API reports as required. """
+    client = client.with_decode("models")
+    manifest = build_manifest(directory, functions_directory, cache_path, workers=hash_workers)
+    deploy = client.create_site_deploy(manifest.deploy_files(draft, branch), site_id, title=title)
+    upload_required_files(client, deploy, manifest, max_workers=max_workers, retries=retries, progress=progress)
+    return deploy
+
+TERMINAL_STATES = frozenset(("ready", "error", "rejected"))
+
+TransitionCallback = typing.Callable[[Deploy, typing.Optional[str], typing.Optional[str]], None]
+
+class _Watch:
+    def __init__(self, deploy_id: str, interval: float):
+        self.deploy_id = deploy_id
+        self.deploy = None #type: typing.Optional[Deploy]
+        self.interval = interval
+        self.next_poll = 0.0
+
+def wait_for_deploys(
+    client: Netlify,
+    deploy_ids: typing.Iterable[str],
+    target_states: typing.Iterable[str] = ("ready",),  # terminal states (ready, error, rejected) always end the wait too
+    timeout: typing.Optional[float] = 600.0,  # seconds before TimeoutError is raised for the deploys still pending
+    on_transition: typing.Optional[TransitionCallback] = None,  # called with (deploy, old state, new state) for every observed state change
+    initial_interval: float = 1.0,  # seconds between polls of a deploy, reset whenever its state changes
+    max_interval: float = 30.0,
+    backoff: float = 1.6,  # factor the interval grows by after every poll without a state change
+    jitter: float = 0.2,  # each interval is scaled by a random factor within 1 +/- jitter
+) -> typing.Dict[str, Deploy]:
+    """ Polls many deploys from a single scheduler until each is done, refreshing the pending deploys of a site with one list_site_deploys call instead of one get_deploy each. """
+    client = client.with_decode("models")
+    targets = frozenset(target_states) | TERMINAL_STATES
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = {deploy_id: _Watch(deploy_id, initial_interval) for deploy_id in deploy_ids}
+    finished = {} #type: dict[str, Deploy]
+
+    def observe(watch: _Watch, deploy: Deploy, now: float) -> None:
+        old_state = watch.deploy.state if watch.deploy is not None else None
+        watch.deploy = deploy
+        if deploy.state != old_state:
+            watch.interval = initial_interval
+            if on_transition is not None:
+                on_transition(deploy, old_state, deploy.state)
+        if deploy.state in targets:
+            finished[watch.deploy_id] = deploy
+            del pending[watch.deploy_id]
+            return
+        watch.next_poll = now + watch.interval * random.uniform(1 - jitter, 1 + jitter)
+        watch.interval = min(max_interval, watch.interval * backoff)
+
+    while pending:
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            raise TimeoutError(f"{len(pending)} deploy(s) still pending after {timeout}s: {', '.join(sorted(pending))}")
+        due = [watch for watch in pending.values() if watch.next_poll <= now]
+        if not due:
+            wake = min(watch.next_poll for watch in pending.values())
+            if deadline is not None:
+                wake = min(wake, deadline)
+            time.sleep(max(0.0, wake - now))
+            continue
+        by_site = {} #type: dict[typing.Optional[str], list[_Watch]]
+        for watch in due:
+            site_id = watch.deploy.site_id if watch.deploy is not None else None
+            by_site.setdefault(site_id, []).append(watch)
+        for site_id, group in by_site.items():
+            site_watches = [w for w in pending.values() if w.deploy is not None and w.deploy.site_id == site_id]
+            if site_id is not None and len(site_watches) > 1:
+                listed = {deploy.id: deploy for deploy in client.list_site_deploys(site_id, per_page=100)}
+                # refresh every pending deploy of the site, not only the due ones, since the listing is already paid for
+                for watch in site_watches:
+                    deploy = listed.get(watch.deploy_id)
+                    if deploy is None and watch in group:
+                        deploy = client.get_deploy(watch.deploy_id)
+                    if deploy is not None:
+                        observe(watch, deploy, now)
+            else:
+                for watch in group:
+                    observe(watch, client.get_deploy(watch.deploy_id), now)
+    return finished
+
+def wait_for_deploy(client: Netlify, deploy_id: str, target_states: typing.Iterable[str] = ("ready",), timeout: typing.Optional[float] = 600.0, on_transition: typing.Optional[TransitionCallback] = None, initial_interval: float = 1.0, max_interval: float = 30.0, backoff: float = 1.6, jitter: float = 0.2) -> Deploy:
+    """ Polls a single deploy until it reaches one of target_states or a terminal state; see wait_for_deploys. """
+    return wait_for_deploys(client, [deploy_id], target_states, timeout, on_transition, initial_interval, max_interval, backoff, jitter)[deploy_id]
@@ -0,0 +1,126 @@
+import math
+import typing
+import threading
+
+from .routes import ROUTES
+
+class CallEvent:
+    """ What one endpoint call did, passed to every observer of the client when it returns or raises. """
+    __slots__ = ("operation", "method", "endpoint", "status", "bytes_in", "bytes_out", "retries", "cache", "coalesced", "timings", "duration", "error")
+
+    def __init__(self, operation: str, method: str):
+        self.operation = operation
+        self.method = method
+        self.endpoint = ROUTES.get(operation, (method, operation))[1]
+        self.status = None #type: typing.Optional[int]
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        # None without a ResponseCache, else "hit" (served fresh), "stale" (served while revalidating in the background), "revalidated" (304) or "miss"
+        self.cache = None #type: typing.Optional[str]
+        # answered by an identical call already in flight, doing no work of its own
+        self.coalesced = False
+        # seconds per phase the call went through: wait (rate limiter and retry back-off sleeps), server (until the response headers arrived, connection setup included), download, parse and decode
+        self.timings = {} #type: dict[str, float]
+        self.duration = 0.0
+        self.error = None #type: typing.Optional[BaseException]
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def __repr__(self) -> str:
+        timings = ", ".join(f"{phase}={seconds * 1000:.2f}ms" for phase, seconds in self.timings.items())
+        return f"CallEvent({self.operation} {self.method} {self.endpoint} status={self.status} duration={self.duration * 1000:.2f}ms {timings})"
+
+Observer = typing.Callable[[CallEvent], None]
+
+# log-linear buckets: 8 per doubling from 10us, so a reported percentile is within 9% of the true value
+_BASE = 1e-5
+_PER_DOUBLING = 8
+_BUCKETS = _PER_DOUBLING * 24
+
+def _bucket(seconds: float) -> int:
+    if seconds <= _BASE:
+        return 0
+    return min(_BUCKETS - 1, int(math.log2(seconds / _BASE) * _PER_DOUBLING) + 1)
+
+def _upper_bound(bucket: int) -> float:
+    return _BASE * 2 ** (bucket / _PER_DOUBLING)
+
+class _Series:
+    __slots__ = ("counts", "count", "errors", "total", "max", "phases")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.phases = {} #type: dict[str, float]
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(_upper_bound(bucket), self.max)
+        return self.max
+
+class LatencyHistograms:
+    """ Observer that aggregates call durations into one histogram per endpoint (HTTP method and template) in constant memory. snapshot() returns count, errors, mean, p50/p95/p99, max and mean seconds per phase for each endpoint; dump() formats it as a table and prometheus() in the Prometheus text format for scraping. Thread-safe. """
+    def __init__(self, quantiles: typing.Sequence[float] = (0.5, 0.95, 0.99)):
+        self.quantiles = tuple(quantiles)
+        self._series = {} #type: dict[tuple[str, str], _Series]
+        self._lock = threading.Lock()
+
+    def __call__(self, event: CallEvent) -> None:
+        key = (event.method, event.endpoint)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.counts[_bucket(event.duration)] += 1
+            series.count += 1
+            series.total += event.duration
+            series.max = max(series.max, event.duration)
+            if event.error is not None:
+                series.errors += 1
+            for phase, seconds in event.timings.items():
+                series.phases[phase] = series.phases.get(phase, 0.0) + seconds
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        with self._lock:
+            stats = {}
+            for (method, endpoint), series in sorted(self._series.items(), key=lambda item: item[0][1]):
+                stats[f"{method} {endpoint}"] = {
+                    "count": series.count,
+                    "errors": series.errors,
+                    "mean": series.total / series.count,
+                    **{f"p{q * 100:g}": series.quantile(q) for q in self.quantiles},
+                    "max": series.max,
+                    "phases": {phase: seconds / series.count for phase, seconds in series.phases.items()},
+                }
+            return stats
+
+    def dump(self) -> str:
+        names = [f"p{q * 100:g}" for q in self.quantiles]
+        lines = ["endpoint".ljust(64) + "count".rjust(8) + "errors".rjust(8) + "".join(name.rjust(10) for name in names) + "max".rjust(10)]
+        for endpoint, stats in self.snapshot().items():
+            lines.append(endpoint.ljust(64) + str(stats["count"]).rjust(8) + str(stats["errors"]).rjust(8) + "".join(f"{stats[name] * 1000:8.1f}ms" for name in names) + f"{stats['max'] * 1000:8.1f}ms")
+        return "\n".join(lines)
+
+    def prometheus(self, name: str = "netlify_client_request_duration_seconds") -> str:
+        lines = [f"# TYPE {name} summary"]
+        with self._lock:
+            for (method, endpoint), series in sorted(self._series.items(), key=lambda item: item[0][1]):
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                for q in self.quantiles:
+                    lines.append(f'{name}{{{labels},quantile="{q:g}"}} {series.quantile(q):.6f}')
+                lines.append(f"{name}_sum{{{labels}}} {series.total:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {series.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
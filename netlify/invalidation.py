@@ -0,0 +1,87 @@
+# mutating operation -> cached reads whose entries it evicts, as (read operation, *path parameters that must match)
+# "*" matches every cached operation that has all of the listed path parameters
+INVALIDATES = {
+    "cancel_account": (("list_accounts_for_user",), ("*", "account_id")),
+    "delete_env_var": (("get_env_var", "account_id", "key"), ("get_env_vars", "account_id")),
+    "delete_env_var_value": (("get_env_var", "account_id", "key"), ("get_env_vars", "account_id")),
+    "delete_deploy_key": (("get_deploy_key", "key_id"), ("list_deploy_keys",)),
+    "delete_deploy": (("*", "deploy_id"), ("list_site_deploys",)),
+    "delete_dns_zone": (("get_dns_zones",), ("*", "zone_id"), ("get_dns_for_site",)),
+    "delete_dns_record": (("get_individual_dns_record", "zone_id", "dns_record_id"), ("get_dns_records", "zone_id"), ("get_dns_zone", "zone_id"), ("get_dns_for_site",)),
+    "delete_hook": (("get_hook", "hook_id"), ("list_hooks_by_site_id",)),
+    "delete_site": (("list_sites",), ("*", "site_id"), ("list_sites_for_account",)),
+    "delete_site_asset": (("get_site_asset_info", "site_id", "asset_id"), ("list_site_assets", "site_id")),
+    "delete_site_build_hook": (("get_site_build_hook", "site_id", "id"), ("list_site_build_hooks", "site_id")),
+    "delete_site_deploy": (("get_site_deploy", "site_id", "deploy_id"), ("list_site_deploys", "site_id"), ("*", "deploy_id")),
+    "delete_site_form": (("list_site_forms", "site_id"), ("list_site_submissions", "site_id"), ("list_form_submissions", "form_id")),
+    "delete_service_instance": (("show_service_instance", "site_id", "addon", "instance_id"), ("list_service_instances_for_site", "site_id")),
+    "delete_site_snippet": (("get_site_snippet", "site_id", "snippet_id"), ("list_site_snippets", "site_id")),
+    "delete_submission": (("list_form_submission", "submission_id"), ("list_form_submissions",), ("list_site_submissions",)),
+    "remove_account_member": (("get_account_member", "account_slug", "member_id"), ("list_members_for_account", "account_slug")),
+    "set_env_var_value": (("get_env_vars", "account_id"),),
+    "update_site": (("list_sites",), ("list_sites_for_account",)),
+    "create_account": (("list_accounts_for_user",),),
+    "create_env_vars": (("get_env_vars", "account_id"),),
+    "update_site_build_log": (("get_site_build", "build_id"),),
+    "notify_build_start": (("get_site_build", "build_id"),),
+    "create_deploy_key": (("list_deploy_keys",),),
+    "cancel_site_deploy": (("list_site_deploys",),),
+    "lock_deploy": (("list_site_deploys",),),
+    "unlock_deploy": (("list_site_deploys",),),
+    "create_dns_zone": (("get_dns_zones",), ("get_dns_for_site",)),
+    "create_dns_record": (("get_dns_records", "zone_id"), ("get_dns_zone", "zone_id"), ("get_dns_for_site",)),
+    "create_hook_by_site_id": (("list_hooks_by_site_id",),),
+    "enable_hook": (("list_hooks_by_site_id",),),
+    "create_ticket": (),
+    "exchange_ticket": (("show_ticket", "ticket_id"),),
+    "create_site": (("list_sites",), ("list_sites_for_account",)),
+    "create_site_asset": (("list_site_assets", "site_id"),),
+    "create_site_build_hook": (("list_site_build_hooks", "site_id"),),
+    "create_site_build": (("list_site_builds", "site_id"), ("get_account_build_status",)),
+    "create_site_deploy": (("list_site_deploys", "site_id"),),
+    "restore_site_deploy": (("list_site_deploys", "site_id"), ("get_site", "site_id"), ("list_sites",), ("list_sites_for_account",)),
+    "create_service_instance": (("list_service_instances_for_site", "site_id"),),
+    "create_site_snippet": (("list_site_snippets", "site_id"),),
+    "provision_site_tls_certificate": (("show_site_tls_certificate", "site_id"), ("get_site", "site_id"), ("list_sites",), ("list_sites_for_account",)),
+    "create_split_test": (("get_split_tests", "site_id"),),
+    "enable_split_test": (("get_split_test", "site_id", "split_test_id"), ("get_split_tests", "site_id"), ("get_site", "site_id")),
+    "disable_split_test": (("get_split_test", "site_id", "split_test_id"), ("get_split_tests", "site_id"), ("get_site", "site_id")),
+    "add_member_to_account": (("list_members_for_account", "account_slug"),),
+    "create_site_in_team": (("list_sites_for_account", "account_slug"), ("list_sites",)),
+    "update_account": (("get_account", "account_id"), ("list_accounts_for_user",)),
+    "update_env_var": (("get_env_vars", "account_id"),),
+    "upload_deploy_file": (("get_deploy", "deploy_id"), ("get_site_deploy", "deploy_id")),
+    "upload_deploy_function": (("get_deploy", "deploy_id"), ("get_site_deploy", "deploy_id")),
+    "transfer_dns_zone": (("get_dns_zones",), ("get_dns_for_site",)),
+    "update_hook": (("list_hooks_by_site_id",),),
+    "update_site_asset": (("list_site_assets", "site_id"),),
+    "update_site_build_hook": (("get_site_build_hook", "site_id", "id"), ("list_site_build_hooks", "site_id")),
+    "update_site_deploy": (("list_site_deploys", "site_id"),),
+    "configure_dns_for_site": (("get_dns_for_site", "site_id"), ("get_dns_zones",)),
+    "update_site_metadata": (("get_site_metadata", "site_id"),),
+    "rollback_site_deploy": (("get_site", "site_id"), ("list_sites",), ("list_sites_for_account",), ("list_site_deploys", "site_id")),
+    "update_service_instance": (("show_service_instance", "site_id", "addon", "instance_id"), ("list_service_instances_for_site", "site_id")),
+    "update_site_snippet": (("get_site_snippet", "site_id", "snippet_id"), ("list_site_snippets", "site_id")),
+    "update_split_test": (("get_split_tests", "site_id"),),
+    "unlink_site_repo": (("list_sites",), ("list_sites_for_account",)),
+    "update_account_member": (("list_members_for_account", "account_slug"),),
+} #type: dict[str, tuple[tuple[str, ...], ...]]
+
+# mutating operation -> cached reads whose entries are replaced by the resource it returns
+UPDATES = {
+    "set_env_var_value": (("get_env_var", "account_id", "key"),),
+    "update_site": (("get_site", "site_id"),),
+    "cancel_site_deploy": (("get_deploy", "deploy_id"), ("get_site_deploy", "deploy_id")),
+    "lock_deploy": (("get_deploy", "deploy_id"), ("get_site_deploy", "deploy_id")),
+    "unlock_deploy": (("get_deploy", "deploy_id"), ("get_site_deploy", "deploy_id")),
+    "enable_hook": (("get_hook", "hook_id"),),
+    "restore_site_deploy": (("get_site_deploy", "site_id", "deploy_id"), ("get_deploy", "deploy_id")),
+    "update_env_var": (("get_env_var", "account_id", "key"),),
+    "transfer_dns_zone": (("get_dns_zone", "zone_id"),),
+    "update_hook": (("get_hook", "hook_id"),),
+    "update_site_asset": (("get_site_asset_info", "site_id", "asset_id"),),
+    "update_site_deploy": (("get_site_deploy", "site_id", "deploy_id"), ("get_deploy", "deploy_id")),
+    "update_split_test": (("get_split_test", "site_id", "split_test_id"),),
+    "unlink_site_repo": (("get_site", "site_id"),),
+    "update_account_member": (("get_account_member", "account_slug", "member_id"),),
+} #type: dict[str, tuple[tuple[str, ...], ...]]
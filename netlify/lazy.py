@@ -0,0 +1,71 @@
+import typing
+import threading
+
+from . import custom_types
+from .custom_types import from_optional_list
+
+T = typing.TypeVar("T")
+
+_lazy_classes = {} #type: dict[type, type]
+_lock = threading.Lock()
+
+def _nested_decoder(decode: typing.Any, model: typing.Any) -> typing.Callable[[typing.Any], typing.Any]:
+    if getattr(decode, "func", None) is from_optional_list:
+        def decode_list(x: typing.Any) -> typing.Any:
+            if x is None:
+                return x
+            assert isinstance(x, list)
+            return [lazy_from_dict(model, y) for y in x]
+        return decode_list
+
+    def decode_one(x: typing.Any) -> typing.Any:
+        return None if x is None else lazy_from_dict(model, x)
+    return decode_one
+
+def _field_property(cls: type, attr: str, key: str, decode: typing.Callable[[typing.Any], typing.Any]) -> property:
+    slot = cls.__dict__[attr]
+
+    def getter(self: typing.Any) -> typing.Any:
+        try:
+            return slot.__get__(self, cls)
+        except AttributeError:
+            value = decode(self._raw.get(key))
+            slot.__set__(self, value)
+            return value
+
+    def setter(self: typing.Any, value: typing.Any) -> None:
+        slot.__set__(self, value)
+
+    return property(getter, setter)
+
+def lazy_class(cls: typing.Type[T]) -> typing.Type[T]:
+    """ Returns the lazily decoding subclass of a custom_types model. Each field is a property that decodes and validates the raw value on first access and caches it in the model's own slot. """
+    lazy = _lazy_classes.get(cls)
+    if lazy is not None:
+        return lazy
+    with _lock:
+        lazy = _lazy_classes.get(cls)
+        if lazy is None:
+            namespace = {"__slots__": ("_raw",), "__module__": __name__} #type: dict[str, typing.Any]
+            for attr, key, decode, model in getattr(cls, "_fields"):
+                if model is not None:
+                    decode = _nested_decoder(decode, model)
+                namespace[attr] = _field_property(cls, attr, key, decode)
+            lazy = type("Lazy" + cls.__name__, (cls,), namespace)
+            _lazy_classes[cls] = lazy
+    return lazy
+
+def lazy_from_dict(cls: typing.Type[T], obj: typing.Any) -> T:
+    """ Wraps obj in a lazy instance of cls without decoding any field. Field validation errors surface as AssertionError on first access instead of here. """
+    assert isinstance(obj, dict)
+    instance = object.__new__(lazy_class(cls)) #type: typing.Any
+    instance._raw = obj
+    return instance
+
+def __getattr__(name: str) -> typing.Any:
+    # resolves Lazy<Model> by name so pickled lazy instances can be loaded in a fresh process
+    if name.startswith("Lazy"):
+        model = getattr(custom_types, name[len("Lazy"):], None)
+        if isinstance(model, type) and hasattr(model, "_fields"):
+            return lazy_class(model)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
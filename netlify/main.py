@@ -1,12 +1,161 @@
+from __future__ import annotations
+
+import io
+import os
+import copy
+import time
 import typing
 import json
+import threading
+import collections
 import requests
-from urllib.parse import urljoin
-
-from .custom_types import *
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from . import custom_types
+from .cache import CacheEntry, ResponseCache
+from .codec import JSONCodec, default_codec
+from .instrument import CallEvent, Observer
+from .columnar import ColumnarList
+from .lazy import lazy_from_dict
+from .ratelimit import RateLimiter, should_retry
+from .routes import compile_routes
+from .singleflight import SingleFlight
+
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .custom_types import *
+
+__all__ = ["Netlify", "RequestError", "JSONType", "UploadBody", "Timeout", "DECODE_MODES", *custom_types.__all__]
+
+def __getattr__(name: str) -> typing.Any:
+    # the model names used to be star-imported here; keep netlify.main.<Model> working without loading them at import
+    if name in custom_types.__all__:
+        return getattr(custom_types, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 JSONType = typing.Union[str, int, float, bool, None, typing.Dict[str, typing.Any], typing.List[typing.Any]]
 
+def _page_number(url: str) -> typing.Optional[int]:
+    for key, value in parse_qsl(urlparse(url).query):
+        if key == "page":
+            return int(value)
+    return None
+
+def _with_page(url: str, page: int) -> str:
+    parts = urlparse(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+    query.append(("page", str(page)))
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+UploadBody = typing.Union[str, bytes, bytearray, memoryview, typing.BinaryIO, "os.PathLike[str]"]
+
+def _remaining_size(f: typing.Any) -> typing.Optional[int]:
+    try:
+        return os.fstat(f.fileno()).st_size - f.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    try:
+        position = f.tell()
+        end = f.seek(0, io.SEEK_END)
+        f.seek(position)
+        return end - position
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+class _BinaryBody:
+    """ Streams an upload body (bytes-like, binary file object or path) in chunks. len() reports the body size so it is sent with a Content-Length header rather than chunked. """
+    def __init__(self, source: typing.Any, size: typing.Optional[int] = None, chunk_size: int = 1 << 16):
+        self._owned = None #type: typing.Optional[typing.BinaryIO]
+        if isinstance(source, os.PathLike):
+            source = self._owned = open(source, "rb")
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._view = memoryview(source).cast("B") #type: typing.Optional[memoryview]
+            self._file = None
+            detected = self._view.nbytes #type: typing.Optional[int]
+        else:
+            self._view = None
+            self._file = source
+            detected = _remaining_size(source)
+        if size is None and detected is None:
+            raise ValueError("size is required when uploading from an unsized stream")
+        self.size = size if size is not None else typing.cast(int, detected)
+        self.chunk_size = chunk_size
+        self._offset = 0
+        self._start = None #type: typing.Optional[int]
+        if self._file is not None:
+            try:
+                self._start = self._file.tell()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+
+    def __len__(self) -> int:
+        return self.size
+
+    def read(self, n: typing.Optional[int] = -1) -> bytes:
+        # never past size, so a file longer than the declared size cannot send more than Content-Length promises
+        remaining = self.size - self._offset
+        if n is None or n < 0 or n > remaining:
+            n = remaining
+        if self._view is not None:
+            chunk = self._view[self._offset:self._offset + n].tobytes()
+        else:
+            chunk = typing.cast(typing.BinaryIO, self._file).read(n)
+        self._offset += len(chunk)
+        return chunk
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    async def aiter_chunks(self) -> typing.AsyncIterator[bytes]:
+        # imported here so that only the async client pays for loading asyncio
+        import asyncio
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._view is None:
+                chunk = await loop.run_in_executor(None, self.read, self.chunk_size)
+            else:
+                chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def rewind(self) -> bool:
+        """ Resets the body to its first byte so a request can be retried; False when the source cannot seek. """
+        if self._view is not None:
+            self._offset = 0
+            return True
+        if self._file is None or self._start is None:
+            return False
+        try:
+            self._file.seek(self._start)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+        self._offset = 0
+        return True
+
+    def close(self) -> None:
+        if self._owned is not None:
+            self._owned.close()
+
+    def __enter__(self) -> "_BinaryBody":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+DECODE_MODES = ("models", "dicts", "bytes", "columns")
+
+def _check_decode(decode: str) -> str:
+    if decode not in DECODE_MODES:
+        raise ValueError(f"decode must be one of {', '.join(DECODE_MODES)}, got {decode!r}")
+    return decode
+
 class RequestError(Exception):
     def __init__(self, status_code: int, method: str, url: str, message: str):
         super().__init__(f"received {status_code} from {method.upper()} {url}")
@@ -18,13 +167,28 @@ class RequestError(Exception):
         except:
             self.data = message
 
-class Netlify:
-    def __init__(self, token: typing.Optional[str] = None, base_url: typing.Optional[str] = None):
-        url = base_url or "https://api.netlify.com/api/v1"
-        self.base_url = url        
-        self.session = requests.Session()
-        if token:
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
+Timeout = typing.Union[None, float, typing.Tuple[float, float]]
+
+class _ClientBase:
+    """ Decoding, encoding and observer notification shared by Netlify and AsyncNetlify, independent of the HTTP transport. """
+    lazy: bool
+    decode: str
+    codec: JSONCodec
+    observers: typing.List[Observer]
+
+    def _observe(self, event: CallEvent, start: float, error: typing.Optional[BaseException] = None) -> None:
+        if error is not None:
+            event.error = error
+            if isinstance(error, RequestError):
+                event.status = error.status_code
+        event.duration = time.perf_counter() - start
+        for observer in self.observers:
+            observer(event)
+
+    def _cast(self, obj, target_class):
+        if self.lazy:
+            return lazy_from_dict(target_class, obj)
+        return target_class.from_dict(obj)
 
     def _cast_list(self, input_list, target_class):
         casted = []
@@ -32,12 +196,35 @@ class Netlify:
             if isinstance(el, list):
                 casted.append(self._cast_list(el, target_class))
             else:
-                casted.append(target_class.from_dict(el))
+                casted.append(self._cast(el, target_class))
         return casted
 
-    def _raise_exception(self, response: requests.models.Response) -> typing.Any:
-        method = response.request.method or "unknown"
-        raise RequestError(response.status_code, method, response.url, response.text)
+    def _page_results(self, items: typing.List[typing.Any], target_class: typing.Any) -> typing.Iterable[typing.Any]:
+        if self.decode == "models":
+            return (self._cast(el, target_class) for el in items)
+        if self.decode == "columns":
+            return [ColumnarList.from_dicts(target_class, items)]
+        return items
+
+    def _decode_content(self, content: bytes, target_class: typing.Any = None, many: bool = False, event: typing.Optional[CallEvent] = None) -> typing.Any:
+        if self.decode == "bytes":
+            return content
+        if event is None:
+            return self._build_result(self.codec.loads(content), target_class, many)
+        start = time.perf_counter()
+        response = self.codec.loads(content)
+        parsed = time.perf_counter()
+        event.add("parse", parsed - start)
+        result = self._build_result(response, target_class, many)
+        event.add("decode", time.perf_counter() - parsed)
+        return result
+
+    def _build_result(self, response: typing.Any, target_class: typing.Any, many: bool) -> typing.Any:
+        if target_class is None or self.decode == "dicts":
+            return response
+        if many and self.decode == "columns":
+            return ColumnarList.from_dicts(target_class, response)
+        return self._cast_list(response, target_class) if many else self._cast(response, target_class)
 
     def _to_json_encodable(self, target: typing.Any) -> JSONType:
         if isinstance(target, list):
@@ -49,232 +236,362 @@ class Netlify:
 
         return target
 
+class Netlify(_ClientBase):
+    """ Synchronous Netlify API client; one instance is safe to share between threads. """
+    def __init__(
+        self,
+        token: typing.Optional[str] = None,
+        base_url: typing.Optional[str] = None,  # fixed at construction: routes is compiled from it, keeping its path (such as /api/v1)
+        max_retries: int = 3,  # retries of HTTP 429/5xx responses, paced by rate_limiter
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        pool_connections: int = 10,  # hosts whose connections are kept
+        pool_maxsize: int = 10,  # connections kept alive per host
+        pool_block: bool = False,  # wait for a free connection instead of opening throwaway ones beyond pool_maxsize
+        timeout: Timeout = None,  # seconds, or a (connect, read) pair, for every call
+        transport_retries: typing.Union[int, Retry] = 0,  # urllib3 retry policy for connection-level failures
+        lazy: bool = False,  # models keep the raw JSON and decode each field (and nested model) on first access
+        decode: str = "models",  # "models", "dicts" (parsed JSON), "bytes" (raw body; one per page for iter_*) or "columns" (list results as ColumnarList)
+        codec: typing.Optional[JSONCodec] = None,  # encodes request bodies and parses responses; orjson when installed, else the standard library
+        cache: typing.Optional[ResponseCache] = None,  # serves and revalidates GET responses; see ResponseCache
+        coalesce: bool = False,  # concurrent identical GETs share one request and its (read-only) result
+        observers: typing.Optional[typing.Iterable[Observer]] = None,  # called with a netlify.instrument.CallEvent after every call, e.g. LatencyHistograms
+    ):
+        url = base_url or "https://api.netlify.com/api/v1"
+        self.base_url = url        
+        self.routes = compile_routes(url)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, max_retries=transport_retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = timeout
+        self.lazy = lazy
+        self.decode = _check_decode(decode)
+        self.codec = codec or default_codec()
+        # the Content-Type of JSON request bodies, built once instead of per call
+        self._json_headers = {"Content-Type": self.codec.content_type}
+        self.cache = cache
+        self.observers = list(observers or ())
+        self.single_flight = SingleFlight() if coalesce else None
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        if token:
+            self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+    def _request(self, method: str, url: str, event: typing.Optional[CallEvent] = None, **kwargs: typing.Any) -> requests.models.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        json_data = kwargs.pop("json", None)
+        if json_data is not None:
+            kwargs["data"] = self.codec.dumps(json_data)
+            headers = kwargs.get("headers")
+            kwargs["headers"] = {**headers, **self._json_headers} if headers else self._json_headers
+        body = kwargs.get("data")
+        attempt = 0
+        while True:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            start = time.perf_counter()
+            raw_response = self.session.request(method, url, **kwargs)
+            if event is not None:
+                # elapsed stops when the headers are parsed; the body is read after it
+                total = time.perf_counter() - start
+                server = min(raw_response.elapsed.total_seconds(), total)
+                event.add("wait", delay)
+                event.add("server", server)
+                event.add("download", total - server)
+            self.rate_limiter.update(raw_response.status_code, raw_response.headers)
+            if attempt >= self.max_retries or not should_retry(method, raw_response.status_code) or (isinstance(body, _BinaryBody) and not body.rewind()):
+                if event is not None:
+                    event.status = raw_response.status_code
+                    event.retries = attempt
+                    event.bytes_in = len(raw_response.content)
+                    event.bytes_out = len(body) if body is not None else 0
+                return raw_response
+            retry_delay = self.rate_limiter.retry_delay(raw_response.headers, attempt)
+            if event is not None:
+                event.add("wait", retry_delay)
+            time.sleep(retry_delay)
+            attempt += 1
+
+    def _call(self, operation: str, method: str, url: str, target_class: typing.Any = None, many: bool = False, path_args: typing.Tuple[typing.Any, ...] = (), **kwargs: typing.Any) -> typing.Any:
+        if not self.observers:
+            return self._dispatch(operation, method, url, target_class, many, None, path_args, **kwargs)
+        event = CallEvent(operation, method)
+        start = time.perf_counter()
+        try:
+            result = self._dispatch(operation, method, url, target_class, many, event, path_args, **kwargs)
+        except BaseException as e:
+            self._observe(event, start, e)
+            raise
+        self._observe(event, start)
+        return result
+
+    def _dispatch(self, operation: str, method: str, url: str, target_class: typing.Any, many: bool, event: typing.Optional[CallEvent], path_args: typing.Tuple[typing.Any, ...], **kwargs: typing.Any) -> typing.Any:
+        if self.single_flight is None or method != "GET":
+            return self._perform(operation, method, url, target_class, many, event, path_args, **kwargs)
+        params = kwargs.get("params")
+        key = (url, urlencode(sorted(params.items()), doseq=True) if params else "", self.session.headers.get("Authorization"), self.decode, self.lazy, target_class, many)
+        leader = [] #type: list[bool]
+
+        def perform() -> typing.Any:
+            leader.append(True)
+            return self._perform(operation, method, url, target_class, many, event, path_args, **kwargs)
+
+        result = self.single_flight.do(key, perform)
+        if event is not None and not leader:
+            event.coalesced = True
+        return result
+
+    def _perform(self, operation: str, method: str, url: str, target_class: typing.Any, many: bool, event: typing.Optional[CallEvent], path_args: typing.Tuple[typing.Any, ...], **kwargs: typing.Any) -> typing.Any:
+        cache = self.cache
+        if cache is None or (method == "GET" and not cache.enabled_for(operation)):
+            return self._decode(self._request(method, url, event=event, **kwargs), target_class, many, event)
+        # invalidation rules and stored entries name path arguments too, which are not part of the query
+        arguments = self.routes[operation].arguments(path_args, kwargs.get("params"))
+        if method != "GET":
+            try:
+                raw_response = self._request(method, url, event=event, **kwargs)
+                result = self._decode(raw_response, target_class, many, event)
+            except BaseException:
+                cache.invalidate(operation, arguments)
+                raise
+            cache.write_through(operation, arguments, raw_response.content, raw_response.headers, (self.decode, self.lazy, target_class, many), result, self.session.headers.get("Authorization"))
+            return result
+        key = cache.key(url, kwargs.get("params"), self.session.headers.get("Authorization"))
+        entry, fresh = cache.lookup(key)
+        if event is not None:
+            event.cache = "hit"
+        if not fresh:
+            if entry is not None and cache.serves_stale(entry):
+                if event is not None:
+                    event.cache = "stale"
+                if cache.claim_revalidation(entry):
+                    threading.Thread(target=self._revalidate_in_background, args=(cache, key, operation, entry, url, arguments, kwargs), daemon=True).start()
+            else:
+                entry, raw_response = self._revalidate(cache, key, operation, entry, url, arguments, kwargs, event)
+                if entry is None:
+                    return self._decode(raw_response, target_class, many, event)
+        # lookup only reports fresh for an entry it found
+        assert entry is not None
+        return entry.result((self.decode, self.lazy, target_class, many), lambda content: self._decode_content(content, target_class, many, event))
+
+    def _revalidate(self, cache: ResponseCache, key: str, operation: str, entry: typing.Optional[CacheEntry], url: str, arguments: typing.Dict[str, typing.Any], kwargs: typing.Dict[str, typing.Any], event: typing.Optional[CallEvent] = None) -> typing.Tuple[typing.Optional[CacheEntry], typing.Any]:
+        headers = entry.validators() if entry is not None else {}
+        raw_response = self._request("GET", url, headers=headers, event=event, **kwargs)
+        revalidated = entry is not None and raw_response.status_code == 304
+        if event is not None:
+            event.cache = "revalidated" if revalidated else "miss"
+        if entry is not None and revalidated:
+            cache.refresh(key, entry, raw_response.headers)
+            return entry, raw_response
+        entry = cache.store(key, operation, arguments, raw_response.content, raw_response.headers) if raw_response.status_code == 200 else None
+        if entry is None:
+            cache.discard(key)
+        return entry, raw_response
+
+    def _revalidate_in_background(self, cache: ResponseCache, key: str, operation: str, entry: CacheEntry, url: str, arguments: typing.Dict[str, typing.Any], kwargs: typing.Dict[str, typing.Any]) -> None:
+        try:
+            self._revalidate(cache, key, operation, entry, url, arguments, kwargs)
+        except Exception:
+            # the stale entry stays in place and the next read that finds it tries again
+            pass
+        finally:
+            cache.release(entry)
+
+    def _fetch_page(self, operation: str, url: str, params: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Tuple[typing.Any, requests.models.Response]:
+        # each page is a call of the list operation the iterator walks, as far as observers are concerned
+        if not self.observers:
+            return self._load_page(url, params)
+        event = CallEvent(operation, "GET")
+        start = time.perf_counter()
+        try:
+            page = self._load_page(url, params, event)
+        except BaseException as e:
+            self._observe(event, start, e)
+            raise
+        self._observe(event, start)
+        return page
+
+    def _load_page(self, url: str, params: typing.Optional[typing.Dict[str, typing.Any]], event: typing.Optional[CallEvent] = None) -> typing.Tuple[typing.Any, requests.models.Response]:
+        raw_response = self._request("GET", url, event=event, params=params)
+        if not raw_response.ok:
+            self._raise_exception(raw_response)
+        if self.decode == "bytes":
+            return [raw_response.content], raw_response
+        start = time.perf_counter()
+        items = self.codec.loads(raw_response.content)
+        if event is not None:
+            event.add("parse", time.perf_counter() - start)
+        return items, raw_response
+
+    def _paginate(self, operation: str, url: str, params: typing.Dict[str, typing.Any], target_class: typing.Any, prefetch: int = 0) -> typing.Iterator[typing.Any]:
+        response, raw_response = self._fetch_page(operation, url, params)
+        last = raw_response.links.get("last", {}).get("url")
+        if prefetch > 0 and last:
+            yield from self._paginate_prefetch(operation, response, raw_response.url, last, target_class, prefetch)
+            return
+        while True:
+            yield from self._page_results(response, target_class)
+            # the next link already carries the full query string
+            next_url = raw_response.links.get("next", {}).get("url")
+            if not response or not next_url:
+                return
+            response, raw_response = self._fetch_page(operation, next_url)
+
+    def _paginate_prefetch(self, operation: str, first_page: typing.Any, first_url: str, last_url: str, target_class: typing.Any, prefetch: int) -> typing.Iterator[typing.Any]:
+        current = _page_number(first_url) or 1
+        last = _page_number(last_url) or current
+        from concurrent.futures import ThreadPoolExecutor
+        pending = collections.deque() #type: collections.deque[Future]
+        pool = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            page = current + 1
+            while page <= last and len(pending) < prefetch:
+                pending.append(pool.submit(self._fetch_page, operation, _with_page(last_url, page)))
+                page += 1
+            response = first_page
+            while True:
+                yield from self._page_results(response, target_class)
+                if not pending:
+                    return
+                response, _ = pending.popleft().result()
+                if page <= last:
+                    pending.append(pool.submit(self._fetch_page, operation, _with_page(last_url, page)))
+                    page += 1
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _decode(self, raw_response: typing.Any, target_class: typing.Any = None, many: bool = False, event: typing.Optional[CallEvent] = None) -> typing.Any:
+        if not raw_response.ok:
+            self._raise_exception(raw_response)
+        return self._decode_content(raw_response.content, target_class, many, event)
+
+    def _raise_exception(self, response: requests.models.Response) -> typing.Any:
+        method = response.request.method or "unknown"
+        raise RequestError(response.status_code, method, response.url, response.text)
+
+    def with_decode(self, decode: str) -> "Netlify":
+        """ A client sharing this one's connections that decodes responses as decode. """
+        client = copy.copy(self)
+        client.decode = _check_decode(decode)
+        return client
+
     def with_token(self, token: str) -> None:
+        """ Changes the token of the shared session; call it before the instance is shared. """
         self.session.headers.update({"Authorization": f"Bearer {token}"})
 
     def cancel_account(self, account_id: str) -> typing.Any:
         """  """
-        endpoint = f"/accounts/{account_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["cancel_account"].url(account_id)
+        return self._call("cancel_account", "DELETE", url, path_args=(account_id,))
 
     def delete_env_var(self, account_id: str, key: str, site_id: typing.Optional[str] = None) -> typing.Any:
         """ Deletes an environment variable. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env/{key}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["delete_env_var"].url(account_id, key)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        params["key"] = key
         if site_id is not None:
             params["site_id"] = site_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        return self._call("delete_env_var", "DELETE", url, path_args=(account_id, key), params=params)
 
     def delete_env_var_value(self, account_id: str, key: str, id: str, site_id: typing.Optional[str] = None) -> typing.Any:
         """ Deletes a specific environment variable value. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env/{key}/value/{id}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["delete_env_var_value"].url(account_id, key, id)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        params["key"] = key
-        params["id"] = id
         if site_id is not None:
             params["site_id"] = site_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        return self._call("delete_env_var_value", "DELETE", url, path_args=(account_id, key, id), params=params)
 
     def delete_deploy_key(self, key_id: str) -> typing.Any:
         """  """
-        endpoint = f"/deploy_keys/{key_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["key_id"] = key_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_deploy_key"].url(key_id)
+        return self._call("delete_deploy_key", "DELETE", url, path_args=(key_id,))
 
     def delete_deploy(self, deploy_id: str) -> typing.Any:
         """  """
-        endpoint = f"/deploys/{deploy_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_deploy"].url(deploy_id)
+        return self._call("delete_deploy", "DELETE", url, path_args=(deploy_id,))
 
     def delete_dns_zone(self, zone_id: str) -> typing.Any:
         """  """
-        endpoint = f"/dns_zones/{zone_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_dns_zone"].url(zone_id)
+        return self._call("delete_dns_zone", "DELETE", url, path_args=(zone_id,))
 
     def delete_dns_record(self, zone_id: str, dns_record_id: str) -> typing.Any:
         """  """
-        endpoint = f"/dns_zones/{zone_id}/dns_records/{dns_record_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
-        params["dns_record_id"] = dns_record_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_dns_record"].url(zone_id, dns_record_id)
+        return self._call("delete_dns_record", "DELETE", url, path_args=(zone_id, dns_record_id))
 
     def delete_hook(self, hook_id: str) -> typing.Any:
         """  """
-        endpoint = f"/hooks/{hook_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["hook_id"] = hook_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_hook"].url(hook_id)
+        return self._call("delete_hook", "DELETE", url, path_args=(hook_id,))
 
     def delete_site(self, site_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_site"].url(site_id)
+        return self._call("delete_site", "DELETE", url, path_args=(site_id,))
 
     def delete_site_asset(self, site_id: str, asset_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/assets/{asset_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["asset_id"] = asset_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_site_asset"].url(site_id, asset_id)
+        return self._call("delete_site_asset", "DELETE", url, path_args=(site_id, asset_id))
 
     def delete_site_build_hook(self, site_id: str, id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/build_hooks/{id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["id"] = id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_site_build_hook"].url(site_id, id)
+        return self._call("delete_site_build_hook", "DELETE", url, path_args=(site_id, id))
 
     def delete_site_deploy(self, site_id: str, deploy_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/deploys/{deploy_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_site_deploy"].url(site_id, deploy_id)
+        return self._call("delete_site_deploy", "DELETE", url, path_args=(site_id, deploy_id))
 
     def delete_site_form(self, site_id: str, form_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/forms/{form_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["form_id"] = form_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_site_form"].url(site_id, form_id)
+        return self._call("delete_site_form", "DELETE", url, path_args=(site_id, form_id))
 
     def delete_service_instance(self, site_id: str, addon: str, instance_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/services/{addon}/instances/{instance_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["addon"] = addon
-        params["instance_id"] = instance_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_service_instance"].url(site_id, addon, instance_id)
+        return self._call("delete_service_instance", "DELETE", url, path_args=(site_id, addon, instance_id))
 
     def delete_site_snippet(self, site_id: str, snippet_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/snippets/{snippet_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["snippet_id"] = snippet_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_site_snippet"].url(site_id, snippet_id)
+        return self._call("delete_site_snippet", "DELETE", url, path_args=(site_id, snippet_id))
 
     def delete_submission(self, submission_id: str) -> typing.Any:
         """  """
-        endpoint = f"/submissions/{submission_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["submission_id"] = submission_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["delete_submission"].url(submission_id)
+        return self._call("delete_submission", "DELETE", url, path_args=(submission_id,))
 
     def remove_account_member(self, account_slug: str, member_id: str) -> typing.Any:
         """  """
-        endpoint = f"/{account_slug}/members/{member_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
-        params["member_id"] = member_id
-        raw_response = self.session.delete(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["remove_account_member"].url(account_slug, member_id)
+        return self._call("remove_account_member", "DELETE", url, path_args=(account_slug, member_id))
 
     def list_accounts_for_user(self) -> typing.List[AccountMembership]:
         """  """
-        endpoint = f"/accounts"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, AccountMembership)
-        return response
+        url = self.routes["list_accounts_for_user"].url()
+        return self._call("list_accounts_for_user", "GET", url, custom_types.AccountMembership, many=True)
 
     def list_account_types_for_user(self) -> typing.List[AccountType]:
         """  """
-        endpoint = f"/accounts/types"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, AccountType)
-        return response
+        url = self.routes["list_account_types_for_user"].url()
+        return self._call("list_account_types_for_user", "GET", url, custom_types.AccountType, many=True)
 
     def get_account(self, account_id: str) -> typing.List[AccountMembership]:
         """  """
-        endpoint = f"/accounts/{account_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, AccountMembership)
-        return response
+        url = self.routes["get_account"].url(account_id)
+        return self._call("get_account", "GET", url, custom_types.AccountMembership, many=True, path_args=(account_id,))
 
     def list_account_audit_events(self, account_id: str, log_type: typing.Optional[str] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None, query: typing.Optional[str] = None) -> typing.List[AuditLog]:
         """  """
-        endpoint = f"/accounts/{account_id}/audit"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_account_audit_events"].url(account_id)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
         if log_type is not None:
             params["log_type"] = log_type
         if page is not None:
@@ -283,236 +600,149 @@ class Netlify:
             params["per_page"] = per_page
         if query is not None:
             params["query"] = query
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, AuditLog)
-        return response
+        return self._call("list_account_audit_events", "GET", url, custom_types.AuditLog, many=True, path_args=(account_id,), params=params)
+
+    def iter_account_audit_events(self, account_id: str, log_type: typing.Optional[str] = None, per_page: typing.Optional[int] = None, query: typing.Optional[str] = None, prefetch: int = 0) -> typing.Iterator[AuditLog]:
+        """ Yields every result of list_account_audit_events one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_account_audit_events"].url(account_id)
+        params = {} #type: dict[str, typing.Any]
+        if log_type is not None:
+            params["log_type"] = log_type
+        if per_page is not None:
+            params["per_page"] = per_page
+        if query is not None:
+            params["query"] = query
+        return self._paginate("list_account_audit_events", url, params, custom_types.AuditLog, prefetch)
 
     def get_env_vars(self, account_id: str, context_name: typing.Optional[str] = None, scope: typing.Optional[str] = None, site_id: typing.Optional[str] = None) -> typing.List[EnvVar]:
         """ Returns all environment variables for an account or site. An account corresponds to a team in the Netlify UI. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["get_env_vars"].url(account_id)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
         if context_name is not None:
             params["context_name"] = context_name
         if scope is not None:
             params["scope"] = scope
         if site_id is not None:
             params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, EnvVar)
-        return response
+        return self._call("get_env_vars", "GET", url, custom_types.EnvVar, many=True, path_args=(account_id,), params=params)
 
     def get_env_var(self, account_id: str, key: str, site_id: typing.Optional[str] = None) -> EnvVar:
         """ Returns an individual environment variable. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env/{key}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["get_env_var"].url(account_id, key)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        params["key"] = key
         if site_id is not None:
             params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = EnvVar.from_dict(response)
-        return response
+        return self._call("get_env_var", "GET", url, custom_types.EnvVar, path_args=(account_id, key), params=params)
 
     def list_payment_methods_for_user(self) -> typing.List[PaymentMethod]:
         """  """
-        endpoint = f"/billing/payment_methods"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, PaymentMethod)
-        return response
+        url = self.routes["list_payment_methods_for_user"].url()
+        return self._call("list_payment_methods_for_user", "GET", url, custom_types.PaymentMethod, many=True)
 
     def get_site_build(self, build_id: str) -> Build:
         """  """
-        endpoint = f"/builds/{build_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["build_id"] = build_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Build.from_dict(response)
-        return response
+        url = self.routes["get_site_build"].url(build_id)
+        return self._call("get_site_build", "GET", url, custom_types.Build, path_args=(build_id,))
 
     def list_deploy_keys(self) -> typing.List[DeployKey]:
         """  """
-        endpoint = f"/deploy_keys"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, DeployKey)
-        return response
+        url = self.routes["list_deploy_keys"].url()
+        return self._call("list_deploy_keys", "GET", url, custom_types.DeployKey, many=True)
 
     def get_deploy_key(self, key_id: str) -> DeployKey:
         """  """
-        endpoint = f"/deploy_keys/{key_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["key_id"] = key_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DeployKey.from_dict(response)
-        return response
+        url = self.routes["get_deploy_key"].url(key_id)
+        return self._call("get_deploy_key", "GET", url, custom_types.DeployKey, path_args=(key_id,))
 
     def get_deploy(self, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/deploys/{deploy_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        url = self.routes["get_deploy"].url(deploy_id)
+        return self._call("get_deploy", "GET", url, custom_types.Deploy, path_args=(deploy_id,))
 
     def get_dns_zones(self, account_slug: typing.Optional[str] = None) -> typing.List[DNSZone]:
         """  """
-        endpoint = f"/dns_zones"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["get_dns_zones"].url()
         params = {} #type: dict[str, typing.Any]
         if account_slug is not None:
             params["account_slug"] = account_slug
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, DNSZone)
-        return response
+        return self._call("get_dns_zones", "GET", url, custom_types.DNSZone, many=True, params=params)
 
     def get_dns_zone(self, zone_id: str) -> DNSZone:
         """  """
-        endpoint = f"/dns_zones/{zone_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DNSZone.from_dict(response)
-        return response
+        url = self.routes["get_dns_zone"].url(zone_id)
+        return self._call("get_dns_zone", "GET", url, custom_types.DNSZone, path_args=(zone_id,))
 
     def get_dns_records(self, zone_id: str) -> typing.List[DNSRecord]:
         """  """
-        endpoint = f"/dns_zones/{zone_id}/dns_records"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, DNSRecord)
-        return response
+        url = self.routes["get_dns_records"].url(zone_id)
+        return self._call("get_dns_records", "GET", url, custom_types.DNSRecord, many=True, path_args=(zone_id,))
 
     def get_individual_dns_record(self, zone_id: str, dns_record_id: str) -> DNSRecord:
         """  """
-        endpoint = f"/dns_zones/{zone_id}/dns_records/{dns_record_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
-        params["dns_record_id"] = dns_record_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DNSRecord.from_dict(response)
-        return response
+        url = self.routes["get_individual_dns_record"].url(zone_id, dns_record_id)
+        return self._call("get_individual_dns_record", "GET", url, custom_types.DNSRecord, path_args=(zone_id, dns_record_id))
 
     def list_form_submissions(self, form_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Submission]:
         """  """
-        endpoint = f"/forms/{form_id}/submissions"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_form_submissions"].url(form_id)
         params = {} #type: dict[str, typing.Any]
-        params["form_id"] = form_id
         if page is not None:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Submission)
-        return response
+        return self._call("list_form_submissions", "GET", url, custom_types.Submission, many=True, path_args=(form_id,), params=params)
+
+    def iter_form_submissions(self, form_id: str, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.Iterator[Submission]:
+        """ Yields every result of list_form_submissions one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_form_submissions"].url(form_id)
+        params = {} #type: dict[str, typing.Any]
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_form_submissions", url, params, custom_types.Submission, prefetch)
 
     def list_hooks_by_site_id(self, site_id: str) -> typing.List[Hook]:
         """  """
-        endpoint = f"/hooks"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_hooks_by_site_id"].url()
         params = {} #type: dict[str, typing.Any]
         params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Hook)
-        return response
+        return self._call("list_hooks_by_site_id", "GET", url, custom_types.Hook, many=True, params=params)
 
     def list_hook_types(self) -> typing.List[HookType]:
         """  """
-        endpoint = f"/hooks/types"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, HookType)
-        return response
+        url = self.routes["list_hook_types"].url()
+        return self._call("list_hook_types", "GET", url, custom_types.HookType, many=True)
 
     def get_hook(self, hook_id: str) -> Hook:
         """  """
-        endpoint = f"/hooks/{hook_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["hook_id"] = hook_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Hook.from_dict(response)
-        return response
+        url = self.routes["get_hook"].url(hook_id)
+        return self._call("get_hook", "GET", url, custom_types.Hook, path_args=(hook_id,))
 
     def show_ticket(self, ticket_id: str) -> Ticket:
         """  """
-        endpoint = f"/oauth/tickets/{ticket_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["ticket_id"] = ticket_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Ticket.from_dict(response)
-        return response
+        url = self.routes["show_ticket"].url(ticket_id)
+        return self._call("show_ticket", "GET", url, custom_types.Ticket, path_args=(ticket_id,))
 
     def get_services(self, search: typing.Optional[str] = None) -> typing.List[Service]:
         """  """
-        endpoint = f"/services/"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["get_services"].url()
         params = {} #type: dict[str, typing.Any]
         if search is not None:
             params["search"] = search
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Service)
-        return response
+        return self._call("get_services", "GET", url, custom_types.Service, many=True, params=params)
 
     def show_service(self, addon_name: str) -> Service:
         """  """
-        endpoint = f"/services/{addon_name}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["addon_name"] = addon_name
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Service.from_dict(response)
-        return response
+        url = self.routes["show_service"].url(addon_name)
+        return self._call("show_service", "GET", url, custom_types.Service, path_args=(addon_name,))
 
     def show_service_manifest(self, addon_name: str) -> typing.Any:
         """  """
-        endpoint = f"/services/{addon_name}/manifest"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["addon_name"] = addon_name
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["show_service_manifest"].url(addon_name)
+        return self._call("show_service_manifest", "GET", url, path_args=(addon_name,))
 
     def list_sites(self, filter: typing.Optional[str] = None, name: typing.Optional[str] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Site]:
         """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables. """
-        endpoint = f"/sites"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_sites"].url()
         params = {} #type: dict[str, typing.Any]
         if filter is not None:
             params["filter"] = filter
@@ -522,112 +752,77 @@ class Netlify:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Site)
-        return response
+        return self._call("list_sites", "GET", url, custom_types.Site, many=True, params=params)
+
+    def iter_sites(self, filter: typing.Optional[str] = None, name: typing.Optional[str] = None, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.Iterator[Site]:
+        """ Yields every result of list_sites one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_sites"].url()
+        params = {} #type: dict[str, typing.Any]
+        if filter is not None:
+            params["filter"] = filter
+        if name is not None:
+            params["name"] = name
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_sites", url, params, custom_types.Site, prefetch)
 
     def get_site(self, site_id: str) -> Site:
         """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables. """
-        endpoint = f"/sites/{site_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Site.from_dict(response)
-        return response
+        url = self.routes["get_site"].url(site_id)
+        return self._call("get_site", "GET", url, custom_types.Site, path_args=(site_id,))
 
     def list_site_assets(self, site_id: str) -> typing.List[Asset]:
         """  """
-        endpoint = f"/sites/{site_id}/assets"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Asset)
-        return response
+        url = self.routes["list_site_assets"].url(site_id)
+        return self._call("list_site_assets", "GET", url, custom_types.Asset, many=True, path_args=(site_id,))
 
     def get_site_asset_info(self, site_id: str, asset_id: str) -> Asset:
         """  """
-        endpoint = f"/sites/{site_id}/assets/{asset_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["asset_id"] = asset_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Asset.from_dict(response)
-        return response
+        url = self.routes["get_site_asset_info"].url(site_id, asset_id)
+        return self._call("get_site_asset_info", "GET", url, custom_types.Asset, path_args=(site_id, asset_id))
 
     def get_site_asset_public_signature(self, site_id: str, asset_id: str) -> AssetPublicSignature:
         """  """
-        endpoint = f"/sites/{site_id}/assets/{asset_id}/public_signature"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["asset_id"] = asset_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = AssetPublicSignature.from_dict(response)
-        return response
+        url = self.routes["get_site_asset_public_signature"].url(site_id, asset_id)
+        return self._call("get_site_asset_public_signature", "GET", url, custom_types.AssetPublicSignature, path_args=(site_id, asset_id))
 
     def list_site_build_hooks(self, site_id: str) -> typing.List[BuildHook]:
         """  """
-        endpoint = f"/sites/{site_id}/build_hooks"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, BuildHook)
-        return response
+        url = self.routes["list_site_build_hooks"].url(site_id)
+        return self._call("list_site_build_hooks", "GET", url, custom_types.BuildHook, many=True, path_args=(site_id,))
 
     def get_site_build_hook(self, site_id: str, id: str) -> BuildHook:
         """  """
-        endpoint = f"/sites/{site_id}/build_hooks/{id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["id"] = id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = BuildHook.from_dict(response)
-        return response
+        url = self.routes["get_site_build_hook"].url(site_id, id)
+        return self._call("get_site_build_hook", "GET", url, custom_types.BuildHook, path_args=(site_id, id))
 
     def list_site_builds(self, site_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Build]:
         """  """
-        endpoint = f"/sites/{site_id}/builds"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_site_builds"].url(site_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
         if page is not None:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Build)
-        return response
+        return self._call("list_site_builds", "GET", url, custom_types.Build, many=True, path_args=(site_id,), params=params)
+
+    def iter_site_builds(self, site_id: str, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.Iterator[Build]:
+        """ Yields every result of list_site_builds one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_site_builds"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_site_builds", url, params, custom_types.Build, prefetch)
 
     def list_site_deployed_branches(self, site_id: str) -> typing.List[DeployedBranch]:
         """  """
-        endpoint = f"/sites/{site_id}/deployed-branches"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, DeployedBranch)
-        return response
+        url = self.routes["list_site_deployed_branches"].url(site_id)
+        return self._call("list_site_deployed_branches", "GET", url, custom_types.DeployedBranch, many=True, path_args=(site_id,))
 
     def list_site_deploys(self, site_id: str, branch: typing.Optional[str] = None, deploy_previews: typing.Optional[bool] = None, latest_published: typing.Optional[bool] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None, production: typing.Optional[bool] = None, state: typing.Optional[str] = None) -> typing.List[Deploy]:
         """  """
-        endpoint = f"/sites/{site_id}/deploys"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_site_deploys"].url(site_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
         if branch is not None:
             params["branch"] = branch
         if deploy_previews is not None:
@@ -642,494 +837,296 @@ class Netlify:
             params["production"] = production
         if state is not None:
             params["state"] = state
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Deploy)
-        return response
+        return self._call("list_site_deploys", "GET", url, custom_types.Deploy, many=True, path_args=(site_id,), params=params)
+
+    def iter_site_deploys(self, site_id: str, branch: typing.Optional[str] = None, deploy_previews: typing.Optional[bool] = None, latest_published: typing.Optional[bool] = None, per_page: typing.Optional[int] = None, production: typing.Optional[bool] = None, state: typing.Optional[str] = None, prefetch: int = 0) -> typing.Iterator[Deploy]:
+        """ Yields every result of list_site_deploys one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_site_deploys"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if branch is not None:
+            params["branch"] = branch
+        if deploy_previews is not None:
+            params["deploy_previews"] = deploy_previews
+        if latest_published is not None:
+            params["latest_published"] = latest_published
+        if per_page is not None:
+            params["per_page"] = per_page
+        if production is not None:
+            params["production"] = production
+        if state is not None:
+            params["state"] = state
+        return self._paginate("list_site_deploys", url, params, custom_types.Deploy, prefetch)
 
     def get_site_deploy(self, site_id: str, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/sites/{site_id}/deploys/{deploy_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        url = self.routes["get_site_deploy"].url(site_id, deploy_id)
+        return self._call("get_site_deploy", "GET", url, custom_types.Deploy, path_args=(site_id, deploy_id))
 
     def get_dns_for_site(self, site_id: str) -> typing.List[DNSZone]:
         """  """
-        endpoint = f"/sites/{site_id}/dns"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, DNSZone)
-        return response
+        url = self.routes["get_dns_for_site"].url(site_id)
+        return self._call("get_dns_for_site", "GET", url, custom_types.DNSZone, many=True, path_args=(site_id,))
 
     def list_site_files(self, site_id: str) -> typing.List[File]:
         """  """
-        endpoint = f"/sites/{site_id}/files"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, File)
-        return response
+        url = self.routes["list_site_files"].url(site_id)
+        return self._call("list_site_files", "GET", url, custom_types.File, many=True, path_args=(site_id,))
 
     def get_site_file_by_path_name(self, site_id: str, file_path: str) -> File:
         """  """
-        endpoint = f"/sites/{site_id}/files/{file_path}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["file_path"] = file_path
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = File.from_dict(response)
-        return response
+        url = self.routes["get_site_file_by_path_name"].url(site_id, file_path)
+        return self._call("get_site_file_by_path_name", "GET", url, custom_types.File, path_args=(site_id, file_path))
 
     def list_site_forms(self, site_id: str) -> typing.List[Form]:
         """  """
-        endpoint = f"/sites/{site_id}/forms"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Form)
-        return response
+        url = self.routes["list_site_forms"].url(site_id)
+        return self._call("list_site_forms", "GET", url, custom_types.Form, many=True, path_args=(site_id,))
 
     def get_site_metadata(self, site_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/metadata"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["get_site_metadata"].url(site_id)
+        return self._call("get_site_metadata", "GET", url, path_args=(site_id,))
 
     def list_service_instances_for_site(self, site_id: str) -> typing.List[ServiceInstance]:
         """  """
-        endpoint = f"/sites/{site_id}/service-instances"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, ServiceInstance)
-        return response
+        url = self.routes["list_service_instances_for_site"].url(site_id)
+        return self._call("list_service_instances_for_site", "GET", url, custom_types.ServiceInstance, many=True, path_args=(site_id,))
 
     def show_service_instance(self, site_id: str, addon: str, instance_id: str) -> ServiceInstance:
         """  """
-        endpoint = f"/sites/{site_id}/services/{addon}/instances/{instance_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["addon"] = addon
-        params["instance_id"] = instance_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = ServiceInstance.from_dict(response)
-        return response
+        url = self.routes["show_service_instance"].url(site_id, addon, instance_id)
+        return self._call("show_service_instance", "GET", url, custom_types.ServiceInstance, path_args=(site_id, addon, instance_id))
 
     def list_site_snippets(self, site_id: str) -> typing.List[Snippet]:
         """  """
-        endpoint = f"/sites/{site_id}/snippets"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Snippet)
-        return response
+        url = self.routes["list_site_snippets"].url(site_id)
+        return self._call("list_site_snippets", "GET", url, custom_types.Snippet, many=True, path_args=(site_id,))
 
     def get_site_snippet(self, site_id: str, snippet_id: str) -> Snippet:
         """  """
-        endpoint = f"/sites/{site_id}/snippets/{snippet_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["snippet_id"] = snippet_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Snippet.from_dict(response)
-        return response
+        url = self.routes["get_site_snippet"].url(site_id, snippet_id)
+        return self._call("get_site_snippet", "GET", url, custom_types.Snippet, path_args=(site_id, snippet_id))
 
     def show_site_tls_certificate(self, site_id: str) -> SniCertificate:
         """  """
-        endpoint = f"/sites/{site_id}/ssl"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = SniCertificate.from_dict(response)
-        return response
+        url = self.routes["show_site_tls_certificate"].url(site_id)
+        return self._call("show_site_tls_certificate", "GET", url, custom_types.SniCertificate, path_args=(site_id,))
 
     def list_site_submissions(self, site_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Submission]:
         """  """
-        endpoint = f"/sites/{site_id}/submissions"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_site_submissions"].url(site_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
         if page is not None:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Submission)
-        return response
+        return self._call("list_site_submissions", "GET", url, custom_types.Submission, many=True, path_args=(site_id,), params=params)
+
+    def iter_site_submissions(self, site_id: str, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.Iterator[Submission]:
+        """ Yields every result of list_site_submissions one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_site_submissions"].url(site_id)
+        params = {} #type: dict[str, typing.Any]
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_site_submissions", url, params, custom_types.Submission, prefetch)
 
     def get_split_tests(self, site_id: str) -> typing.List[SplitTest]:
         """  """
-        endpoint = f"/sites/{site_id}/traffic_splits"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, SplitTest)
-        return response
+        url = self.routes["get_split_tests"].url(site_id)
+        return self._call("get_split_tests", "GET", url, custom_types.SplitTest, many=True, path_args=(site_id,))
 
     def get_split_test(self, site_id: str, split_test_id: str) -> SplitTest:
         """  """
-        endpoint = f"/sites/{site_id}/traffic_splits/{split_test_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["split_test_id"] = split_test_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = SplitTest.from_dict(response)
-        return response
+        url = self.routes["get_split_test"].url(site_id, split_test_id)
+        return self._call("get_split_test", "GET", url, custom_types.SplitTest, path_args=(site_id, split_test_id))
 
     def list_form_submission(self, submission_id: str, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None, query: typing.Optional[str] = None) -> typing.List[Submission]:
         """  """
-        endpoint = f"/submissions/{submission_id}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_form_submission"].url(submission_id)
         params = {} #type: dict[str, typing.Any]
-        params["submission_id"] = submission_id
         if page is not None:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
         if query is not None:
             params["query"] = query
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Submission)
-        return response
+        return self._call("list_form_submission", "GET", url, custom_types.Submission, many=True, path_args=(submission_id,), params=params)
 
     def get_current_user(self) -> typing.List[User]:
         """  """
-        endpoint = f"/user"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, User)
-        return response
+        url = self.routes["get_current_user"].url()
+        return self._call("get_current_user", "GET", url, custom_types.User, many=True)
 
     def get_account_build_status(self, account_id: str) -> typing.List[BuildStatus]:
         """  """
-        endpoint = f"/{account_id}/builds/status"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, BuildStatus)
-        return response
+        url = self.routes["get_account_build_status"].url(account_id)
+        return self._call("get_account_build_status", "GET", url, custom_types.BuildStatus, many=True, path_args=(account_id,))
 
     def list_members_for_account(self, account_slug: str) -> typing.List[Member]:
         """  """
-        endpoint = f"/{account_slug}/members"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Member)
-        return response
+        url = self.routes["list_members_for_account"].url(account_slug)
+        return self._call("list_members_for_account", "GET", url, custom_types.Member, many=True, path_args=(account_slug,))
 
     def get_account_member(self, account_slug: str, member_id: str) -> Member:
         """  """
-        endpoint = f"/{account_slug}/members/{member_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
-        params["member_id"] = member_id
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Member.from_dict(response)
-        return response
+        url = self.routes["get_account_member"].url(account_slug, member_id)
+        return self._call("get_account_member", "GET", url, custom_types.Member, path_args=(account_slug, member_id))
 
     def list_sites_for_account(self, account_slug: str, name: typing.Optional[str] = None, page: typing.Optional[int] = None, per_page: typing.Optional[int] = None) -> typing.List[Site]:
         """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables. """
-        endpoint = f"/{account_slug}/sites"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["list_sites_for_account"].url(account_slug)
         params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
         if name is not None:
             params["name"] = name
         if page is not None:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
-        raw_response = self.session.get(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Site)
-        return response
+        return self._call("list_sites_for_account", "GET", url, custom_types.Site, many=True, path_args=(account_slug,), params=params)
+
+    def iter_sites_for_account(self, account_slug: str, name: typing.Optional[str] = None, per_page: typing.Optional[int] = None, prefetch: int = 0) -> typing.Iterator[Site]:
+        """ Yields every result of list_sites_for_account one at a time, following the Link headers page by page. With prefetch > 0 up to that many later pages are fetched concurrently while results are still yielded in page order. """
+        url = self.routes["list_sites_for_account"].url(account_slug)
+        params = {} #type: dict[str, typing.Any]
+        if name is not None:
+            params["name"] = name
+        if per_page is not None:
+            params["per_page"] = per_page
+        return self._paginate("list_sites_for_account", url, params, custom_types.Site, prefetch)
 
     def set_env_var_value(self, request_body: PatchAccountsAccountIDEnvKeyBody, account_id: str, key: str, site_id: typing.Optional[str] = None) -> EnvVar:
         """ Updates or creates a new value for an existing environment variable. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env/{key}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["set_env_var_value"].url(account_id, key)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        params["key"] = key
         if site_id is not None:
             params["site_id"] = site_id
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.patch(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = EnvVar.from_dict(response)
-        return response
+        return self._call("set_env_var_value", "PATCH", url, custom_types.EnvVar, path_args=(account_id, key), params=params, json=json_data)
 
     def update_site(self, request_body: typing.Any, site_id: str) -> Site:
         """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [updateEnvVar](#tag/environmentVariables/operation/updateEnvVar) to update a site&#x27;s environment variables. """
-        endpoint = f"/sites/{site_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
+        url = self.routes["update_site"].url(site_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.patch(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Site.from_dict(response)
-        return response
+        return self._call("update_site", "PATCH", url, custom_types.Site, path_args=(site_id,), json=json_data)
 
     def create_account(self, request_body: AccountSetup) -> AccountMembership:
         """  """
-        endpoint = f"/accounts"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
+        url = self.routes["create_account"].url()
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = AccountMembership.from_dict(response)
-        return response
+        return self._call("create_account", "POST", url, custom_types.AccountMembership, json=json_data)
 
     def create_env_vars(self, request_body: typing.List[PostAccountsAccountIDEnvBodyItem], account_id: str, site_id: typing.Optional[str] = None) -> typing.List[EnvVar]:
         """ Creates new environment variables. Granular scopes are available on Pro plans and above.  To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_env_vars"].url(account_id)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
         if site_id is not None:
             params["site_id"] = site_id
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, EnvVar)
-        return response
+        return self._call("create_env_vars", "POST", url, custom_types.EnvVar, many=True, path_args=(account_id,), params=params, json=json_data)
 
     def update_site_build_log(self, build_id: str) -> typing.Any:
         """  """
-        endpoint = f"/builds/{build_id}/log"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["build_id"] = build_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["update_site_build_log"].url(build_id)
+        return self._call("update_site_build_log", "POST", url, path_args=(build_id,))
 
     def notify_build_start(self, build_id: str) -> typing.Any:
         """  """
-        endpoint = f"/builds/{build_id}/start"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["build_id"] = build_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["notify_build_start"].url(build_id)
+        return self._call("notify_build_start", "POST", url, path_args=(build_id,))
 
     def create_deploy_key(self) -> DeployKey:
         """  """
-        endpoint = f"/deploy_keys"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DeployKey.from_dict(response)
-        return response
+        url = self.routes["create_deploy_key"].url()
+        return self._call("create_deploy_key", "POST", url, custom_types.DeployKey)
 
     def cancel_site_deploy(self, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/deploys/{deploy_id}/cancel"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        url = self.routes["cancel_site_deploy"].url(deploy_id)
+        return self._call("cancel_site_deploy", "POST", url, custom_types.Deploy, path_args=(deploy_id,))
 
     def lock_deploy(self, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/deploys/{deploy_id}/lock"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        url = self.routes["lock_deploy"].url(deploy_id)
+        return self._call("lock_deploy", "POST", url, custom_types.Deploy, path_args=(deploy_id,))
 
     def unlock_deploy(self, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/deploys/{deploy_id}/unlock"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        url = self.routes["unlock_deploy"].url(deploy_id)
+        return self._call("unlock_deploy", "POST", url, custom_types.Deploy, path_args=(deploy_id,))
 
     def create_dns_zone(self, request_body: DNSZoneSetup) -> DNSZone:
         """  """
-        endpoint = f"/dns_zones"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
+        url = self.routes["create_dns_zone"].url()
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DNSZone.from_dict(response)
-        return response
+        return self._call("create_dns_zone", "POST", url, custom_types.DNSZone, json=json_data)
 
     def create_dns_record(self, request_body: DNSRecordCreate, zone_id: str) -> DNSRecord:
         """  """
-        endpoint = f"/dns_zones/{zone_id}/dns_records"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
+        url = self.routes["create_dns_record"].url(zone_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DNSRecord.from_dict(response)
-        return response
+        return self._call("create_dns_record", "POST", url, custom_types.DNSRecord, path_args=(zone_id,), json=json_data)
 
     def create_hook_by_site_id(self, request_body: Hook, site_id: str) -> Hook:
         """  """
-        endpoint = f"/hooks"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_hook_by_site_id"].url()
         params = {} #type: dict[str, typing.Any]
         params["site_id"] = site_id
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Hook.from_dict(response)
-        return response
+        return self._call("create_hook_by_site_id", "POST", url, custom_types.Hook, params=params, json=json_data)
 
     def enable_hook(self, hook_id: str) -> Hook:
         """  """
-        endpoint = f"/hooks/{hook_id}/enable"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["hook_id"] = hook_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Hook.from_dict(response)
-        return response
+        url = self.routes["enable_hook"].url(hook_id)
+        return self._call("enable_hook", "POST", url, custom_types.Hook, path_args=(hook_id,))
 
     def create_ticket(self, client_id: str) -> Ticket:
         """  """
-        endpoint = f"/oauth/tickets"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_ticket"].url()
         params = {} #type: dict[str, typing.Any]
         params["client_id"] = client_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Ticket.from_dict(response)
-        return response
+        return self._call("create_ticket", "POST", url, custom_types.Ticket, params=params)
 
     def exchange_ticket(self, ticket_id: str) -> AccessToken:
         """  """
-        endpoint = f"/oauth/tickets/{ticket_id}/exchange"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["ticket_id"] = ticket_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = AccessToken.from_dict(response)
-        return response
+        url = self.routes["exchange_ticket"].url(ticket_id)
+        return self._call("exchange_ticket", "POST", url, custom_types.AccessToken, path_args=(ticket_id,))
 
     def create_site(self, request_body: typing.Any, configure_dns: typing.Optional[bool] = None) -> Site:
         """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [createEnvVars](#tag/environmentVariables/operation/createEnvVars) to create environment variables for a site. """
-        endpoint = f"/sites"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_site"].url()
         params = {} #type: dict[str, typing.Any]
         if configure_dns is not None:
             params["configure_dns"] = configure_dns
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Site.from_dict(response)
-        return response
+        return self._call("create_site", "POST", url, custom_types.Site, params=params, json=json_data)
 
     def create_site_asset(self, site_id: str, content_type: str, name: str, size: int, visibility: typing.Optional[str] = None) -> AssetSignature:
         """  """
-        endpoint = f"/sites/{site_id}/assets"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_site_asset"].url(site_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
         params["content_type"] = content_type
         params["name"] = name
         params["size"] = size
         if visibility is not None:
             params["visibility"] = visibility
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = AssetSignature.from_dict(response)
-        return response
+        return self._call("create_site_asset", "POST", url, custom_types.AssetSignature, path_args=(site_id,), params=params)
 
     def create_site_build_hook(self, request_body: BuildHookSetup, site_id: str) -> BuildHook:
         """  """
-        endpoint = f"/sites/{site_id}/build_hooks"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
+        url = self.routes["create_site_build_hook"].url(site_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = BuildHook.from_dict(response)
-        return response
+        return self._call("create_site_build_hook", "POST", url, custom_types.BuildHook, path_args=(site_id,), json=json_data)
 
     def create_site_build(self, request_body: BuildSetup, site_id: str) -> Build:
         """  """
-        endpoint = f"/sites/{site_id}/builds"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
+        url = self.routes["create_site_build"].url(site_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Build.from_dict(response)
-        return response
+        return self._call("create_site_build", "POST", url, custom_types.Build, path_args=(site_id,), json=json_data)
 
     def create_site_deploy(self, request_body: DeployFiles, site_id: str, branch: typing.Optional[str] = None, deploy_previews: typing.Optional[bool] = None, latest_published: typing.Optional[bool] = None, production: typing.Optional[bool] = None, state: typing.Optional[str] = None, title: typing.Optional[str] = None) -> Deploy:
         """  """
-        endpoint = f"/sites/{site_id}/deploys"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_site_deploy"].url(site_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
         if branch is not None:
             params["branch"] = branch
         if deploy_previews is not None:
@@ -1143,342 +1140,190 @@ class Netlify:
         if title is not None:
             params["title"] = title
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        return self._call("create_site_deploy", "POST", url, custom_types.Deploy, path_args=(site_id,), params=params, json=json_data)
 
     def restore_site_deploy(self, site_id: str, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/sites/{site_id}/deploys/{deploy_id}/restore"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["deploy_id"] = deploy_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        url = self.routes["restore_site_deploy"].url(site_id, deploy_id)
+        return self._call("restore_site_deploy", "POST", url, custom_types.Deploy, path_args=(site_id, deploy_id))
 
     def create_service_instance(self, request_body: typing.Any, site_id: str, addon: str) -> ServiceInstance:
         """  """
-        endpoint = f"/sites/{site_id}/services/{addon}/instances"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["addon"] = addon
+        url = self.routes["create_service_instance"].url(site_id, addon)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = ServiceInstance.from_dict(response)
-        return response
+        return self._call("create_service_instance", "POST", url, custom_types.ServiceInstance, path_args=(site_id, addon), json=json_data)
 
     def create_site_snippet(self, request_body: Snippet, site_id: str) -> Snippet:
         """  """
-        endpoint = f"/sites/{site_id}/snippets"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
+        url = self.routes["create_site_snippet"].url(site_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Snippet.from_dict(response)
-        return response
+        return self._call("create_site_snippet", "POST", url, custom_types.Snippet, path_args=(site_id,), json=json_data)
 
     def provision_site_tls_certificate(self, site_id: str, ca_certificates: typing.Optional[str] = None, certificate: typing.Optional[str] = None, key: typing.Optional[str] = None) -> SniCertificate:
         """  """
-        endpoint = f"/sites/{site_id}/ssl"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["provision_site_tls_certificate"].url(site_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
         if ca_certificates is not None:
             params["ca_certificates"] = ca_certificates
         if certificate is not None:
             params["certificate"] = certificate
         if key is not None:
             params["key"] = key
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = SniCertificate.from_dict(response)
-        return response
+        return self._call("provision_site_tls_certificate", "POST", url, custom_types.SniCertificate, path_args=(site_id,), params=params)
 
     def create_split_test(self, request_body: SplitTestSetup, site_id: str) -> SplitTest:
         """  """
-        endpoint = f"/sites/{site_id}/traffic_splits"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
+        url = self.routes["create_split_test"].url(site_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = SplitTest.from_dict(response)
-        return response
+        return self._call("create_split_test", "POST", url, custom_types.SplitTest, path_args=(site_id,), json=json_data)
 
     def enable_split_test(self, site_id: str, split_test_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/traffic_splits/{split_test_id}/publish"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["split_test_id"] = split_test_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["enable_split_test"].url(site_id, split_test_id)
+        return self._call("enable_split_test", "POST", url, path_args=(site_id, split_test_id))
 
     def disable_split_test(self, site_id: str, split_test_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/traffic_splits/{split_test_id}/unpublish"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["split_test_id"] = split_test_id
-        raw_response = self.session.post(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["disable_split_test"].url(site_id, split_test_id)
+        return self._call("disable_split_test", "POST", url, path_args=(site_id, split_test_id))
 
     def add_member_to_account(self, request_body: AccountAddMemberSetup, account_slug: str) -> typing.List[Member]:
         """  """
-        endpoint = f"/{account_slug}/members"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
+        url = self.routes["add_member_to_account"].url(account_slug)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, Member)
-        return response
+        return self._call("add_member_to_account", "POST", url, custom_types.Member, many=True, path_args=(account_slug,), json=json_data)
 
     def create_site_in_team(self, request_body: typing.Any, account_slug: str, configure_dns: typing.Optional[bool] = None) -> Site:
         """ **Note:** Environment variable keys and values will soon be moved from &#x60;build_settings.env&#x60; and &#x60;repo.env&#x60; to a new endpoint. Please use [createEnvVars](#tag/environmentVariables/operation/createEnvVars) to create environment variables for a site. """
-        endpoint = f"/{account_slug}/sites"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["create_site_in_team"].url(account_slug)
         params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
         if configure_dns is not None:
             params["configure_dns"] = configure_dns
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.post(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Site.from_dict(response)
-        return response
+        return self._call("create_site_in_team", "POST", url, custom_types.Site, path_args=(account_slug,), params=params, json=json_data)
 
     def update_account(self, request_body: AccountUpdateSetup, account_id: str) -> AccountMembership:
         """  """
-        endpoint = f"/accounts/{account_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
+        url = self.routes["update_account"].url(account_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = AccountMembership.from_dict(response)
-        return response
+        return self._call("update_account", "PUT", url, custom_types.AccountMembership, path_args=(account_id,), json=json_data)
 
     def update_env_var(self, request_body: PutAccountsAccountIDEnvKeyBody, account_id: str, key: str, site_id: typing.Optional[str] = None) -> EnvVar:
         """ Updates an existing environment variable and all of its values. Existing values will be replaced by values provided. To use this endpoint, your site must no longer be using the &lt;a href&#x3D;&quot;https://docs.netlify.com/environment-variables/classic-experience/&quot;&gt;classic environment variables experience&lt;/a&gt;.  Migrate now with the Netlify UI. """
-        endpoint = f"/accounts/{account_id}/env/{key}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["update_env_var"].url(account_id, key)
         params = {} #type: dict[str, typing.Any]
-        params["account_id"] = account_id
-        params["key"] = key
         if site_id is not None:
             params["site_id"] = site_id
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = EnvVar.from_dict(response)
-        return response
+        return self._call("update_env_var", "PUT", url, custom_types.EnvVar, path_args=(account_id, key), params=params, json=json_data)
 
-    def upload_deploy_file(self, request_body: str, deploy_id: str, path: str, size: typing.Optional[int] = None) -> File:
+    def upload_deploy_file(self, request_body: UploadBody, deploy_id: str, path: str, size: typing.Optional[int] = None) -> File:
         """  """
-        endpoint = f"/deploys/{deploy_id}/files/{path}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["upload_deploy_file"].url(deploy_id, path)
         params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        params["path"] = path
         if size is not None:
             params["size"] = size
-        json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = File.from_dict(response)
-        return response
+        if isinstance(request_body, str):
+            json_data = self._to_json_encodable(request_body)
+            return self._call("upload_deploy_file", "PUT", url, custom_types.File, path_args=(deploy_id, path), params=params, json=json_data)
+        with _BinaryBody(request_body, size) as body:
+            headers = {"Content-Type": "application/octet-stream", "Content-Length": str(len(body))}
+            return self._call("upload_deploy_file", "PUT", url, custom_types.File, path_args=(deploy_id, path), params=params, data=body, headers=headers)
 
-    def upload_deploy_function(self, request_body: str, deploy_id: str, name: str, invocation_mode: typing.Optional[str] = None, runtime: typing.Optional[str] = None, size: typing.Optional[int] = None) -> Function:
+    def upload_deploy_function(self, request_body: UploadBody, deploy_id: str, name: str, invocation_mode: typing.Optional[str] = None, runtime: typing.Optional[str] = None, size: typing.Optional[int] = None) -> Function:
         """  """
-        endpoint = f"/deploys/{deploy_id}/functions/{name}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["upload_deploy_function"].url(deploy_id, name)
         params = {} #type: dict[str, typing.Any]
-        params["deploy_id"] = deploy_id
-        params["name"] = name
         if invocation_mode is not None:
             params["invocation_mode"] = invocation_mode
         if runtime is not None:
             params["runtime"] = runtime
         if size is not None:
             params["size"] = size
-        json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Function.from_dict(response)
-        return response
+        if isinstance(request_body, str):
+            json_data = self._to_json_encodable(request_body)
+            return self._call("upload_deploy_function", "PUT", url, custom_types.Function, path_args=(deploy_id, name), params=params, json=json_data)
+        with _BinaryBody(request_body, size) as body:
+            headers = {"Content-Type": "application/octet-stream", "Content-Length": str(len(body))}
+            return self._call("upload_deploy_function", "PUT", url, custom_types.Function, path_args=(deploy_id, name), params=params, data=body, headers=headers)
 
     def transfer_dns_zone(self, zone_id: str, account_id: str, transfer_account_id: str, transfer_user_id: str) -> DNSZone:
         """  """
-        endpoint = f"/dns_zones/{zone_id}/transfer"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["transfer_dns_zone"].url(zone_id)
         params = {} #type: dict[str, typing.Any]
-        params["zone_id"] = zone_id
         params["account_id"] = account_id
         params["transfer_account_id"] = transfer_account_id
         params["transfer_user_id"] = transfer_user_id
-        raw_response = self.session.put(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = DNSZone.from_dict(response)
-        return response
+        return self._call("transfer_dns_zone", "PUT", url, custom_types.DNSZone, path_args=(zone_id,), params=params)
 
     def update_hook(self, request_body: Hook, hook_id: str) -> Hook:
         """  """
-        endpoint = f"/hooks/{hook_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["hook_id"] = hook_id
+        url = self.routes["update_hook"].url(hook_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Hook.from_dict(response)
-        return response
+        return self._call("update_hook", "PUT", url, custom_types.Hook, path_args=(hook_id,), json=json_data)
 
     def update_site_asset(self, site_id: str, asset_id: str, state: str) -> Asset:
         """  """
-        endpoint = f"/sites/{site_id}/assets/{asset_id}"
-        url = urljoin(self.base_url, endpoint)
+        url = self.routes["update_site_asset"].url(site_id, asset_id)
         params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["asset_id"] = asset_id
         params["state"] = state
-        raw_response = self.session.put(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Asset.from_dict(response)
-        return response
+        return self._call("update_site_asset", "PUT", url, custom_types.Asset, path_args=(site_id, asset_id), params=params)
 
     def update_site_build_hook(self, request_body: BuildHookSetup, site_id: str, id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/build_hooks/{id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["id"] = id
+        url = self.routes["update_site_build_hook"].url(site_id, id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        return self._call("update_site_build_hook", "PUT", url, path_args=(site_id, id), json=json_data)
 
     def update_site_deploy(self, request_body: DeployFiles, site_id: str, deploy_id: str) -> Deploy:
         """  """
-        endpoint = f"/sites/{site_id}/deploys/{deploy_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["deploy_id"] = deploy_id
+        url = self.routes["update_site_deploy"].url(site_id, deploy_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Deploy.from_dict(response)
-        return response
+        return self._call("update_site_deploy", "PUT", url, custom_types.Deploy, path_args=(site_id, deploy_id), json=json_data)
 
     def configure_dns_for_site(self, site_id: str) -> typing.List[DNSZone]:
         """  """
-        endpoint = f"/sites/{site_id}/dns"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.put(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = self._cast_list(response, DNSZone)
-        return response
+        url = self.routes["configure_dns_for_site"].url(site_id)
+        return self._call("configure_dns_for_site", "PUT", url, custom_types.DNSZone, many=True, path_args=(site_id,))
 
     def update_site_metadata(self, request_body: typing.Any, site_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/metadata"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
+        url = self.routes["update_site_metadata"].url(site_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        return self._call("update_site_metadata", "PUT", url, path_args=(site_id,), json=json_data)
 
     def rollback_site_deploy(self, site_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/rollback"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.put(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        url = self.routes["rollback_site_deploy"].url(site_id)
+        return self._call("rollback_site_deploy", "PUT", url, path_args=(site_id,))
 
     def update_service_instance(self, request_body: typing.Any, site_id: str, addon: str, instance_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/services/{addon}/instances/{instance_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["addon"] = addon
-        params["instance_id"] = instance_id
+        url = self.routes["update_service_instance"].url(site_id, addon, instance_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        return self._call("update_service_instance", "PUT", url, path_args=(site_id, addon, instance_id), json=json_data)
 
     def update_site_snippet(self, request_body: Snippet, site_id: str, snippet_id: str) -> typing.Any:
         """  """
-        endpoint = f"/sites/{site_id}/snippets/{snippet_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["snippet_id"] = snippet_id
+        url = self.routes["update_site_snippet"].url(site_id, snippet_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        return response
+        return self._call("update_site_snippet", "PUT", url, path_args=(site_id, snippet_id), json=json_data)
 
     def update_split_test(self, request_body: SplitTestSetup, site_id: str, split_test_id: str) -> SplitTest:
         """  """
-        endpoint = f"/sites/{site_id}/traffic_splits/{split_test_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        params["split_test_id"] = split_test_id
+        url = self.routes["update_split_test"].url(site_id, split_test_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = SplitTest.from_dict(response)
-        return response
+        return self._call("update_split_test", "PUT", url, custom_types.SplitTest, path_args=(site_id, split_test_id), json=json_data)
 
     def unlink_site_repo(self, site_id: str) -> Site:
         """ [Beta] Unlinks the repo from the site. -  - This action will also: - - Delete associated deploy keys - - Delete outgoing webhooks for the repo - - Delete the site&#x27;s build hooks """
-        endpoint = f"/sites/{site_id}/unlink_repo"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["site_id"] = site_id
-        raw_response = self.session.put(url, params=params)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Site.from_dict(response)
-        return response
+        url = self.routes["unlink_site_repo"].url(site_id)
+        return self._call("unlink_site_repo", "PUT", url, custom_types.Site, path_args=(site_id,))
 
     def update_account_member(self, request_body: AccountUpdateMemberSetup, account_slug: str, member_id: str) -> Member:
         """  """
-        endpoint = f"/{account_slug}/members/{member_id}"
-        url = urljoin(self.base_url, endpoint)
-        params = {} #type: dict[str, typing.Any]
-        params["account_slug"] = account_slug
-        params["member_id"] = member_id
+        url = self.routes["update_account_member"].url(account_slug, member_id)
         json_data = self._to_json_encodable(request_body)
-        raw_response = self.session.put(url, params=params, json=json_data)
-        response = raw_response.json() if raw_response.ok else self._raise_exception(raw_response)
-        response = Member.from_dict(response)
-        return response
+        return self._call("update_account_member", "PUT", url, custom_types.Member, path_args=(account_slug, member_id), json=json_data)
 
 
@@ -0,0 +1,98 @@
+import time
+import random
+import typing
+import threading
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+def should_retry(method: str, status_code: int) -> bool:
+    """ 429 responses were not processed and are retried for every verb; 5xx only for idempotent verbs. """
+    if status_code == 429:
+        return True
+    return status_code >= 500 and method.upper() in IDEMPOTENT_METHODS
+
+def _header_float(headers: typing.Mapping[str, str], name: str) -> typing.Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def _retry_after(headers: typing.Mapping[str, str]) -> typing.Optional[float]:
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimiter:
+    """ Token bucket that paces requests from the X-RateLimit-Limit/Remaining/Reset headers.
+
+    After every response the refill rate is set so the remaining quota is spread evenly over the rest of the window, so a bulk job slows down before the API starts answering 429. A 429 or Retry-After blocks all callers until the advertised time. One limiter can be shared between clients that use the same token. Thread-safe. """
+    def __init__(self, burst: int = 10, backoff: float = 0.5, max_backoff: float = 30.0):
+        self.burst = burst
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.limit = None #type: typing.Optional[float]
+        self.remaining = None #type: typing.Optional[float]
+        self._lock = threading.Lock()
+        self._rate = None #type: typing.Optional[float]
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def reserve(self) -> float:
+        """ Takes one token and returns how many seconds the caller must wait before sending. """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._rate is None:
+                return wait
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self._rate) if self._rate > 0 else max(wait, self.max_backoff)
+            return wait
+
+    def update(self, status_code: int, headers: typing.Mapping[str, str]) -> None:
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        retry_after = _retry_after(headers)
+        with self._lock:
+            now = time.monotonic()
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None and reset is not None:
+                self.remaining = remaining
+                window = max(reset - time.time(), 1.0)
+                self._tokens = min(self._tokens + (now - self._updated) * (self._rate or 0.0), self._capacity)
+                self._updated = now
+                self._rate = max(remaining, 0.0) / window
+                self._capacity = max(1.0, min(float(self.burst), remaining))
+                self._tokens = min(self._tokens, self._capacity)
+                if remaining <= 0:
+                    self._blocked_until = max(self._blocked_until, now + window)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            elif status_code == 429:
+                self._blocked_until = max(self._blocked_until, now + self.backoff)
+
+    def retry_delay(self, headers: typing.Mapping[str, str], attempt: int) -> float:
+        """ Seconds to wait before retry number attempt (0-based): Retry-After when present, otherwise jittered exponential backoff. """
+        retry_after = _retry_after(headers)
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
@@ -0,0 +1,161 @@
+import re
+import typing
+from urllib.parse import quote
+
+# operation -> (HTTP method, endpoint template relative to the API base URL)
+ROUTES = {
+    "cancel_account": ("DELETE", "/accounts/{account_id}"),
+    "delete_env_var": ("DELETE", "/accounts/{account_id}/env/{key}"),
+    "delete_env_var_value": ("DELETE", "/accounts/{account_id}/env/{key}/value/{id}"),
+    "delete_deploy_key": ("DELETE", "/deploy_keys/{key_id}"),
+    "delete_deploy": ("DELETE", "/deploys/{deploy_id}"),
+    "delete_dns_zone": ("DELETE", "/dns_zones/{zone_id}"),
+    "delete_dns_record": ("DELETE", "/dns_zones/{zone_id}/dns_records/{dns_record_id}"),
+    "delete_hook": ("DELETE", "/hooks/{hook_id}"),
+    "delete_site": ("DELETE", "/sites/{site_id}"),
+    "delete_site_asset": ("DELETE", "/sites/{site_id}/assets/{asset_id}"),
+    "delete_site_build_hook": ("DELETE", "/sites/{site_id}/build_hooks/{id}"),
+    "delete_site_deploy": ("DELETE", "/sites/{site_id}/deploys/{deploy_id}"),
+    "delete_site_form": ("DELETE", "/sites/{site_id}/forms/{form_id}"),
+    "delete_service_instance": ("DELETE", "/sites/{site_id}/services/{addon}/instances/{instance_id}"),
+    "delete_site_snippet": ("DELETE", "/sites/{site_id}/snippets/{snippet_id}"),
+    "delete_submission": ("DELETE", "/submissions/{submission_id}"),
+    "remove_account_member": ("DELETE", "/{account_slug}/members/{member_id}"),
+    "list_accounts_for_user": ("GET", "/accounts"),
+    "list_account_types_for_user": ("GET", "/accounts/types"),
+    "get_account": ("GET", "/accounts/{account_id}"),
+    "list_account_audit_events": ("GET", "/accounts/{account_id}/audit"),
+    "get_env_vars": ("GET", "/accounts/{account_id}/env"),
+    "get_env_var": ("GET", "/accounts/{account_id}/env/{key}"),
+    "list_payment_methods_for_user": ("GET", "/billing/payment_methods"),
+    "get_site_build": ("GET", "/builds/{build_id}"),
+    "list_deploy_keys": ("GET", "/deploy_keys"),
+    "get_deploy_key": ("GET", "/deploy_keys/{key_id}"),
+    "get_deploy": ("GET", "/deploys/{deploy_id}"),
+    "get_dns_zones": ("GET", "/dns_zones"),
+    "get_dns_zone": ("GET", "/dns_zones/{zone_id}"),
+    "get_dns_records": ("GET", "/dns_zones/{zone_id}/dns_records"),
+    "get_individual_dns_record": ("GET", "/dns_zones/{zone_id}/dns_records/{dns_record_id}"),
+    "list_form_submissions": ("GET", "/forms/{form_id}/submissions"),
+    "list_hooks_by_site_id": ("GET", "/hooks"),
+    "list_hook_types": ("GET", "/hooks/types"),
+    "get_hook": ("GET", "/hooks/{hook_id}"),
+    "show_ticket": ("GET", "/oauth/tickets/{ticket_id}"),
+    "get_services": ("GET", "/services/"),
+    "show_service": ("GET", "/services/{addon_name}"),
+    "show_service_manifest": ("GET", "/services/{addon_name}/manifest"),
+    "list_sites": ("GET", "/sites"),
+    "get_site": ("GET", "/sites/{site_id}"),
+    "list_site_assets": ("GET", "/sites/{site_id}/assets"),
+    "get_site_asset_info": ("GET", "/sites/{site_id}/assets/{asset_id}"),
+    "get_site_asset_public_signature": ("GET", "/sites/{site_id}/assets/{asset_id}/public_signature"),
+    "list_site_build_hooks": ("GET", "/sites/{site_id}/build_hooks"),
+    "get_site_build_hook": ("GET", "/sites/{site_id}/build_hooks/{id}"),
+    "list_site_builds": ("GET", "/sites/{site_id}/builds"),
+    "list_site_deployed_branches": ("GET", "/sites/{site_id}/deployed-branches"),
+    "list_site_deploys": ("GET", "/sites/{site_id}/deploys"),
+    "get_site_deploy": ("GET", "/sites/{site_id}/deploys/{deploy_id}"),
+    "get_dns_for_site": ("GET", "/sites/{site_id}/dns"),
+    "list_site_files": ("GET", "/sites/{site_id}/files"),
+    "get_site_file_by_path_name": ("GET", "/sites/{site_id}/files/{file_path}"),
+    "list_site_forms": ("GET", "/sites/{site_id}/forms"),
+    "get_site_metadata": ("GET", "/sites/{site_id}/metadata"),
+    "list_service_instances_for_site": ("GET", "/sites/{site_id}/service-instances"),
+    "show_service_instance": ("GET", "/sites/{site_id}/services/{addon}/instances/{instance_id}"),
+    "list_site_snippets": ("GET", "/sites/{site_id}/snippets"),
+    "get_site_snippet": ("GET", "/sites/{site_id}/snippets/{snippet_id}"),
+    "show_site_tls_certificate": ("GET", "/sites/{site_id}/ssl"),
+    "list_site_submissions": ("GET", "/sites/{site_id}/submissions"),
+    "get_split_tests": ("GET", "/sites/{site_id}/traffic_splits"),
+    "get_split_test": ("GET", "/sites/{site_id}/traffic_splits/{split_test_id}"),
+    "list_form_submission": ("GET", "/submissions/{submission_id}"),
+    "get_current_user": ("GET", "/user"),
+    "get_account_build_status": ("GET", "/{account_id}/builds/status"),
+    "list_members_for_account": ("GET", "/{account_slug}/members"),
+    "get_account_member": ("GET", "/{account_slug}/members/{member_id}"),
+    "list_sites_for_account": ("GET", "/{account_slug}/sites"),
+    "set_env_var_value": ("PATCH", "/accounts/{account_id}/env/{key}"),
+    "update_site": ("PATCH", "/sites/{site_id}"),
+    "create_account": ("POST", "/accounts"),
+    "create_env_vars": ("POST", "/accounts/{account_id}/env"),
+    "update_site_build_log": ("POST", "/builds/{build_id}/log"),
+    "notify_build_start": ("POST", "/builds/{build_id}/start"),
+    "create_deploy_key": ("POST", "/deploy_keys"),
+    "cancel_site_deploy": ("POST", "/deploys/{deploy_id}/cancel"),
+    "lock_deploy": ("POST", "/deploys/{deploy_id}/lock"),
+    "unlock_deploy": ("POST", "/deploys/{deploy_id}/unlock"),
+    "create_dns_zone": ("POST", "/dns_zones"),
+    "create_dns_record": ("POST", "/dns_zones/{zone_id}/dns_records"),
+    "create_hook_by_site_id": ("POST", "/hooks"),
+    "enable_hook": ("POST", "/hooks/{hook_id}/enable"),
+    "create_ticket": ("POST", "/oauth/tickets"),
+    "exchange_ticket": ("POST", "/oauth/tickets/{ticket_id}/exchange"),
+    "create_site": ("POST", "/sites"),
+    "create_site_asset": ("POST", "/sites/{site_id}/assets"),
+    "create_site_build_hook": ("POST", "/sites/{site_id}/build_hooks"),
+    "create_site_build": ("POST", "/sites/{site_id}/builds"),
+    "create_site_deploy": ("POST", "/sites/{site_id}/deploys"),
+    "restore_site_deploy": ("POST", "/sites/{site_id}/deploys/{deploy_id}/restore"),
+    "create_service_instance": ("POST", "/sites/{site_id}/services/{addon}/instances"),
+    "create_site_snippet": ("POST", "/sites/{site_id}/snippets"),
+    "provision_site_tls_certificate": ("POST", "/sites/{site_id}/ssl"),
+    "create_split_test": ("POST", "/sites/{site_id}/traffic_splits"),
+    "enable_split_test": ("POST", "/sites/{site_id}/traffic_splits/{split_test_id}/publish"),
+    "disable_split_test": ("POST", "/sites/{site_id}/traffic_splits/{split_test_id}/unpublish"),
+    "add_member_to_account": ("POST", "/{account_slug}/members"),
+    "create_site_in_team": ("POST", "/{account_slug}/sites"),
+    "update_account": ("PUT", "/accounts/{account_id}"),
+    "update_env_var": ("PUT", "/accounts/{account_id}/env/{key}"),
+    "upload_deploy_file": ("PUT", "/deploys/{deploy_id}/files/{path}"),
+    "upload_deploy_function": ("PUT", "/deploys/{deploy_id}/functions/{name}"),
+    "transfer_dns_zone": ("PUT", "/dns_zones/{zone_id}/transfer"),
+    "update_hook": ("PUT", "/hooks/{hook_id}"),
+    "update_site_asset": ("PUT", "/sites/{site_id}/assets/{asset_id}"),
+    "update_site_build_hook": ("PUT", "/sites/{site_id}/build_hooks/{id}"),
+    "update_site_deploy": ("PUT", "/sites/{site_id}/deploys/{deploy_id}"),
+    "configure_dns_for_site": ("PUT", "/sites/{site_id}/dns"),
+    "update_site_metadata": ("PUT", "/sites/{site_id}/metadata"),
+    "rollback_site_deploy": ("PUT", "/sites/{site_id}/rollback"),
+    "update_service_instance": ("PUT", "/sites/{site_id}/services/{addon}/instances/{instance_id}"),
+    "update_site_snippet": ("PUT", "/sites/{site_id}/snippets/{snippet_id}"),
+    "update_split_test": ("PUT", "/sites/{site_id}/traffic_splits/{split_test_id}"),
+    "unlink_site_repo": ("PUT", "/sites/{site_id}/unlink_repo"),
+    "update_account_member": ("PUT", "/{account_slug}/members/{member_id}"),
+} #type: dict[str, tuple[str, str]]
+
+# path parameters that name a file in a deploy or site and keep their "/" separators; every other argument fills exactly one segment
+_MULTI_SEGMENT = frozenset(("path", "file_path"))
+
+class Route:
+    """ One operation's endpoint bound to a client's base URL. url(*args) fills the template with the path arguments in order, percent-encoding each one as a path segment. """
+    __slots__ = ("operation", "method", "template", "names", "_url", "_pattern", "_safe")
+
+    def __init__(self, operation: str, method: str, template: str, base_url: str):
+        self.operation = operation
+        self.method = method
+        self.template = template
+        parts = re.split(r"\{(\w+)\}", template)
+        self.names = tuple(parts[1::2])
+        base = base_url.rstrip("/")
+        self._url = base + template
+        self._pattern = base.replace("%", "%%") + "%s".join(literal.replace("%", "%%") for literal in parts[0::2])
+        self._safe = tuple("/" if name in _MULTI_SEGMENT else "" for name in self.names)
+
+    def url(self, *args: typing.Any) -> str:
+        if not args:
+            return self._url
+        return self._pattern % tuple(quote(str(arg), safe=safe) for arg, safe in zip(args, self._safe))
+
+    def arguments(self, args: typing.Sequence[typing.Any], query: typing.Optional[typing.Mapping[str, typing.Any]] = None) -> typing.Dict[str, typing.Any]:
+        """ The path arguments by name followed by the query parameters, which is how ResponseCache identifies what a call read or wrote. """
+        arguments = dict(zip(self.names, args))
+        if query:
+            arguments.update(query)
+        return arguments
+
+    def __repr__(self) -> str:
+        return f"Route({self.operation} {self.method} {self.template})"
+
+def compile_routes(base_url: str) -> typing.Dict[str, Route]:
+    """ The routing table of a client: a Route per operation, with the base URL's own path (such as /api/v1) kept in front of every endpoint. """
+    return {operation: Route(operation, method, template, base_url) for operation, (method, template) in ROUTES.items()}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import typing
+import threading
+
+if typing.TYPE_CHECKING:
+    import asyncio
+
+T = typing.TypeVar("T")
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None #type: typing.Any
+        self.error = None #type: typing.Optional[BaseException]
+
+class SingleFlight:
+    """ Coalesces concurrent calls with the same key across threads: the first caller runs the function and every caller that arrives while it is in flight waits for and receives the same result (or exception). """
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls = {} #type: dict[typing.Hashable, _Call]
+        self._lock = threading.Lock()
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], T]) -> T:
+        with self._lock:
+            existing = self._calls.get(key)
+            if existing is None:
+                call = self._calls[key] = _Call()
+            else:
+                call = existing
+                self.shared += 1
+        if existing is not None:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+class AsyncSingleFlight:
+    """ asyncio counterpart of SingleFlight. The shared call runs in its own task, so cancelling one waiting caller does not cancel it for the others. """
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls = {} #type: dict[typing.Hashable, asyncio.Future]
+
+    async def do(self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        # imported here so that the sync client, which imports this module, does not load asyncio
+        import asyncio
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: typing.Hashable, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # marks the exception retrieved when every caller was cancelled before it arrived
+            task.exception()
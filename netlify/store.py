@@ -0,0 +1,74 @@
+import os
+import json
+import typing
+import sqlite3
+import threading
+
+from .cache import CacheEntry, _matches
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    params TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_operation ON responses (operation);
+"""
+
+class SQLiteStore:
+    """ Persistent backend for ResponseCache: one SQLite row per cached GET response (body, validators and fetch time) keyed by the cache's request signature, so a new process starts with the previous one's responses. The database is created readable by the owner only, runs in WAL mode so several processes can share it, and keeps at most max_entries rows, dropping the least recently fetched. Thread-safe. """
+    def __init__(self, path: typing.Union[str, "os.PathLike[str]"], max_entries: int = 100000):
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        if not os.path.exists(self.path):
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def load(self, key: str) -> typing.Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute("SELECT operation, params, body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        operation, params, body, etag, last_modified, stored_at = row
+        return CacheEntry(operation, json.loads(params), bytes(body), etag, last_modified, stored_at)
+
+    def save(self, key: str, entry: CacheEntry) -> None:
+        row = (key, entry.operation, json.dumps(entry.params, default=str), entry.body, entry.etag, entry.last_modified, entry.stored_at)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+            self._writes += 1
+            if self._writes % 256 == 0:
+                self._db.execute("DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)", (self.max_entries,))
+
+    def delete(self, keys: typing.Iterable[str]) -> None:
+        with self._lock:
+            self._db.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in keys])
+
+    def matching(self, rules: typing.Iterable[typing.Tuple[str, ...]], params: typing.Mapping[str, typing.Any]) -> typing.List[str]:
+        """ Keys of the stored entries the invalidation rules select for a write with params. """
+        keys = [] #type: list[str]
+        with self._lock:
+            for read, *names in rules:
+                if read == "*":
+                    rows = self._db.execute("SELECT key, params FROM responses").fetchall()
+                else:
+                    rows = self._db.execute("SELECT key, params FROM responses WHERE operation = ?", (read,)).fetchall()
+                keys.extend(key for key, stored in rows if _matches(json.loads(stored), params, tuple(names)))
+        return keys
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
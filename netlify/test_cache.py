@@ -0,0 +1,57 @@
+
+
+from .main import Netlify
+from .cache import ResponseCache
+
+def test_fresh_read_is_served_from_cache(api):
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60))
+    first = client.get_site("s1")
+    assert client.get_site("s1") is first
+    assert api.count("GET", "/sites/s1") == 1
+
+def test_stale_read_is_revalidated_with_etag(api):
+    cache = ResponseCache(ttl=0)
+    client = Netlify("token", base_url=api.base_url, cache=cache)
+    first = client.get_site("s1")
+    assert client.get_site("s1") is first
+    assert api.count("GET", "/sites/s1") == 2
+    assert cache.revalidated == 1
+
+def test_tokens_do_not_share_entries(api):
+    cache = ResponseCache(ttl=60)
+    Netlify("token-a", base_url=api.base_url, cache=cache).get_site("s1")
+    Netlify("token-b", base_url=api.base_url, cache=cache).get_site("s1")
+    assert api.count("GET", "/sites/s1") == 2
+
+def test_ttls_override_the_default_per_operation(api):
+    cache = ResponseCache(ttl=60, ttls={"get_site": 0})
+    client = Netlify("token", base_url=api.base_url, cache=cache)
+    client.get_site("s1")
+    client.get_site("s1")
+    client.list_sites()
+    client.list_sites()
+    assert api.count("GET", "/sites/s1") == 2
+    assert api.count("GET", "/sites") == 1
+
+def test_only_the_listed_operations_are_cached(api):
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60, operations=["list_sites"]))
+    client.get_site("s1")
+    client.get_site("s1")
+    assert api.count("GET", "/sites/s1") == 2
+    assert len(client.cache) == 0
+
+def test_least_recently_used_entry_is_dropped():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    for name in ("a", "b"):
+        cache.store(name, "get_site", {}, b"{}", {})
+    cache.get("a")
+    cache.store("c", "get_site", {}, b"{}", {})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+def test_validators_come_from_the_response():
+    cache = ResponseCache()
+    entry = cache.store("k", "get_site", {}, b"{}", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    assert entry.validators() == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    # without a validator or a TTL the response could never be served again
+    assert cache.store("other", "get_site", {}, b"{}", {}) is None
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from .main import Netlify
+from .codec import OrjsonCodec, StdlibCodec, default_codec
+from .custom_types import Site
+
+PAYLOAD = {"name": "café ☃", "count": 2 ** 53 + 1, "ratio": 0.1, "flags": [True, False, None], "nested": {"empty": {}, "list": []}}
+
+class _RecordingCodec(StdlibCodec):
+    content_type = "application/vnd.netlify.test+json"
+
+    def __init__(self) -> None:
+        self.dumped = [] #type: list[bytes]
+
+    def dumps(self, obj: object) -> bytes:
+        data = super().dumps(obj)
+        self.dumped.append(data)
+        return data
+
+def test_body_is_sent_as_codec_bytes_with_its_content_type(api):
+    codec = _RecordingCodec()
+    site = Netlify("token", base_url=api.base_url, codec=codec).update_site(Site.from_dict({"name": "café"}), "s1")
+    assert site.name == "café"
+    assert api.bodies == [("/sites/s1", codec.content_type, codec.dumped[0])]
+    assert json.loads(codec.dumped[0]) == {"name": "café"}
+
+def test_stdlib_output_is_compact_utf8():
+    assert StdlibCodec().dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode("utf-8")
+
+def test_default_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+    assert isinstance(default_codec(), OrjsonCodec)
+
+def test_codecs_agree():
+    pytest.importorskip("orjson")
+    stdlib, fast = StdlibCodec(), OrjsonCodec()
+    for data in (stdlib.dumps(PAYLOAD), fast.dumps(PAYLOAD)):
+        assert stdlib.loads(data) == fast.loads(data) == PAYLOAD
+    assert stdlib.loads(stdlib.dumps(PAYLOAD).decode("utf-8")) == fast.loads(fast.dumps(PAYLOAD).decode("utf-8"))
+
+def test_clients_decode_the_same_with_either_codec(api):
+    pytest.importorskip("orjson")
+    api.sites["s1"].update(PAYLOAD)
+    results = [Netlify("token", base_url=api.base_url, codec=codec, decode=decode).get_site("s1") for codec in (StdlibCodec(), OrjsonCodec()) for decode in ("models", "dicts")]
+    assert results[0].to_dict() == results[2].to_dict()
+    assert results[1] == results[3]
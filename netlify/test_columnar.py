@@ -0,0 +1,83 @@
+import inspect
+from array import array
+
+import pytest
+
+from . import custom_types
+from .main import Netlify
+from .columnar import ColumnarList, Row
+from .custom_types import Deploy, File
+
+FILES = [
+    {"id": "f1", "path": "/index.html", "sha": "a", "mime_type": "text/html", "size": 10},
+    {"id": "f2", "path": "/app.js", "sha": "b", "mime_type": "text/javascript"},
+    {"id": "f3", "path": "/about.html", "sha": "c", "mime_type": "text/html", "size": 30},
+]
+
+def _models() -> list:
+    models = [getattr(custom_types, name) for name in custom_types.__all__]
+    return [model for model in models if isinstance(model, type) and hasattr(model, "_fields")]
+
+def test_numeric_column_is_packed_with_a_null_mask():
+    files = ColumnarList.from_dicts(File, FILES)
+    assert files.column("size") == array("q", [10, 0, 30])
+    assert files.null_mask("size") == bytearray([1, 0, 1])
+    assert [row.size for row in files] == [10, None, 30]
+    assert files.null_mask("path") is None
+
+def test_equal_strings_share_one_object():
+    files = ColumnarList.from_dicts(File, FILES)
+    mime_types = files.column("mime_type")
+    assert mime_types[0] is mime_types[2]
+
+def test_bool_column():
+    deploys = ColumnarList.from_dicts(Deploy, [{"id": "d1", "draft": True}, {"id": "d2", "draft": False}, {"id": "d3"}])
+    assert deploys.column("draft").typecode == "b"
+    assert [row.draft for row in deploys] == [True, False, None]
+    assert deploys.null_mask("locked") == bytearray(3)
+
+def test_indexing_and_slicing():
+    files = ColumnarList.from_dicts(File, FILES)
+    assert isinstance(files[0], Row)
+    assert files[-1].id == "f3"
+    assert files[-3].id == "f1"
+    with pytest.raises(IndexError):
+        files[3]
+    with pytest.raises(IndexError):
+        files[-4]
+    tail = files[1:]
+    assert isinstance(tail, ColumnarList) and len(tail) == 2
+    assert [(row.id, row.size) for row in tail] == [("f2", None), ("f3", 30)]
+    assert tail.null_mask("size") == bytearray([0, 1])
+    assert [row.id for row in files[::-2]] == ["f3", "f1"]
+    with pytest.raises(AttributeError):
+        files[0].missing
+
+@pytest.mark.parametrize("model", _models(), ids=lambda model: model.__name__)
+def test_fields_follow_the_constructor(model):
+    # Row.to_model passes the columns positionally
+    assert list(inspect.signature(model.__init__).parameters)[1:] == [attr for attr, _, _, _ in model._fields]
+
+def test_rows_convert_to_models():
+    files = ColumnarList.from_dicts(File, FILES)
+    models = files.to_models()
+    assert all(type(model) is File for model in models)
+    assert [model.to_dict() for model in models] == [File.from_dict(item).to_dict() for item in FILES]
+
+def test_invalid_item_is_rejected():
+    with pytest.raises(AssertionError):
+        ColumnarList.from_dicts(File, [{"id": 1}])
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    arrays = ColumnarList.from_dicts(Deploy, [{"id": "d1", "draft": True, "review_id": 1.5}, {"id": "d2", "draft": False}]).to_numpy()
+    assert arrays["draft"].dtype == bool and arrays["draft"].tolist() == [True, False]
+    assert isinstance(arrays["review_id"], numpy.ma.MaskedArray)
+    assert arrays["review_id"].tolist() == [1.5, None]
+    assert arrays["id"].dtype == object and list(arrays["id"]) == ["d1", "d2"]
+    assert ColumnarList.from_dicts(File, []).to_numpy()["size"].shape == (0,)
+
+def test_client_returns_columns(api):
+    sites = Netlify("token", base_url=api.base_url, decode="columns").list_sites()
+    assert isinstance(sites, ColumnarList)
+    assert [row.name for row in sites] == ["site s1", "site s2"]
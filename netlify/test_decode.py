@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from .main import Netlify
+from .columnar import ColumnarList
+from .conftest import PAGE_SIZE
+from .custom_types import Site
+
+def _client(api) -> Netlify:
+    return Netlify("token", base_url=api.base_url)
+
+def test_with_decode_shares_the_session_only(api):
+    client = _client(api)
+    raw = client.with_decode("bytes")
+    assert raw.session is client.session
+    assert (client.decode, raw.decode) == ("models", "bytes")
+    with pytest.raises(ValueError):
+        client.with_decode("xml")
+
+@pytest.mark.parametrize("decode, expected", [
+    ("models", lambda site: isinstance(site, Site) and site.name == "site s1"),
+    ("dicts", lambda site: site == {"id": "s1", "name": "site s1"}),
+    ("bytes", lambda site: isinstance(site, bytes) and json.loads(site) == {"id": "s1", "name": "site s1"}),
+    # a single resource has no columns to pack
+    ("columns", lambda site: isinstance(site, Site) and site.name == "site s1"),
+])
+def test_single_result(api, decode, expected):
+    assert expected(_client(api).with_decode(decode).get_site("s1"))
+
+@pytest.mark.parametrize("decode, expected", [
+    ("models", lambda sites: [site.id for site in sites] == ["s1", "s2"]),
+    ("dicts", lambda sites: [site["id"] for site in sites] == ["s1", "s2"]),
+    ("bytes", lambda sites: [site["id"] for site in json.loads(sites)] == ["s1", "s2"]),
+    ("columns", lambda sites: isinstance(sites, ColumnarList) and sites.column("id") == ["s1", "s2"]),
+])
+def test_list_result(api, decode, expected):
+    assert expected(_client(api).with_decode(decode).list_sites())
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_yields_items_per_mode(api, prefetch):
+    api.pages = 3
+    client = _client(api)
+    ids = [f"p{page}-{i}" for page in range(1, 4) for i in range(PAGE_SIZE)]
+    assert [site.id for site in client.iter_sites(prefetch=prefetch)] == ids
+    assert [site["id"] for site in client.with_decode("dicts").iter_sites(prefetch=prefetch)] == ids
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_yields_one_body_per_page_as_bytes(api, prefetch):
+    api.pages = 3
+    bodies = list(_client(api).with_decode("bytes").iter_sites(prefetch=prefetch))
+    assert all(isinstance(body, bytes) for body in bodies)
+    assert [[site["id"] for site in json.loads(body)] for body in bodies] == [[f"p{page}-{i}" for i in range(PAGE_SIZE)] for page in range(1, 4)]
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_yields_one_columnar_list_per_page(api, prefetch):
+    api.pages = 3
+    pages = list(_client(api).with_decode("columns").iter_sites(prefetch=prefetch))
+    assert [type(page) for page in pages] == [ColumnarList] * 3
+    assert [page.column("name") for page in pages] == [[f"page {page}"] * PAGE_SIZE for page in range(1, 4)]
+
+def test_async_with_decode(api):
+    pytest.importorskip("httpx")
+    import asyncio
+    from .async_main import AsyncNetlify
+    api.pages = 2
+
+    async def read() -> tuple:
+        async with AsyncNetlify("token", base_url=api.base_url) as client:
+            raw = client.with_decode("bytes")
+            return await raw.get_site("s1"), [body async for body in raw.iter_sites()], await client.get_site("s1")
+
+    site, bodies, model = asyncio.run(read())
+    assert json.loads(site)["id"] == "s1"
+    assert len(bodies) == 2 and all(isinstance(body, bytes) for body in bodies)
+    assert isinstance(model, Site)
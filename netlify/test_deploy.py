@@ -0,0 +1,241 @@
+import os
+import json
+import types
+import typing
+import hashlib
+
+import pytest
+
+from . import deploy
+from .main import Netlify, RequestError
+from .custom_types import Deploy
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+class _FakeClient:
+    """ Serves each deploy's states in order, one per observation, repeating the last. """
+    def __init__(self, clock: _Clock, states: dict, sites: dict, unlisted: tuple = ()):
+        self.clock = clock
+        self.states = {deploy_id: list(sequence) for deploy_id, sequence in states.items()}
+        self.sites = sites
+        self.unlisted = set(unlisted)
+        self.calls = [] #type: list[tuple[float, str, str]]
+
+    def with_decode(self, decode: str) -> "_FakeClient":
+        return self
+
+    def _observe(self, deploy_id: str) -> Deploy:
+        sequence = self.states[deploy_id]
+        state = sequence.pop(0) if len(sequence) > 1 else sequence[0]
+        return Deploy.from_dict({"id": deploy_id, "site_id": self.sites[deploy_id], "state": state})
+
+    def get_deploy(self, deploy_id: str) -> Deploy:
+        self.calls.append((self.clock.now, "get_deploy", deploy_id))
+        return self._observe(deploy_id)
+
+    def list_site_deploys(self, site_id: str, per_page: typing.Optional[int] = None) -> list:
+        self.calls.append((self.clock.now, "list_site_deploys", site_id))
+        return [self._observe(deploy_id) for deploy_id, site in self.sites.items() if site == site_id and deploy_id not in self.unlisted]
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(deploy, "time", clock)
+    return clock
+
+def _wait(client: _FakeClient, deploy_ids: list, **kwargs) -> dict:
+    kwargs.setdefault("jitter", 0)
+    kwargs.setdefault("backoff", 2)
+    return deploy.wait_for_deploys(typing.cast(typing.Any, client), deploy_ids, **kwargs)
+
+def test_backoff_resets_when_the_state_changes(clock):
+    client = _FakeClient(clock, {"a": ["new", "new", "new", "building", "building", "ready"]}, {"a": "s"})
+    assert _wait(client, ["a"])["a"].state == "ready"
+    assert [at for at, _, _ in client.calls] == [0, 1, 3, 7, 8, 10]
+
+def test_interval_is_capped(clock):
+    client = _FakeClient(clock, {"a": ["new"] * 5 + ["ready"]}, {"a": "s"})
+    _wait(client, ["a"], max_interval=3)
+    assert [at for at, _, _ in client.calls] == [0, 1, 3, 6, 9, 12]
+
+def test_deploys_of_one_site_are_polled_together(clock):
+    client = _FakeClient(clock, {"a": ["building", "building", "ready"], "b": ["building", "building", "ready"], "c": ["building", "ready"]}, {"a": "s", "b": "s", "c": "t"})
+    finished = _wait(client, ["a", "b", "c"])
+    assert sorted(finished) == ["a", "b", "c"]
+    assert client.calls == [
+        (0, "get_deploy", "a"), (0, "get_deploy", "b"), (0, "get_deploy", "c"),
+        (1, "list_site_deploys", "s"), (1, "get_deploy", "c"),
+        (3, "list_site_deploys", "s"),
+    ]
+
+def test_deploys_missing_from_the_listing_are_fetched(clock):
+    client = _FakeClient(clock, {"a": ["building", "ready"], "b": ["building", "ready"]}, {"a": "s", "b": "s"}, unlisted=("b",))
+    assert sorted(_wait(client, ["a", "b"])) == ["a", "b"]
+    assert client.calls[2:] == [(1, "list_site_deploys", "s"), (1, "get_deploy", "b")]
+
+def test_pending_deploys_time_out(clock):
+    client = _FakeClient(clock, {"a": ["building"], "b": ["ready"]}, {"a": "s", "b": "t"})
+    with pytest.raises(TimeoutError, match="1 deploy"):
+        _wait(client, ["a", "b"], timeout=20)
+    assert clock.now == 20
+
+def test_transitions_are_reported_in_order(clock):
+    transitions = []
+    client = _FakeClient(clock, {"a": ["new", "building", "building", "error"]}, {"a": "s"})
+    deploy.wait_for_deploy(typing.cast(typing.Any, client), "a", on_transition=lambda d, old, new: transitions.append((d.id, old, new)), jitter=0)
+    assert transitions == [("a", None, "new"), ("a", "new", "building"), ("a", "building", "error")]
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+@pytest.fixture
+def site_dir(tmp_path):
+    publish = tmp_path / "publish"
+    (publish / "docs").mkdir(parents=True)
+    (publish / "index.html").write_bytes(b"same")
+    (publish / "docs" / "copy.html").write_bytes(b"same")
+    (publish / "app.js").write_bytes(b"unique")
+    (publish / ".env").write_bytes(b"secret")
+    functions = tmp_path / "functions"
+    functions.mkdir()
+    (functions / "hello.zip").write_bytes(b"zip")
+    return publish, functions
+
+def test_each_required_digest_is_uploaded_once(api, site_dir):
+    publish, functions = site_dir
+    api.required = [_sha1(b"same"), _sha1(b"unique")]
+    api.required_functions = [hashlib.sha256(b"zip").hexdigest()]
+    progress = []
+    client = Netlify("token", base_url=api.base_url)
+    deploy.deploy_directory(client, "s1", str(publish), str(functions), progress=lambda done, total, label: progress.append((done, total, label)))
+    assert api.deploy_files["files"] == {"/index.html": _sha1(b"same"), "/docs/copy.html": _sha1(b"same"), "/app.js": _sha1(b"unique")}
+    uploads = dict(api.uploads)
+    assert uploads.pop("/deploys/d1/functions/hello") == b"zip"
+    assert uploads.pop("/deploys/d1/files/app.js") == b"unique"
+    (shared, body), = uploads.items()
+    assert body == b"same"
+    assert shared in ("/deploys/d1/files/index.html", "/deploys/d1/files/docs/copy.html")
+    assert [(done, total) for done, total, _ in progress] == [(1, 3), (2, 3), (3, 3)]
+    assert {label for _, _, label in progress} == {"/app.js", "hello", shared[len("/deploys/d1/files"):]}
+
+def test_nothing_is_uploaded_when_nothing_is_required(api, site_dir):
+    publish, _ = site_dir
+    deploy.deploy_directory(Netlify("token", base_url=api.base_url), "s1", str(publish))
+    assert api.uploads == []
+
+def _upload_one(api, publish, **kwargs) -> int:
+    client = Netlify("token", base_url=api.base_url)
+    manifest = deploy.build_manifest(str(publish))
+    required = Deploy.from_dict({"id": "d1", "required": [_sha1(b"unique")]})
+    return deploy.upload_required_files(client, required, manifest, backoff=0, **kwargs)
+
+def test_dropped_connection_is_retried(api, site_dir):
+    api.script.append((0, {}))
+    assert _upload_one(api, site_dir[0], retries=1) == 1
+    assert api.uploads == [("/deploys/d1/files/app.js", b"unique")]
+    assert api.count("PUT", "/deploys/d1/files/app.js") == 2
+
+def test_rejected_upload_is_not_retried(api, site_dir):
+    api.script.append((422, {}))
+    with pytest.raises(RequestError):
+        _upload_one(api, site_dir[0], retries=3)
+    assert api.count("PUT", "/deploys/d1/files/app.js") == 1
+
+def _stat(size: int = 10, mtime_ns: int = 1000, ino: int = 7) -> os.stat_result:
+    # DigestCache only reads these three fields
+    return typing.cast(os.stat_result, types.SimpleNamespace(st_size=size, st_mtime_ns=mtime_ns, st_ino=ino))
+
+def test_digest_is_reused_across_runs(tmp_path):
+    path = str(tmp_path / "digests.json")
+    cache = deploy.DigestCache(path)
+    cache.put("a.html", _stat(), "sha1", "digest-a")
+    cache.save()
+    assert deploy.DigestCache(path).get("a.html", _stat(), "sha1") == "digest-a"
+    assert deploy.DigestCache(path).get("a.html", _stat(), "sha256") is None
+
+@pytest.mark.parametrize("changed", [{"size": 11}, {"mtime_ns": 1001}, {"ino": 8}])
+def test_changed_file_is_rehashed(tmp_path, changed):
+    cache = deploy.DigestCache(str(tmp_path / "digests.json"))
+    cache.put("a.html", _stat(), "sha1", "digest-a")
+    assert cache.get("a.html", _stat(**changed), "sha1") is None
+
+def test_save_drops_files_not_looked_up(tmp_path):
+    path = str(tmp_path / "digests.json")
+    first = deploy.DigestCache(path)
+    first.put("a.html", _stat(), "sha1", "digest-a")
+    first.put("b.html", _stat(), "sha1", "digest-b")
+    first.save()
+    second = deploy.DigestCache(path)
+    second.get("a.html", _stat(), "sha1")
+    second.save()
+    third = deploy.DigestCache(path)
+    assert third.get("a.html", _stat(), "sha1") == "digest-a"
+    assert third.get("b.html", _stat(), "sha1") is None
+
+@pytest.mark.parametrize("content", ["{not json", "[]", json.dumps({"version": 0, "entries": {"x": [1, 2, 3, "d"]}}), json.dumps({"version": deploy.DigestCache.VERSION})])
+def test_unusable_cache_file_is_ignored(tmp_path, content):
+    path = tmp_path / "digests.json"
+    path.write_text(content)
+    cache = deploy.DigestCache(str(path))
+    assert cache.get("x", _stat(size=1, mtime_ns=2, ino=3), "sha1") is None
+    cache.save()
+    assert json.loads(path.read_text()) == {"version": deploy.DigestCache.VERSION, "entries": {}}
+
+def test_only_changed_files_are_hashed_again(tmp_path, site_dir, monkeypatch):
+    publish, _ = site_dir
+    cache_path = str(tmp_path / "digests.json")
+    hashed = []
+    hash_files = deploy.hash_files
+
+    def counting(tasks: list, *args: typing.Any) -> list:
+        hashed.append(sorted(os.path.basename(path) for path, _, _ in tasks))
+        return hash_files(tasks, *args)
+
+    monkeypatch.setattr(deploy, "hash_files", counting)
+    deploy.build_manifest(str(publish), cache_path=cache_path)
+    (publish / "app.js").write_bytes(b"changed")
+    manifest = deploy.build_manifest(str(publish), cache_path=cache_path)
+    assert hashed == [["app.js", "copy.html", "index.html"], ["app.js"]]
+    assert manifest.files["/app.js"] == _sha1(b"changed")
+
+@pytest.fixture
+def hash_tasks(tmp_path) -> list:
+    contents = [b"", b"small", os.urandom(4096)] + [str(i).encode() * 100 for i in range(300)]
+    contents += [os.urandom(deploy.MMAP_THRESHOLD), os.urandom(deploy.MMAP_THRESHOLD + 12345)]
+    tasks = []
+    for i, data in enumerate(contents):
+        path = tmp_path / f"f{i}"
+        path.write_bytes(data)
+        tasks.append((str(path), "sha1" if i % 2 else "sha256", len(data)))
+    return tasks
+
+def _expected_digests(tasks: list) -> list:
+    digests = []
+    for path, algorithm, _ in tasks:
+        with open(path, "rb") as f:
+            digests.append(hashlib.new(algorithm, f.read()).hexdigest())
+    return digests
+
+@pytest.mark.parametrize("workers, processes", [(1, False), (4, False), (2, True)], ids=["serial", "threads", "processes"])
+def test_every_hashing_path_gives_the_same_digests(hash_tasks, workers, processes):
+    assert deploy.hash_files(hash_tasks, workers, processes) == _expected_digests(hash_tasks)
+
+def test_large_files_are_hashed_through_mmap(hash_tasks, monkeypatch):
+    mapped = []
+    real_mmap = deploy.mmap.mmap
+
+    def counting(fileno: int, length: int, **kwargs: typing.Any) -> typing.Any:
+        mapped.append(fileno)
+        return real_mmap(fileno, length, **kwargs)
+
+    monkeypatch.setattr(deploy, "mmap", types.SimpleNamespace(mmap=counting, ACCESS_READ=deploy.mmap.ACCESS_READ))
+    assert deploy.hash_files(hash_tasks, 1) == _expected_digests(hash_tasks)
+    assert len(mapped) == 2
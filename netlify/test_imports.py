@@ -0,0 +1,13 @@
+import sys
+import subprocess
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+def test_models_are_loaded_on_first_use():
+    assert _run("import netlify.main, sys; print('netlify._models' in sys.modules)") == "False"
+    assert _run("import netlify.main, sys; netlify.main.Site; print('netlify._models' in sys.modules)") == "True"
+
+def test_star_import_exports_the_models():
+    exported = _run("from netlify.main import *; print(' '.join(dir()))").split()
+    assert {"Netlify", "RequestError", "Site", "Deploy", "DeployFiles"} <= set(exported)
@@ -0,0 +1,70 @@
+import pytest
+
+from .main import Netlify, RequestError
+from .cache import ResponseCache
+from .instrument import CallEvent, LatencyHistograms
+
+def test_event_describes_the_call(api):
+    events = []
+    client = Netlify("token", base_url=api.base_url, observers=[events.append])
+    client.get_site("s1")
+    event, = events
+    assert (event.operation, event.method, event.endpoint, event.status, event.error) == ("get_site", "GET", "/sites/{site_id}", 200, None)
+    assert event.bytes_in > 0
+    assert {"server", "download", "decode"} <= set(event.timings)
+    assert event.duration >= sum(event.timings.values()) * 0.99
+
+def test_failed_call_is_reported_with_its_error(api):
+    events = []
+    client = Netlify("token", base_url=api.base_url, observers=[events.append])
+    with pytest.raises(RequestError) as raised:
+        client.get_site("missing")
+    assert events[0].status == 404
+    assert events[0].error is raised.value
+
+def test_cache_outcome_is_reported(api):
+    events = []
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60), observers=[events.append])
+    client.get_site("s1")
+    client.get_site("s1")
+    assert [event.cache for event in events] == ["miss", "hit"]
+
+def test_each_page_is_reported_to_observers(api):
+    api.pages = 3
+    events = []
+    client = Netlify("token", base_url=api.base_url, observers=[events.append])
+    list(client.iter_sites(prefetch=1))
+    assert [(event.operation, event.endpoint, event.status) for event in events] == [("list_sites", "/sites", 200)] * 3
+
+def _event(operation: str, duration: float, error: bool = False) -> CallEvent:
+    event = CallEvent(operation, "GET")
+    event.duration = duration
+    event.timings = {"server": duration}
+    event.error = RuntimeError() if error else None
+    return event
+
+def test_histograms_aggregate_per_endpoint():
+    histograms = LatencyHistograms()
+    for i in range(1, 101):
+        histograms(_event("get_site", i / 1000, error=i > 98))
+    histograms(_event("list_sites", 0.5))
+    stats = histograms.snapshot()
+    site = stats["GET /sites/{site_id}"]
+    assert (site["count"], site["errors"], site["max"]) == (100, 2, 0.1)
+    # quantiles are bucket upper bounds, within 9% of the true value
+    assert 0.050 <= site["p50"] <= 0.050 * 1.09
+    assert 0.099 <= site["p99"] <= 0.1
+    assert site["phases"]["server"] == pytest.approx(site["mean"])
+    assert stats["GET /sites"]["count"] == 1
+
+def test_prometheus_exposition():
+    histograms = LatencyHistograms(quantiles=(0.5,))
+    histograms(_event("get_site", 0.25))
+    assert histograms.prometheus("latency").splitlines() == [
+        "# TYPE latency summary",
+        'latency{method="GET",endpoint="/sites/{site_id}",quantile="0.5"} 0.250000',
+        'latency_sum{method="GET",endpoint="/sites/{site_id}"} 0.250000',
+        'latency_count{method="GET",endpoint="/sites/{site_id}"} 1',
+    ]
+    histograms.reset()
+    assert histograms.snapshot() == {}
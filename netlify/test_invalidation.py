@@ -0,0 +1,98 @@
+import re
+
+import pytest
+
+from .main import Netlify, RequestError
+from .cache import ResponseCache
+from .store import SQLiteStore
+from .routes import ROUTES
+from .invalidation import INVALIDATES, UPDATES
+from .custom_types import Site
+
+@pytest.mark.parametrize("table", [INVALIDATES, UPDATES], ids=["invalidates", "updates"])
+def test_rules_name_get_operations_and_their_path_parameters(table):
+    for operation, rules in table.items():
+        assert ROUTES[operation][0] != "GET", operation
+        for read, *names in rules:
+            if read == "*":
+                continue
+            method, template = ROUTES[read]
+            assert method == "GET", (operation, read)
+            assert set(names) <= set(re.findall(r"\{(\w+)\}", template)), (operation, read)
+
+def _zone_cache() -> ResponseCache:
+    cache = ResponseCache(ttl=60)
+    for zone_id in ("z1", "z2"):
+        cache.store(cache.key(f"/dns_zones/{zone_id}", None, "token"), "get_dns_zone", {"zone_id": zone_id}, b"{}", {})
+    return cache
+
+def test_created_dns_record_evicts_its_zone():
+    # a zone embeds its records, so a new record makes the cached zone stale
+    cache = _zone_cache()
+    cache.write_through("create_dns_record", {"zone_id": "z1"}, b"{}", {}, None, None, "token")
+    assert cache.get(cache.key("/dns_zones/z1", None, "token")) is None
+    assert cache.get(cache.key("/dns_zones/z2", None, "token")) is not None
+
+def test_failed_dns_record_creation_evicts_its_zone():
+    cache = _zone_cache()
+    cache.invalidate("create_dns_record", {"zone_id": "z1"})
+    assert cache.get(cache.key("/dns_zones/z1", None, "token")) is None
+    assert len(cache) == 1
+
+def test_update_replaces_cached_read_in_place(api):
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60))
+    client.get_site("s1")
+    updated = client.update_site(Site.from_dict({"name": "renamed"}), "s1")
+    site = client.get_site("s1")
+    assert site is updated
+    assert site.name == "renamed"
+    assert api.count("GET", "/sites/s1") == 1
+
+def test_update_evicts_lists(api):
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60))
+    client.list_sites()
+    client.update_site(Site.from_dict({"name": "renamed"}), "s1")
+    assert [site.name for site in client.list_sites() if site.id == "s1"] == ["renamed"]
+    assert api.count("GET", "/sites") == 2
+
+def test_delete_evicts_every_read_of_the_site(api):
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60))
+    client.get_site("s1")
+    client.get_site("s2")
+    client.delete_site("s2")
+    with pytest.raises(RequestError):
+        client.get_site("s2")
+    client.get_site("s1")
+    assert api.count("GET", "/sites/s2") == 2
+    assert api.count("GET", "/sites/s1") == 1
+
+def test_failed_write_evicts(api):
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60))
+    client.get_site("s1")
+    api.fail_writes = 422
+    with pytest.raises(RequestError):
+        client.update_site(Site.from_dict({"name": "renamed"}), "s1")
+    client.get_site("s1")
+    assert api.count("GET", "/sites/s1") == 2
+
+def test_write_evicts_other_tokens_reads(api):
+    cache = ResponseCache(ttl=60)
+    writer = Netlify("token-a", base_url=api.base_url, cache=cache)
+    reader = Netlify("token-b", base_url=api.base_url, cache=cache)
+    reader.get_site("s1")
+    updated = writer.update_site(Site.from_dict({"name": "renamed"}), "s1")
+    site = reader.get_site("s1")
+    # the reader is never handed the writer's response, it reads the site again with its own token
+    assert site is not updated
+    assert site.name == "renamed"
+    assert api.count("GET", "/sites/s1") == 2
+
+def test_other_tokens_reads_are_evicted_on_disk(api, tmp_path):
+    store = SQLiteStore(tmp_path / "responses.db")
+    cache = ResponseCache(ttl=60, backend=store)
+    Netlify("token-b", base_url=api.base_url, cache=cache).get_site("s1")
+    Netlify("token-a", base_url=api.base_url, cache=cache).update_site(Site.from_dict({"name": "renamed"}), "s1")
+    restarted = Netlify("token-b", base_url=api.base_url, cache=ResponseCache(ttl=60, backend=store))
+    assert restarted.get_site("s1").name == "renamed"
+    assert api.count("GET", "/sites/s1") == 2
+    store.close()
@@ -0,0 +1,68 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from .main import Netlify
+from .lazy import lazy_class, lazy_from_dict
+from .custom_types import DNSRecord, DNSZone, Deploy, RepoInfo, Site
+
+SITE = {"id": "s1", "name": "site", "build_settings": {"repo_branch": "main"}, "published_deploy": {"id": "d1", "state": "ready"}}
+
+def test_field_is_decoded_on_first_access_and_kept_in_its_slot():
+    site = lazy_from_dict(Site, dict(SITE))
+    with pytest.raises(AttributeError):
+        Site.__dict__["name"].__get__(site, Site)
+    assert site.name == "site"
+    assert Site.__dict__["name"].__get__(site, Site) == "site"
+    site._raw["name"] = "changed"
+    assert site.name == "site"
+
+def test_nested_models_and_lists_are_lazy_too():
+    site = lazy_from_dict(Site, dict(SITE))
+    assert type(site.build_settings) is lazy_class(RepoInfo)
+    assert site.build_settings.repo_branch == "main"
+    assert site.published_deploy.state == "ready"
+    zone = lazy_from_dict(DNSZone, {"id": "z1", "records": [{"id": "r1", "hostname": "a.example"}, {"id": "r2"}]})
+    assert [type(record) for record in zone.records] == [lazy_class(DNSRecord)] * 2
+    assert [record.id for record in zone.records] == ["r1", "r2"]
+    assert lazy_from_dict(DNSZone, {"id": "z2"}).records is None
+
+def test_lazy_instance_is_a_model():
+    site = lazy_from_dict(Site, dict(SITE))
+    assert isinstance(site, Site)
+    assert isinstance(site.published_deploy, Deploy)
+    assert lazy_class(Site) is lazy_class(Site)
+
+def test_setting_a_field_skips_decoding():
+    site = lazy_from_dict(Site, dict(SITE))
+    site.name = "renamed"
+    assert site.name == "renamed"
+
+def test_to_dict_matches_the_eager_model():
+    site = lazy_from_dict(Site, dict(SITE))
+    assert site.to_dict() == Site.from_dict(dict(SITE)).to_dict()
+    assert site.to_dict()["published_deploy"]["id"] == "d1"
+
+def test_pickled_instance_loads_in_a_fresh_process():
+    site = lazy_from_dict(Site, dict(SITE))
+    site.name
+    data = pickle.dumps(site)
+    assert pickle.loads(data).to_dict() == site.to_dict()
+    code = "import pickle, sys; site = pickle.loads(sys.stdin.buffer.read()); print(type(site).__name__, site.name, site.build_settings.repo_branch)"
+    output = subprocess.run([sys.executable, "-c", code], input=data, capture_output=True, check=True).stdout
+    assert output.decode().split() == ["LazySite", "site", "main"]
+
+def test_invalid_field_fails_on_access():
+    site = lazy_from_dict(Site, {"id": "s1", "name": 42})
+    assert site.id == "s1"
+    with pytest.raises(AssertionError):
+        site.name
+
+def test_client_returns_lazy_models(api):
+    client = Netlify("token", base_url=api.base_url, lazy=True)
+    site = client.get_site("s1")
+    assert type(site) is lazy_class(Site)
+    assert site.name == "site s1"
+    assert [type(site) for site in client.list_sites()] == [lazy_class(Site)] * 2
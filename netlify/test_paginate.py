@@ -0,0 +1,53 @@
+import pytest
+
+from .main import Netlify
+from .conftest import PAGE_SIZE
+
+def _expected(pages: int) -> list:
+    return [f"p{page}-{i}" for page in range(1, pages + 1) for i in range(PAGE_SIZE)]
+
+def _pages_requested(api) -> list:
+    return sorted(int(query.get("page", 1)) for method, path, query in api.requests if path == "/sites")
+
+def test_iter_follows_every_page(api):
+    api.pages = 4
+    client = Netlify("token", base_url=api.base_url)
+    assert [site.id for site in client.iter_sites()] == _expected(4)
+
+@pytest.mark.parametrize("prefetch", [1, 2, 8])
+def test_prefetch_keeps_page_order(api, prefetch):
+    api.pages = 5
+    api.delay = 0.01
+    client = Netlify("token", base_url=api.base_url)
+    assert [site.id for site in client.iter_sites(prefetch=prefetch)] == _expected(5)
+    assert _pages_requested(api) == [1, 2, 3, 4, 5]
+
+def test_closing_early_stops_prefetching(api):
+    api.pages = 10
+    client = Netlify("token", base_url=api.base_url)
+    sites = client.iter_sites(prefetch=2)
+    taken = [next(sites).id for _ in range(PAGE_SIZE + 1)]
+    sites.close()
+    assert taken == _expected(2)[:PAGE_SIZE + 1]
+    # pages 1 and 2 were consumed and at most two more were in flight
+    assert max(_pages_requested(api)) <= 4
+
+def test_single_page_is_not_prefetched(api):
+    client = Netlify("token", base_url=api.base_url)
+    assert [site.id for site in client.iter_sites(prefetch=4)] == ["s1", "s2"]
+    assert _pages_requested(api) == [1]
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_async_prefetch_keeps_page_order(api, prefetch):
+    pytest.importorskip("httpx")
+    import asyncio
+    from .async_main import AsyncNetlify
+    api.pages = 5
+    api.delay = 0.01
+
+    async def collect() -> list:
+        async with AsyncNetlify("token", base_url=api.base_url) as client:
+            return [site.id async for site in client.iter_sites(prefetch=prefetch)]
+
+    assert asyncio.run(collect()) == _expected(5)
+    assert _pages_requested(api) == [1, 2, 3, 4, 5]
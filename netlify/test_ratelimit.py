@@ -0,0 +1,103 @@
+import io
+import typing
+import time
+from email.utils import formatdate
+
+import pytest
+
+from .main import Netlify, RequestError
+from .custom_types import Site
+from .ratelimit import RateLimiter, should_retry
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self._source = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        return self._source.readinto(buffer)
+
+def _client(api, **kwargs) -> Netlify:
+    # a fast back-off so retries without Retry-After do not slow the tests down
+    return Netlify("token", base_url=api.base_url, rate_limiter=RateLimiter(backoff=0.01), **kwargs)
+
+@pytest.mark.parametrize("method, status, retried", [
+    ("GET", 429, True), ("POST", 429, True), ("PUT", 503, True), ("DELETE", 500, True),
+    ("POST", 503, False), ("PATCH", 502, False), ("GET", 404, False),
+])
+def test_should_retry(method, status, retried):
+    assert should_retry(method, status) is retried
+
+def test_retry_after_is_honoured_for_posts(api):
+    api.script.append((429, {"Retry-After": "0.3"}))
+    events = []
+    client = _client(api, observers=[events.append])
+    start = time.perf_counter()
+    client.create_site(Site.from_dict({"name": "new"}))
+    assert time.perf_counter() - start >= 0.3
+    assert api.count("POST", "/sites") == 2
+    assert events[0].retries == 1
+
+def test_retry_after_http_date():
+    limiter = RateLimiter()
+    delay = limiter.retry_delay({"Retry-After": formatdate(time.time() + 30, usegmt=True)}, 0)
+    assert 28 <= delay <= 30
+
+@pytest.mark.parametrize("call", ["create_site", "update_site"])
+def test_server_errors_are_not_retried_for_non_idempotent_writes(api, call):
+    api.script.append((503, {}))
+    client = _client(api)
+    with pytest.raises(RequestError) as raised:
+        if call == "create_site":
+            client.create_site(Site.from_dict({"name": "new"}))
+        else:
+            client.update_site(Site.from_dict({"name": "renamed"}), "s1")
+    assert raised.value.status_code == 503
+    assert len(api.requests) == 1
+
+def test_upload_body_is_rewound_before_a_retry(api):
+    api.script.append((503, {}))
+    source = io.BytesIO(b"head" + b"x" * 100000)
+    source.seek(4)
+    _client(api).upload_deploy_file(source, "d1", "index.html")
+    assert [body for _, body in api.uploads] == [b"x" * 100000]
+    assert api.count("PUT", "/deploys/d1/files/index.html") == 2
+
+def test_unseekable_body_is_not_retried(api):
+    api.script.append((503, {}))
+    with pytest.raises(RequestError):
+        _client(api).upload_deploy_file(_Unseekable(b"data"), "d1", "index.html", size=4)
+    assert api.count("PUT", "/deploys/d1/files/index.html") == 1
+
+def test_gives_up_after_max_retries(api):
+    api.script.extend([(503, {})] * 5)
+    client = _client(api, max_retries=2)
+    with pytest.raises(RequestError) as raised:
+        client.get_site("s1")
+    assert raised.value.status_code == 503
+    assert api.count("GET", "/sites/s1") == 3
+
+def test_remaining_quota_is_spread_over_the_window():
+    limiter = RateLimiter(burst=10)
+    limiter.update(200, {"X-RateLimit-Limit": "500", "X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(time.time() + 10)})
+    assert limiter.limit == 500
+    # a burst of the two remaining requests, then one every five seconds
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(5, rel=0.05)
+
+def test_exhausted_quota_blocks_until_reset():
+    limiter = RateLimiter()
+    limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 20)})
+    assert limiter.reserve() == pytest.approx(20, rel=0.05)
+
+def test_client_feeds_rate_limit_headers_to_the_limiter(api):
+    api.script.append((429, {"X-RateLimit-Limit": "500", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 1), "Retry-After": "0"}))
+    client = _client(api)
+    start = time.perf_counter()
+    client.get_site("s1")
+    assert client.rate_limiter.limit == 500
+    # the empty quota holds the retry back until the window resets
+    assert time.perf_counter() - start >= 0.9
@@ -0,0 +1,30 @@
+import pytest
+
+from .routes import ROUTES, compile_routes
+
+BASE_URL = "https://api.netlify.com/api/v1"
+
+def test_base_path_is_kept():
+    routes = compile_routes(BASE_URL + "/")
+    assert routes["list_sites"].url() == BASE_URL + "/sites"
+    assert routes["get_site"].url("s") == BASE_URL + "/sites/s"
+
+@pytest.mark.parametrize("operation,args,expected", [
+    ("get_site_file_by_path_name", ("s", "css/main.css"), "/sites/s/files/css/main.css"),
+    ("upload_deploy_file", ("d", "assets/js/app.js"), "/deploys/d/files/assets/js/app.js"),
+    ("upload_deploy_function", ("d", "a/b"), "/deploys/d/functions/a%2Fb"),
+    ("get_env_var", ("acc", "A/B"), "/accounts/acc/env/A%2FB"),
+    ("get_site", ("a b?#",), "/sites/a%20b%3F%23"),
+])
+def test_path_argument_escaping(operation, args, expected):
+    assert compile_routes(BASE_URL)[operation].url(*args) == BASE_URL + expected
+
+@pytest.mark.parametrize("operation", sorted(ROUTES))
+def test_nested_path_per_route(operation):
+    route = compile_routes(BASE_URL)[operation]
+    url = route.url(*["x/y" for _ in route.names])
+    expected = route.template
+    for name in route.names:
+        value = "x/y" if name in ("path", "file_path") else "x%2Fy"
+        expected = expected.replace("{" + name + "}", value)
+    assert url == BASE_URL + expected
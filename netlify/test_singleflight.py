@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import pytest
+
+from .main import Netlify, RequestError
+from .singleflight import SingleFlight, AsyncSingleFlight
+
+def test_key_is_released_once_the_call_finishes():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+    assert flight.shared == 0
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    async def main() -> tuple:
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        return await second, flight.shared
+
+    assert asyncio.run(main()) == ("done", 1)
+
+def test_concurrent_gets_are_coalesced(api):
+    api.delay = 0.2
+    client = Netlify("token", base_url=api.base_url, coalesce=True, pool_maxsize=20)
+    barrier = threading.Barrier(20)
+    results = []
+
+    def read() -> None:
+        barrier.wait()
+        results.append(client.get_site("s1"))
+
+    threads = [threading.Thread(target=read) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 20
+    assert all(result is results[0] for result in results)
+    assert api.count("GET", "/sites/s1") == 1
+
+def test_coalesced_callers_share_the_error(api):
+    api.delay = 0.2
+    client = Netlify("token", base_url=api.base_url, coalesce=True)
+    errors = []
+
+    def read() -> None:
+        try:
+            client.get_site("missing")
+        except RequestError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 5
+    assert api.count("GET", "/sites/missing") == 1
+
+def test_async_gets_are_coalesced(api):
+    pytest.importorskip("httpx")
+    from .async_main import AsyncNetlify
+    api.delay = 0.2
+
+    async def read_concurrently() -> list:
+        async with AsyncNetlify("token", base_url=api.base_url, coalesce=True) as client:
+            return await asyncio.gather(*(client.get_site("s1") for _ in range(20)))
+
+    results = asyncio.run(read_concurrently())
+    assert all(result is results[0] for result in results)
+    assert api.count("GET", "/sites/s1") == 1
+
+def test_writes_are_not_coalesced(api):
+    api.delay = 0.2
+    client = Netlify("token", base_url=api.base_url, coalesce=True)
+    threads = [threading.Thread(target=client.delete_site, args=("s1",)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert api.count("DELETE", "/sites/s1") == 3
+    assert client.single_flight.shared == 0
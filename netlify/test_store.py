@@ -0,0 +1,79 @@
+import os
+import stat
+import time
+
+import pytest
+
+from .main import Netlify, RequestError
+from .cache import CacheEntry, ResponseCache
+from .store import SQLiteStore
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(tmp_path / "responses.db")
+    yield store
+    store.close()
+
+def test_entry_round_trips(store):
+    store.save("k", CacheEntry("get_site", {"site_id": "s1"}, b"{}", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", 12.5))
+    entry = store.load("k")
+    assert (entry.operation, entry.params, entry.body, entry.etag, entry.last_modified, entry.stored_at) == ("get_site", {"site_id": "s1"}, b"{}", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", 12.5)
+    assert store.load("missing") is None
+
+def test_matching_selects_by_operation_and_parameters(store):
+    store.save("a", CacheEntry("get_site", {"site_id": "s1"}, b"{}"))
+    store.save("b", CacheEntry("get_site", {"site_id": "s2"}, b"{}"))
+    store.save("c", CacheEntry("list_site_deploys", {"site_id": "s1"}, b"[]"))
+    assert store.matching([("get_site", "site_id")], {"site_id": "s1"}) == ["a"]
+    assert sorted(store.matching([("*", "site_id")], {"site_id": "s1"})) == ["a", "c"]
+    store.delete(["a", "c"])
+    assert store.matching([("*",)], {}) == ["b"]
+
+def test_oldest_rows_are_dropped_past_max_entries(tmp_path):
+    store = SQLiteStore(tmp_path / "responses.db", max_entries=10)
+    for i in range(256):
+        store.save(f"k{i}", CacheEntry("get_site", {}, b"{}", stored_at=float(i)))
+    assert sorted(store.matching([("get_site",)], {}), key=lambda key: int(key[1:])) == [f"k{i}" for i in range(246, 256)]
+    store.close()
+
+def test_restarted_client_is_served_from_disk(api, tmp_path):
+    path = tmp_path / "responses.db"
+    first = SQLiteStore(path)
+    Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60, backend=first)).get_site("s1")
+    first.close()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    store = SQLiteStore(path)
+    client = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60, backend=store))
+    assert client.get_site("s1").name == "site s1"
+    assert api.count("GET", "/sites/s1") == 1
+    store.close()
+
+def test_restarted_client_sees_writes_of_another_process(api, tmp_path):
+    path = tmp_path / "responses.db"
+    reader_store, writer_store = SQLiteStore(path), SQLiteStore(path)
+    reader = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60, backend=reader_store))
+    writer = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60, backend=writer_store))
+    reader.get_site("s2")
+    writer.delete_site("s2")
+    restarted = Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=60, backend=reader_store))
+    with pytest.raises(RequestError):
+        restarted.get_site("s2")
+    reader_store.close()
+    writer_store.close()
+
+def test_stale_entry_is_served_while_revalidating(api, tmp_path):
+    store = SQLiteStore(tmp_path / "responses.db")
+    Netlify("token", base_url=api.base_url, cache=ResponseCache(ttl=0, backend=store)).get_site("s1")
+    api.delay = 0.3
+    cache = ResponseCache(ttl=0, backend=store, stale_while_revalidate=60)
+    client = Netlify("token", base_url=api.base_url, cache=cache)
+    start = time.perf_counter()
+    assert client.get_site("s1").name == "site s1"
+    assert time.perf_counter() - start < api.delay
+    for _ in range(50):
+        if cache.revalidated:
+            break
+        time.sleep(0.05)
+    assert cache.revalidated == 1
+    store.close()
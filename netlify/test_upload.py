@@ -0,0 +1,21 @@
+import io
+
+from .main import _BinaryBody
+
+def test_file_reads_stop_at_declared_size():
+    body = _BinaryBody(io.BytesIO(b"abcdef"), size=3, chunk_size=2)
+    assert len(body) == 3
+    assert list(body) == [b"ab", b"c"]
+    assert body.read() == b""
+
+def test_rewind_restarts_a_capped_file():
+    source = io.BytesIO(b"xxabcdef")
+    source.seek(2)
+    body = _BinaryBody(source, size=4)
+    assert body.read() == b"abcd"
+    assert body.rewind()
+    assert body.read() == b"abcd"
+
+def test_bytes_body_is_capped_at_size():
+    body = _BinaryBody(b"abcdef", size=4, chunk_size=3)
+    assert list(body) == [b"abc", b"d"]